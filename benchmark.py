@@ -0,0 +1,581 @@
+"""
+Suíte de Benchmarks das Estruturas de Dados
+
+Descrição:
+Executa as operações principais de cada estrutura do pacote engine (sem interface gráfica)
+em tamanhos crescentes (10^2 a 10^6 por padrão) e registra, para cada caso e tamanho:
+operações por segundo, latência p50/p99 por operação e pico de memória. O resultado é
+gravado em um relatório JSON estável (chaves ordenadas) que pode ser comparado entre
+execuções, tornando visível qualquer regressão nos caminhos críticos.
+
+Casos Medidos:
+- Fila: enqueue, dequeue, enqueue com capacidade fixa (drop_oldest)
+- Pilha: push, pop
+- Lista Encadeada: insert_end, search, remove
+- Tabela Hash: insert, search, remove (estratégia padrão e cada estratégia de hash,
+  com o ganho sobre sha256 anotado em speedup_vs_sha256)
+- Tabela Hash com endereçamento aberto: insert, search, remove
+- Árvore Binária: insert, search, delete
+- Árvore AVL: insert, search, delete (e carga em lote ou por snapshot binário)
+- Árvore AVL compacta (colunas de array): insert, bulk_load, search, delete
+- Inicialização da interface: importação de main e primeiro desenho da janela, medidos
+  num interpretador novo (registrados como "skipped" quando não há display)
+
+Uso:
+    python benchmark.py
+    python benchmark.py --sizes 100 1000 10000 --cases fila avltree
+    python benchmark.py --output novo.json --compare anterior.json
+    python benchmark.py --cases startup
+
+Observação:
+Casos com custo super-linear são interrompidos automaticamente: quando a projeção do
+próximo tamanho ultrapassa o orçamento (--budget), os tamanhos maiores são registrados
+como "skipped" no relatório.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import engine
+from engine.snapshot import load_snapshot, save_snapshot
+
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+QUERY_SAMPLE = 1000   # Consultas por tamanho nas estruturas de busca linear
+SEED = 12345
+STARTUP_RUNS = 5      # Execuções (interpretadores novos) da medição de inicialização
+SNAPSHOT_DIRECTORY = None  # TemporaryDirectory criado no primeiro caso com snapshot
+
+# Registro de casos: nome -> função de preparação
+BENCHMARKS = {}
+
+def benchmark(name):
+    """
+    Decorador que registra um caso de benchmark
+
+    A função decorada recebe o tamanho n e devolve (operação, argumentos):
+        - argumentos como lista: a operação é chamada uma vez por elemento
+        - argumentos como inteiro: a operação é chamada sem argumentos essa quantidade de vezes
+    Todo o trabalho de preparação (fora da medição) acontece dentro da função.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+def shuffled_keys(n):
+    """Retorna as chaves 0..n-1 em ordem aleatória (determinística)"""
+    keys = list(range(n))
+    random.Random(SEED).shuffle(keys)
+    return keys
+
+def query_keys(n):
+    """Retorna uma amostra de chaves existentes para consultas caras"""
+    return random.Random(SEED + 1).sample(range(n), min(n, QUERY_SAMPLE))
+
+# ================================================================
+# CASOS: FILA E PILHA
+# ================================================================
+
+@benchmark("fila.enqueue")
+def bench_fila_enqueue(n):
+    fila = engine.Fila()
+    return fila.enqueue, list(range(n))
+
+@benchmark("fila.dequeue")
+def bench_fila_dequeue(n):
+    fila = engine.Fila()
+    for i in range(n):
+        fila.enqueue(i)
+    return fila.dequeue, n
+
+@benchmark("fila.enqueue_drop_oldest")
+def bench_fila_enqueue_drop_oldest(n):
+    fila = engine.Fila(capacity=1024, overflow="drop_oldest")
+    return fila.enqueue, list(range(n))
+
+@benchmark("pilha.push")
+def bench_pilha_push(n):
+    pilha = engine.Pilha()
+    return pilha.push, list(range(n))
+
+@benchmark("pilha.pop")
+def bench_pilha_pop(n):
+    pilha = engine.Pilha()
+    for i in range(n):
+        pilha.push(i)
+    return pilha.pop, n
+
+# ================================================================
+# CASOS: LISTA ENCADEADA
+# ================================================================
+
+@benchmark("lista.insert_end")
+def bench_lista_insert_end(n):
+    lista = engine.ListaEncadeada()
+    return lista.insert_end, list(range(n))
+
+@benchmark("lista.search")
+def bench_lista_search(n):
+    lista = engine.ListaEncadeada()
+    for i in range(n):
+        lista.insert_start(i)
+    return lista.search, query_keys(n)
+
+@benchmark("lista.remove")
+def bench_lista_remove(n):
+    lista = engine.ListaEncadeada()
+    for i in range(n):
+        lista.insert_start(i)
+    return lista.remove, query_keys(n)
+
+# ================================================================
+# CASOS: TABELA HASH
+# ================================================================
+
+HASH_STRATEGIES = ("sha256", "builtin", "fast", "keyed")
+
+def text_keys(n):
+    """Retorna n chaves textuais distintas de ~40 caracteres, em ordem aleatória"""
+    return [f"sessao/{key:010d}/usuario@exemplo.com.br" for key in shuffled_keys(n)]
+
+def filled_hashtable(n, factory):
+    """Cria uma tabela hash (construída por factory) com n chaves textuais"""
+    table = factory()
+    for key in text_keys(n):
+        table.insert(key, key)
+    return table
+
+def register_hashtable_cases(prefix, factory):
+    """Registra os casos insert/search/remove de uma tabela hash construída por factory"""
+    @benchmark(f"{prefix}.insert")
+    def bench_insert(n):
+        table = factory()
+        return (lambda key: table.insert(key, key)), text_keys(n)
+
+    @benchmark(f"{prefix}.search")
+    def bench_search(n):
+        table = filled_hashtable(n, factory)
+        return table.search, text_keys(n)
+
+    @benchmark(f"{prefix}.remove")
+    def bench_remove(n):
+        table = filled_hashtable(n, factory)
+        return table.remove, text_keys(n)
+
+# Estratégia padrão com o nome histórico, seguida de uma variante por estratégia
+register_hashtable_cases("hashtable", engine.HashTable)
+for hash_strategy in HASH_STRATEGIES:
+    register_hashtable_cases(f"hashtable[{hash_strategy}]",
+                             lambda strategy=hash_strategy: engine.HashTable(hash_strategy=strategy))
+register_hashtable_cases("openhashtable", engine.OpenHashTable)
+
+def add_hash_speedups(results):
+    """Anota em cada caso hashtable[estratégia] o ganho de vazão sobre a estratégia sha256"""
+    baseline = {}
+    for result in results:
+        if result["case"].startswith("hashtable[sha256].") and "ops_per_sec" in result:
+            operation = result["case"].split(".", 1)[1]
+            baseline[(operation, result["size"])] = result["ops_per_sec"]
+    for result in results:
+        if not result["case"].startswith("hashtable[") or "ops_per_sec" not in result:
+            continue
+        reference = baseline.get((result["case"].split(".", 1)[1], result["size"]))
+        if reference:
+            result["speedup_vs_sha256"] = result["ops_per_sec"] / reference
+
+# ================================================================
+# CASOS: ÁRVORE BINÁRIA
+# ================================================================
+
+def filled_binarytree(n):
+    """Cria uma árvore binária completa com n valores"""
+    tree = engine.BinaryTree()
+    for value in range(n):
+        tree.insert(value)
+    return tree
+
+@benchmark("binarytree.insert")
+def bench_binarytree_insert(n):
+    tree = engine.BinaryTree()
+    return tree.insert, list(range(n))
+
+@benchmark("binarytree.search")
+def bench_binarytree_search(n):
+    tree = filled_binarytree(n)
+    return tree.search, query_keys(n)
+
+@benchmark("binarytree.delete")
+def bench_binarytree_delete(n):
+    tree = filled_binarytree(n)
+    return tree.delete, query_keys(n)
+
+# ================================================================
+# CASOS: ÁRVORE AVL
+# ================================================================
+
+def snapshot_directory():
+    """Diretório temporário dos snapshots (removido ao fim do processo)"""
+    global SNAPSHOT_DIRECTORY
+    if SNAPSHOT_DIRECTORY is None:
+        SNAPSHOT_DIRECTORY = tempfile.TemporaryDirectory(prefix="benchmark-")
+    return SNAPSHOT_DIRECTORY.name
+
+def filled_avltree(n):
+    """Cria uma árvore AVL com as chaves 0..n-1 (carga em lote)"""
+    tree = engine.AVLTree()
+    tree.bulk_load(shuffled_keys(n))
+    return tree
+
+@benchmark("avltree.insert")
+def bench_avltree_insert(n):
+    tree = engine.AVLTree()
+    return tree.insert, shuffled_keys(n)
+
+@benchmark("avltree.bulk_load")
+def bench_avltree_bulk_load(n):
+    # Uma única operação carregando as n chaves (compare com avltree.insert)
+    tree = engine.AVLTree()
+    return tree.bulk_load, [shuffled_keys(n)]
+
+@benchmark("avltree.bulk_merge")
+def bench_avltree_bulk_merge(n):
+    # Mescla um lote ordenado de n chaves ímpares numa árvore com n chaves pares
+    tree = engine.AVLTree()
+    tree.bulk_load(range(0, 2 * n, 2))
+    return tree.bulk_merge, [range(1, 2 * n, 2)]
+
+@benchmark("avltree.load_snapshot")
+def bench_avltree_load_snapshot(n):
+    # Abre o snapshot binário de uma árvore com n chaves (compare com avltree.bulk_load)
+    path = os.path.join(snapshot_directory(), f"avltree-{n}.snap")
+    save_snapshot(filled_avltree(n), path)
+    return load_snapshot, [path]
+
+@benchmark("avltree.search")
+def bench_avltree_search(n):
+    tree = filled_avltree(n)
+    return tree.search, shuffled_keys(n)
+
+@benchmark("avltree.delete")
+def bench_avltree_delete(n):
+    tree = filled_avltree(n)
+    return tree.delete, shuffled_keys(n)
+
+def skewed_keys(n):
+    """Gera n chaves com muitas repetições (cerca de 1% de chaves distintas)"""
+    distinct = max(1, n // 100)
+    return [key % distinct for key in shuffled_keys(n)]
+
+@benchmark("avltree.insert_skewed")
+def bench_avltree_insert_skewed(n):
+    tree = engine.AVLTree()
+    return tree.insert, skewed_keys(n)
+
+@benchmark("avltree.multiset_skewed")
+def bench_avltree_multiset_skewed(n):
+    # Repetições só incrementam a contagem do nó (compare com avltree.insert_skewed)
+    tree = engine.AVLTree(multiset=True)
+    return tree.insert, skewed_keys(n)
+
+@benchmark("avltree.persistent_insert")
+def bench_avltree_persistent_insert(n):
+    # Um snapshot por inserção: cada inserção copia o caminho inteiro (compare com avltree.insert)
+    tree = filled_avltree(n)
+    tree.snapshot()
+
+    def insert_and_snapshot(key):
+        tree.insert(key)
+        tree.snapshot()
+    return insert_and_snapshot, shuffled_keys(n)
+
+@benchmark("avltree.delete_range")
+def bench_avltree_delete_range(n):
+    # Remove a metade inferior das chaves de uma vez (compare com avltree.delete)
+    tree = filled_avltree(n)
+    return (lambda: tree.delete_range(None, n // 2)), 1
+
+@benchmark("compactavl.insert")
+def bench_compactavl_insert(n):
+    tree = engine.CompactAVLTree()
+    return tree.insert, shuffled_keys(n)
+
+@benchmark("compactavl.bulk_load")
+def bench_compactavl_bulk_load(n):
+    # Pico de memória comparável com avltree.bulk_load (nós como índices em colunas)
+    tree = engine.CompactAVLTree()
+    return tree.bulk_load, [shuffled_keys(n)]
+
+@benchmark("compactavl.search")
+def bench_compactavl_search(n):
+    tree = engine.CompactAVLTree()
+    tree.bulk_load(range(n))
+    return tree.search, shuffled_keys(n)
+
+@benchmark("compactavl.delete")
+def bench_compactavl_delete(n):
+    tree = engine.CompactAVLTree()
+    tree.bulk_load(range(n))
+    return tree.delete, shuffled_keys(n)
+
+# ================================================================
+# INICIALIZAÇÃO DA INTERFACE
+# ================================================================
+
+# Executado num interpretador novo: mede a importação de main e o primeiro desenho
+STARTUP_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+window = main.MainWindow(run=False)
+window.root.update()  # Mapeia a janela e executa os desenhos pendentes (after_idle)
+painted = time.perf_counter()
+window.root.destroy()
+print(json.dumps({"import_s": imported - started, "first_paint_s": painted - started}))
+"""
+
+def measure_startup(runs=STARTUP_RUNS, log=print):
+    """
+    Mede o tempo de inicialização da interface gráfica (importação + primeiro desenho)
+
+    Cada execução usa um processo Python novo, para que nenhum módulo já esteja
+    importado. Sem display (ou sem Tkinter), o resultado é marcado como pulado.
+
+    Retorna:
+        Resultado no mesmo formato dos demais casos (case "startup")
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=here,
+                                   capture_output=True, text=True)
+        if completed.returncode != 0:
+            reason = (completed.stderr.strip().splitlines() or ["erro"])[-1]
+            log(f"{'startup':<24} pulado ({reason})")
+            return {"case": "startup", "size": 1, "skipped": reason}
+        samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    imports = sorted(sample["import_s"] for sample in samples)
+    paints = sorted(sample["first_paint_s"] for sample in samples)
+    result = {
+        "case": "startup",
+        "size": 1,
+        "runs": runs,
+        "import_s": percentile(imports, 0.50),
+        "first_paint_s": percentile(paints, 0.50),
+        "first_paint_max_s": paints[-1],
+    }
+    log(f"{'startup':<24} importação={result['import_s'] * 1000:8.1f} ms  "
+        f"primeiro desenho={result['first_paint_s'] * 1000:8.1f} ms (mediana de {runs})")
+    return result
+
+# ================================================================
+# EXECUÇÃO E MEDIÇÃO
+# ================================================================
+
+def percentile(sorted_values, fraction):
+    """Retorna o percentil (0 a 1) de uma lista já ordenada"""
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+def run_operations(operation, args):
+    """Executa as operações medindo a latência individual de cada uma (em ns)"""
+    clock = time.perf_counter_ns
+    latencies = []
+    record = latencies.append
+    if isinstance(args, int):
+        for _ in range(args):
+            start = clock()
+            operation()
+            record(clock() - start)
+    else:
+        for arg in args:
+            start = clock()
+            operation(arg)
+            record(clock() - start)
+    return latencies
+
+def measure_time(setup, n):
+    """Mede latências e vazão de um caso (coleta de lixo desligada durante a medição)"""
+    operation, args = setup(n)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        latencies = run_operations(operation, args)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    latencies.sort()
+    total_ns = sum(latencies)
+    return {
+        "ops": len(latencies),
+        "seconds": total_ns / 1e9,
+        "ops_per_sec": len(latencies) / (total_ns / 1e9) if total_ns else 0.0,
+        "p50_ns": percentile(latencies, 0.50),
+        "p99_ns": percentile(latencies, 0.99),
+    }
+
+def measure_memory(setup, n):
+    """Mede o pico de memória (bytes) da preparação e das operações de um caso"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        operation, args = setup(n)
+        if isinstance(args, int):
+            for _ in range(args):
+                operation()
+        else:
+            for arg in args:
+                operation(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def run_case(name, sizes, budget, memory=True, log=print):
+    """
+    Executa um caso em todos os tamanhos pedidos
+
+    Retorna:
+        Lista de resultados (um por tamanho), incluindo os tamanhos pulados
+    """
+    setup = BENCHMARKS[name]
+    results = []
+    skip_reason = None
+    for i, n in enumerate(sizes):
+        if skip_reason:
+            results.append({"case": name, "size": n, "skipped": skip_reason})
+            log(f"{name:<24} n={n:<9} pulado ({skip_reason})")
+            continue
+
+        started = time.perf_counter()
+        result = {"case": name, "size": n}
+        result.update(measure_time(setup, n))
+        if memory:
+            result["peak_memory_bytes"] = measure_memory(setup, n)
+        elapsed = time.perf_counter() - started
+        results.append(result)
+        log(f"{name:<24} n={n:<9} {result['ops_per_sec']:>14,.0f} ops/s  "
+            f"p50={result['p50_ns']:>8} ns  p99={result['p99_ns']:>8} ns"
+            + (f"  pico={result['peak_memory_bytes'] / 1024:,.0f} KiB" if memory else ""))
+
+        # Projeção (no mínimo linear) do custo do próximo tamanho
+        if i + 1 < len(sizes) and elapsed * sizes[i + 1] / n > budget:
+            skip_reason = "budget"
+    return results
+
+def select_cases(patterns):
+    """Seleciona os casos cujo nome começa por algum dos prefixos informados"""
+    if not patterns:
+        return list(BENCHMARKS)
+    return [name for name in BENCHMARKS if any(name.startswith(p) for p in patterns)]
+
+def wants_startup(patterns):
+    """Verifica se a medição de inicialização foi pedida (sempre, sem filtro de casos)"""
+    return not patterns or any("startup".startswith(p) for p in patterns)
+
+def build_report(results, sizes):
+    """Monta o relatório JSON com metadados do ambiente"""
+    return {
+        "schema": 1,
+        "metadata": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "seed": SEED,
+            "sizes": sizes,
+        },
+        "results": results,
+    }
+
+def compare_reports(old, new, log=print):
+    """Exibe a razão de vazão (novo/antigo) para cada caso e tamanho presentes em ambos"""
+    previous = {(r["case"], r["size"]): r for r in old["results"] if "ops_per_sec" in r}
+    log(f"\n{'caso':<24} {'n':>9} {'antes':>14} {'depois':>14} {'razão':>8}")
+
+    # Inicialização: menor é melhor, então a razão é antes/depois
+    startup_before = next((r for r in old["results"] if r["case"] == "startup"), None)
+    startup_after = next((r for r in new["results"] if r["case"] == "startup"), None)
+    if (startup_before and startup_after and "first_paint_s" in startup_before
+            and "first_paint_s" in startup_after):
+        log(f"{'startup (ms)':<24} {1:>9} {startup_before['first_paint_s'] * 1000:>14,.1f} "
+            f"{startup_after['first_paint_s'] * 1000:>14,.1f} "
+            f"{startup_before['first_paint_s'] / startup_after['first_paint_s']:>7.2f}x")
+
+    for result in new["results"]:
+        before = previous.get((result["case"], result["size"]))
+        if before is None or "ops_per_sec" not in result or not before["ops_per_sec"]:
+            continue
+        ratio = result["ops_per_sec"] / before["ops_per_sec"]
+        log(f"{result['case']:<24} {result['size']:>9} {before['ops_per_sec']:>14,.0f} "
+            f"{result['ops_per_sec']:>14,.0f} {ratio:>7.2f}x")
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Benchmarks das estruturas de dados")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES,
+                        help="tamanhos a medir (padrão: 10^2 a 10^6)")
+    parser.add_argument("--cases", nargs="*", default=None,
+                        help="prefixos dos casos a executar (ex.: fila avltree.insert startup)")
+    parser.add_argument("--budget", type=float, default=30.0,
+                        help="tempo máximo projetado (s) por tamanho antes de pular os maiores")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="não mede o pico de memória (execução mais rápida)")
+    parser.add_argument("--output", default="benchmark_report.json",
+                        help="arquivo JSON de saída")
+    parser.add_argument("--compare", default=None,
+                        help="relatório JSON anterior para comparação")
+    parser.add_argument("--list", action="store_true", help="lista os casos disponíveis")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in BENCHMARKS:
+            print(name)
+        print("startup")
+        return 0
+
+    cases = select_cases(args.cases)
+    startup = wants_startup(args.cases)
+    if not cases and not startup:
+        parser.error("nenhum caso corresponde aos prefixos informados")
+
+    sizes = sorted(args.sizes)
+    results = [measure_startup()] if startup else []
+    for name in cases:
+        results.extend(run_case(name, sizes, args.budget, memory=not args.no_memory))
+
+    add_hash_speedups(results)
+    speedups = [r for r in results if "speedup_vs_sha256" in r]
+    if speedups:
+        print(f"\n{'caso':<28} {'n':>9} {'ganho sobre sha256':>20}")
+        for result in speedups:
+            print(f"{result['case']:<28} {result['size']:>9} {result['speedup_vs_sha256']:>19.2f}x")
+
+    report = build_report(results, sizes)
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2, sort_keys=True)
+        output.write("\n")
+    print(f"\nRelatório gravado em {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous:
+            compare_reports(json.load(previous), report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,10 @@ Características:
 - Visualização hierárquica com conexões
 - Destaque para nós selecionados
 - Suporte a quatro tipos de percurso
+- Operações delegadas ao núcleo engine.BinaryTree (sem interface gráfica)
+- Desenho feito diretamente a partir do vetor em ordem de nível do núcleo
+- Desenho incremental (render.RetainedCanvas): cada operação só toca os itens afetados
+- Rolagem e zoom, desenhando apenas os nós visíveis e recolhendo subárvores densas
 
 Autor: Agostinho Ferreira (little_agosto)
 Data da última atualização: 02/08/2025
@@ -19,27 +23,10 @@ Data da última atualização: 02/08/2025
 
 import tkinter as tk
 from tkinter import messagebox
-
-class TreeNode:
-    """
-    Classe que representa um nó da árvore binária
-    
-    Atributos:
-        value: Valor armazenado no nó
-        left: Referência ao filho esquerdo
-        right: Referência ao filho direito
-        x, y: Coordenadas para posicionamento visual
-    """
-    def __init__(self, value):
-        self.value = value
-        self.left = None
-        self.right = None
-        self.x = 0  # Coordenada x para desenho
-        self.y = 0  # Coordenada y para desenho
-        
-    def __str__(self):
-        """Retorna representação string do nó"""
-        return str(self.value)
+import engine
+from lote import BatchDialog, split_integers, invalid_note, format_traversal
+from render import RetainedCanvas, RedrawScheduler, Viewport, format_count
+from render.scenes import binarytree_scene
 
 class BinaryTree:
     """
@@ -47,9 +34,12 @@ class BinaryTree:
     
     Atributos:
         parent_frame: Frame do Tkinter para conter a visualização
-        root: Nó raiz da árvore
-        selected_node: Nó selecionado para destaque visual
+        tree: Núcleo da árvore (engine.BinaryTree)
+        selected_index: Índice (ordem de nível) do nó selecionado para destaque visual
         canvas: Área de desenho para visualização
+        renderer: Renderizador em modo retido sobre o canvas
+        redraw: Agendador que agrupa os pedidos de redesenho
+        viewport: Rolagem e zoom do canvas
         control_frame: Área para controles (entrada e botões)
         status: Barra de status para mensagens
     """
@@ -62,13 +52,18 @@ class BinaryTree:
             parent_frame: Frame do Tkinter para renderização
         """
         self.parent_frame = parent_frame
-        self.root = None  # Árvore inicia vazia
-        self.selected_node = None  # Nenhum nó selecionado inicialmente
+        self.tree = engine.BinaryTree()  # Árvore inicia vazia
+        self.selected_index = -1  # Nenhum nó selecionado inicialmente
         
         # Configuração da área de desenho
         self.canvas = tk.Canvas(self.parent_frame, width=300, height=300, bg='white')
         self.parent_frame.pack_propagate(False)  # Impede redimensionamento automático
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.renderer = RetainedCanvas(self.canvas)  # Mantém os itens entre desenhos
+        # Agrupa os redesenhos: no máximo um por quadro e nenhum com a aba escondida
+        self.redraw = RedrawScheduler(self.canvas, self.visualize_tree, self.parent_frame)
+        self.viewport = Viewport()  # Rolagem e zoom (roda do mouse, Ctrl+roda, arraste)
+        self.viewport.attach(self.canvas, self.redraw.request)
         
         # Área de controles
         self.control_frame = tk.Frame(self.parent_frame)
@@ -99,6 +94,7 @@ class BinaryTree:
         tk.Button(self.control_frame, text="Delete", command=self.delete_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Search", command=self.search_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Limpar", command=self.clear_tree).pack(side=tk.LEFT, padx=5)
+        tk.Button(self.control_frame, text="Lote...", command=self.batch_gui).pack(side=tk.LEFT, padx=5)
         
         # Barra de status
         self.status = tk.Label(self.parent_frame, text="Comece", 
@@ -106,10 +102,9 @@ class BinaryTree:
         self.status.pack(fill=tk.X)
         
         # Inicializa a árvore com um nó raiz
+        self.tree.clear()
         if root_value is not None:
-            self.root = TreeNode(root_value)
-        else:
-            self.root = None
+            self.tree.insert(root_value)
         
         # Botões de percurso
         tk.Button(self.traversal_frame, text="In-order", command=self.show_inorder).pack(side=tk.LEFT, padx=5)
@@ -118,7 +113,7 @@ class BinaryTree:
         tk.Button(self.traversal_frame, text="Level-order", command=self.show_levelorder).pack(side=tk.LEFT, padx=5)
         
         # Desenha a árvore inicial
-        self.visualize_tree()
+        self.redraw.request()
 
     # ================================================================
     # INTERFACE GRÁFICA PARA OPERAÇÕES
@@ -128,8 +123,8 @@ class BinaryTree:
         """Insere valor na árvore mantendo sua completude"""
         try:
             value = int(self.entry.get())
-            self.insert(value)
-            self.visualize_tree()
+            self.tree.insert(value)
+            self.redraw.request()
             self.status.config(text=f"Inserido: {value}")
         except ValueError:
             messagebox.showerror("Error", "Coloque um valor inteiro")
@@ -138,8 +133,11 @@ class BinaryTree:
         """Remove valor da árvore substituindo pelo nó mais profundo"""
         try:
             value = int(self.entry.get())
-            if self.delete(value):
-                self.visualize_tree()
+            # O nó mais profundo ocupa a posição liberada: o destaque segue o valor selecionado
+            selected = self.tree.values[self.selected_index] if self.selected_index >= 0 else None
+            if self.tree.delete(value):
+                self.selected_index = self.tree.search(selected) if selected is not None else -1
+                self.redraw.request()
                 self.status.config(text=f"Deletado: {value}")
             else:
                 self.status.config(text=f"Valor: {value} não encontrado")
@@ -150,183 +148,45 @@ class BinaryTree:
         """Busca valor na árvore e destaca o nó encontrado"""
         try:
             value = int(self.entry.get())
-            node = self.search(value)
-            if node:
-                self.selected_node = node
+            self.selected_index = self.tree.search(value)
+            if self.selected_index >= 0:
                 self.status.config(text=f"Encontrado: {value}")
             else:
-                self.selected_node = None
                 self.status.config(text=f"Valor: {value} não encontrado")
-            self.visualize_tree()
+            self.redraw.request()
         except ValueError:
             messagebox.showerror("Error", "Insira um valor inteiro")
     
     def clear_tree(self):
         """Limpa completamente a árvore"""
-        self.root = None
-        self.selected_node = None
-        self.visualize_tree()
+        self.tree.clear()
+        self.selected_index = -1
+        self.redraw.request()
         self.status.config(text="Árvore limpa")
 
-    # ================================================================
-    # OPERAÇÕES DA ÁRVORE BINÁRIA
-    # ================================================================
-    
-    def insert(self, value):
-        """
-        Insere um novo nó com o valor especificado na próxima posição vaga (em nível)
-        Mantém a árvore binária completa.
-        """
-        if self.root is None:
-            self.root = TreeNode(value)
-            return 
-        
-        # Usa uma fila para encontrar a próxima posição vaga
-        queue = [self.root]
-        while queue:
-            current = queue.pop(0)
-            # Insere à esquerda se possível
-            if current.left is None:
-                current.left = TreeNode(value)
-                return
-            else:
-                queue.append(current.left)
-            # Insere à direita se possível
-            if current.right is None:
-                current.right = TreeNode(value)
-                return
-            else:
-                queue.append(current.right)
+    def batch_gui(self):
+        """Abre a janela de operações em lote (valores digitados, colados ou de arquivo)"""
+        BatchDialog(self.parent_frame, "Árvore Binária - Lote", ["Insert", "Delete"], self.apply_batch)
     
-    def delete(self, value):
+    def apply_batch(self, operation, values):
         """
-        Remove o nó com o valor especificado, substituindo-o pelo nó mais profundo
-        
-        Retorna:
-            True se removeu, False se o valor não foi encontrado
-        """
-        if self.root is None:
-            return False
-        
-        node_to_delete = None
-        deepest_node = None
-        queue = [self.root]
-        
-        # Encontra o nó a ser deletado e o nó mais profundo
-        while queue:
-            current = queue.pop(0)
-            if current.value == value:
-                node_to_delete = current
-            deepest_node = current  # O último nó visitado será o mais profundo
-            if current.left:
-                queue.append(current.left)
-            if current.right:
-                queue.append(current.right)
-        
-        # Valor não encontrado
-        if node_to_delete is None:
-            return False
-        
-        # Copia o valor do nó mais profundo para o nó a ser deletado
-        node_to_delete.value = deepest_node.value
-        # Remove o nó mais profundo
-        self.delete_deepest(deepest_node)
-        return True
+        Aplica um lote de valores inteiros com um único redesenho
 
-    def delete_deepest(self, node):
-        """
-        Remove o nó mais profundo da árvore
-        
         Parâmetros:
-            node: Nó a ser removido (o mais profundo)
+            operation: "Insert" ou "Delete"
+            values: Valores do lote (os não inteiros são ignorados)
         """
-        if self.root == node:
-            self.root = None
-            return
-        
-        queue = [self.root]
-        while queue:
-            current = queue.pop(0)
-            # Remove a referência ao nó mais profundo
-            if current.left == node:
-                current.left = None
-                return 
-            elif current.left:
-                queue.append(current.left)
-            if current.right == node:
-                current.right = None
-                return 
-            elif current.right:
-                queue.append(current.right)
-    
-    def traverse_inorder(self):
-        """Retorna lista de valores em percurso in-order (esquerda, raiz, direita)"""
-        result = []
-        self.inorder_helper(self.root, result)
-        return result
-    
-    def inorder_helper(self, node, result):
-        """Função auxiliar recursiva para percurso in-order"""
-        if node:
-            self.inorder_helper(node.left, result)
-            result.append(node.value)
-            self.inorder_helper(node.right, result)
-    
-    def traverse_preorder(self):
-        """Retorna lista de valores em percurso pre-order (raiz, esquerda, direita)"""
-        result = []
-        self.preorder_helper(self.root, result)
-        return result
-
-    def preorder_helper(self, node, result):
-        """Função auxiliar recursiva para percurso pre-order"""
-        if node:
-            result.append(node.value)
-            self.preorder_helper(node.left, result)
-            self.preorder_helper(node.right, result)
-    
-    def traverse_postorder(self):
-        """Retorna lista de valores em percurso post-order (esquerda, direita, raiz)"""
-        result = []
-        self.postorder_helper(self.root, result)
-        return result
-    
-    def postorder_helper(self, node, result):
-        """Função auxiliar recursiva para percurso post-order"""
-        if node:
-            self.postorder_helper(node.left, result)
-            self.postorder_helper(node.right, result)
-            result.append(node.value)
-    
-    def traverse_levelorder(self):
-        """Retorna lista de valores em percurso por nível (largura)"""
-        result = []
-        if self.root is None:
-            return result
-        queue = [self.root]
-        while queue:
-            current = queue.pop(0)
-            result.append(current.value)
-            if current.left:
-                queue.append(current.left)
-            if current.right:
-                queue.append(current.right)
-        return result
-        
-    def search(self, value):
-        """Busca um valor na árvore e retorna o nó correspondente (ou None)"""
-        if self.root is None:
-            return None
-        queue = [self.root]
-        while queue:
-            current = queue.pop(0)
-            if current.value == value:
-                return current
-            if current.left:
-                queue.append(current.left)
-            if current.right:
-                queue.append(current.right)
-        return None
+        numbers, invalid = split_integers(values)
+        if operation == "Delete":
+            deleted = sum(1 for value in numbers if self.tree.delete(value))
+            message = f"Lote: {format_count(deleted)} de {format_count(len(numbers))} deletados"
+        else:
+            for value in numbers:
+                self.tree.insert(value)
+            message = f"Lote: {format_count(len(numbers))} inseridos"
+        self.selected_index = -1  # Os índices mudam com as remoções
+        self.redraw.request()
+        self.status.config(text=message + invalid_note(invalid))
 
     # ================================================================
     # VISUALIZAÇÃO E PERCURSOS (INTERFACE)
@@ -334,26 +194,22 @@ class BinaryTree:
     
     def show_inorder(self):
         """Exibe percurso in-order na barra de status"""
-        traversal = self.traverse_inorder()
-        traversal_str = ' '.join(map(str, traversal))
+        traversal_str = format_traversal(self.tree.iter_inorder())
         self.status.config(text=f"In-order: {traversal_str}")
 
     def show_preorder(self):
         """Exibe percurso pre-order na barra de status"""
-        traversal = self.traverse_preorder()
-        traversal_str = ' '.join(map(str, traversal))
+        traversal_str = format_traversal(self.tree.iter_preorder())
         self.status.config(text=f"Pre-order: {traversal_str}")
 
     def show_postorder(self):
         """Exibe percurso post-order na barra de status"""
-        traversal = self.traverse_postorder()
-        traversal_str = ' '.join(map(str, traversal))
+        traversal_str = format_traversal(self.tree.iter_postorder())
         self.status.config(text=f"Post-order: {traversal_str}")
 
     def show_levelorder(self):
         """Exibe percurso por nível na barra de status"""
-        traversal = self.traverse_levelorder()
-        traversal_str = ' '.join(map(str, traversal))
+        traversal_str = format_traversal(self.tree.iter_levelorder())
         self.status.config(text=f"Level-order: {traversal_str}")
 
     # ================================================================
@@ -361,80 +217,16 @@ class BinaryTree:
     # ================================================================
     
     def visualize_tree(self):
-        """Renderiza a representação visual da árvore"""
-        self.canvas.delete("all")
-        
-        # Mostra mensagem se a árvore estiver vazia
-        if not self.root:
-            self.canvas.create_text(
-                self.canvas.winfo_width() / 2, 
-                self.canvas.winfo_height() / 2, 
-                text="Árvore Vazia", 
-                font=("Arial", 24), 
-                fill="gray"
-            )
-            return
-        
-        # Organiza os nós por níveis usando BFS
-        levels = []
-        queue = [(self.root, 0)]  # (nó, nível)
-        while queue:
-            node, level = queue.pop(0)
-            if level == len(levels):
-                levels.append([])
-            levels[level].append(node)
-            if node.left:
-                queue.append((node.left, level+1))
-            if node.right:
-                queue.append((node.right, level+1))
-        
-        # Calcula dimensões
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        tree_height = len(levels)
-        vertical_spacing = (canvas_height - 100) / tree_height if tree_height > 0 else 0
-        
-        # Atribui coordenadas a cada nó
-        for level_num, nodes in enumerate(levels):
-            n = len(nodes)
-            for i, node in enumerate(nodes):
-                # Posição horizontal proporcional ao número de nós no nível
-                node.x = (i + 1) * canvas_width / (n + 1)
-                node.y = 50 + level_num * vertical_spacing
+        """
+        Renderiza a representação visual da árvore (apenas os itens que mudaram)
         
-        # Desenha as conexões entre nós (arestas)
-        queue = [self.root]
-        while queue:
-            current = queue.pop(0)
-            if current.left:
-                self.canvas.create_line(
-                    current.x, current.y, 
-                    current.left.x, current.left.y, 
-                    fill="blue", width=2
-                )
-                queue.append(current.left)
-            if current.right:
-                self.canvas.create_line(
-                    current.x, current.y, 
-                    current.right.x, current.right.y, 
-                    fill="blue", width=2
-                )
-                queue.append(current.right)
-            
-            # Desenha o nó (círculo)
-            fill_color = "lightgreen" if current == self.selected_node else "lightblue"
-            self.canvas.create_oval(
-                current.x-20, current.y-20, 
-                current.x+20, current.y+20, 
-                fill=fill_color, outline="black"
-            )
-            # Valor do nó
-            self.canvas.create_text(
-                current.x, current.y, 
-                text=str(current.value), 
-                font=("Arial", 12, "bold")
-            )
+        A cena é descrita por render.scenes.binarytree_scene, a mesma usada na exportação
+        sem display; aqui ela é aplicada ao canvas pelo RetainedCanvas.
+        """
+        scene = binarytree_scene(self.tree, self.canvas.winfo_width(), self.canvas.winfo_height(),
+                                 self.viewport, self.selected_index)
+        self.renderer.render(scene)
     
     def on_resize(self, event):
         """Redesenha a árvore ao redimensionar o canvas"""
-        self.visualize_tree()
\ No newline at end of file
+        self.redraw.request()
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Núcleo das Estruturas de Dados (sem interface gráfica)
+
+Descrição:
+Este pacote reúne as estruturas de dados do projeto como objetos Python puros, sem
+nenhuma importação do Tkinter. As classes de interface gráfica (binarytree.py, treeavl.py,
+pilha.py, fila.py, lista.py, tabelaHash.py) são apenas visualizações sobre estes objetos,
+de modo que as mesmas operações podem ser executadas em processos de trabalho ou em
+servidores sem display.
+
+Estruturas Disponíveis:
+- BinaryTree: Árvore binária completa
+- AVLTree: Árvore AVL (com modo persistente, por cópia de caminho)
+- AVLHistory: Histórico de versões de uma AVLTree persistente (voltar e avançar)
+- CompactAVLTree: Árvore AVL sobre colunas de array (nós são índices, sem objetos por nó)
+- Pilha: Pilha (LIFO)
+- Fila: Fila (FIFO)
+- ListaEncadeada: Lista encadeada simples
+- HashTable: Tabela hash com encadeamento
+- OpenHashTable: Tabela hash com endereçamento aberto (Robin Hood)
+
+Módulos Auxiliares:
+- engine.arquivo: Importação e exportação em fluxo (CSV, JSONL ou um valor por linha)
+- engine.snapshot: Snapshots binários carregados por mmap (a AVL é montada sob demanda)
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+from .binarytree import BinaryTree
+from .treeavl import AVLTree, AVLHistory
+from .treeavlCompacta import CompactAVLTree
+from .pilha import Pilha
+from .fila import Fila
+from .lista import ListaEncadeada
+from .tabelaHash import HashTable
+from .tabelaHashAberta import OpenHashTable
+
+__all__ = ["BinaryTree", "AVLTree", "AVLHistory", "CompactAVLTree", "Pilha", "Fila", "ListaEncadeada", "HashTable", "OpenHashTable"]
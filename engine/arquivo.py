@@ -0,0 +1,279 @@
+"""
+Importação e Exportação de Arquivos em Fluxo (sem interface gráfica)
+
+Descrição:
+Carrega e grava o conteúdo das estruturas do pacote engine em arquivos CSV, JSONL (um
+documento JSON por linha) ou texto simples (um valor por linha). Os arquivos são lidos e
+escritos linha a linha: cada registro lido é entregue à estrutura assim que é interpretado,
+sem read() do arquivo inteiro nem listas intermediárias, o que permite trabalhar com
+arquivos de centenas de MB.
+
+Formatos:
+- "csv": um registro por linha; estruturas simples usam a primeira coluna e as tabelas
+  hash usam as colunas chave,valor (sem a segunda coluna, o valor é None)
+- "jsonl": cada linha é um valor JSON; nas tabelas hash, [chave, valor] ou
+  {"key": chave, "value": valor}
+- "lines": um valor por linha; nas tabelas hash, chave e valor separados por tabulação
+O formato é deduzido da extensão (.csv, .jsonl/.ndjson; as demais usam "lines").
+
+Ordem de Exportação:
+A exportação usa a ordem que reconstrói a estrutura ao ser carregada de volta: da base para
+o topo (Pilha), da frente para o final (Fila), da cabeça para a cauda (ListaEncadeada), em
+ordem de nível (BinaryTree, preservando a forma) e in-order (AVLTree). Um arquivo in-order é
+recarregado em O(n) por AVLTree.load_sorted, direto do arquivo.
+
+Uso:
+    from engine import AVLTree
+    from engine.arquivo import load, dump
+    arvore = AVLTree()
+    load(arvore, "valores.csv", convert=int)
+    dump(arvore, "ordenados.jsonl")
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+import csv
+import heapq
+import json
+import os
+
+from .binarytree import BinaryTree
+from .fila import Fila
+from .lista import ListaEncadeada
+from .pilha import Pilha
+from .tabelaHash import HashTable
+from .tabelaHashAberta import OpenHashTable
+from .treeavl import AVLTree
+
+FORMATS = ("csv", "jsonl", "lines")
+EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+def detect_format(path, fmt=None):
+    """
+    Resolve o formato do arquivo (o informado ou o deduzido da extensão)
+
+    Retorna:
+        "csv", "jsonl" ou "lines"
+    """
+    if fmt is None:
+        fmt = EXTENSIONS.get(os.path.splitext(path)[1].lower(), "lines")
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato de arquivo inválido: {fmt} (use {', '.join(FORMATS)})")
+    return fmt
+
+# ================================================================
+# LEITURA EM FLUXO
+# ================================================================
+
+def iter_records(path, fmt=None, encoding="utf-8"):
+    """
+    Gera os registros do arquivo, um por linha, sem ler o arquivo inteiro
+
+    Linhas em branco são ignoradas. Cada registro é uma lista de colunas (csv), um valor
+    JSON (jsonl) ou o texto da linha sem a quebra e os espaços das pontas (lines).
+    """
+    fmt = detect_format(path, fmt)
+    with open(path, encoding=encoding, newline="" if fmt == "csv" else None) as source:
+        if fmt == "csv":
+            for row in csv.reader(source):
+                if row:
+                    yield row
+        elif fmt == "jsonl":
+            for number, line in enumerate(source, 1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError as error:
+                        raise ValueError(f"{path}, linha {number}: JSON inválido ({error})") from None
+        else:
+            for line in source:
+                line = line.strip()
+                if line:
+                    yield line
+
+def iter_values(path, fmt=None, convert=None, encoding="utf-8"):
+    """
+    Gera um valor por registro (primeira coluna no CSV)
+
+    Parâmetros:
+        convert: Função aplicada a cada valor (ex.: int), ou None para mantê-lo
+    """
+    csv_rows = detect_format(path, fmt) == "csv"
+    for record in iter_records(path, fmt, encoding):
+        value = record[0] if csv_rows else record
+        yield convert(value) if convert else value
+
+def iter_pairs(path, fmt=None, convert=None, encoding="utf-8"):
+    """
+    Gera um par (chave, valor) por registro; registros sem valor geram (chave, None)
+
+    Parâmetros:
+        convert: Função aplicada a cada chave (ex.: int), ou None para mantê-la
+    """
+    fmt = detect_format(path, fmt)
+    for record in iter_records(path, fmt, encoding):
+        if fmt == "csv":
+            key, value = record[0], (record[1] if len(record) > 1 else None)
+        elif fmt == "lines":
+            key, separator, value = record.partition("\t")
+            value = value if separator else None
+        elif isinstance(record, dict):
+            key, value = record["key"], record.get("value")
+        elif isinstance(record, list):
+            key, value = record[0], (record[1] if len(record) > 1 else None)
+        else:
+            key, value = record, None
+        yield (convert(key) if convert else key), value
+
+# ================================================================
+# CARGA NAS ESTRUTURAS
+# ================================================================
+
+def load(structure, path, fmt=None, convert=None, encoding="utf-8"):
+    """
+    Carrega os registros do arquivo na estrutura, somando-os ao conteúdo atual
+
+    Parâmetros:
+        structure: Estrutura do pacote engine
+        path: Caminho do arquivo
+        fmt: "csv", "jsonl" ou "lines" (padrão: deduzido da extensão)
+        convert: Função aplicada a cada valor ou chave lida (ex.: int para as árvores)
+        encoding: Codificação do arquivo
+
+    Retorna:
+        Quantidade de registros carregados
+    """
+    if isinstance(structure, AVLTree):
+        return load_avltree(structure, path, fmt, convert, encoding)
+    if isinstance(structure, (HashTable, OpenHashTable)):
+        count = 0
+        for key, value in iter_pairs(path, fmt, convert, encoding):
+            structure.insert(key, value)
+            count += 1
+        return count
+
+    if isinstance(structure, Pilha):
+        add = structure.push
+    elif isinstance(structure, Fila):
+        add = structure.enqueue
+    elif isinstance(structure, ListaEncadeada):
+        add = structure.insert_end
+    elif isinstance(structure, BinaryTree):
+        add = structure.insert
+    else:
+        raise TypeError(f"Estrutura sem suporte a arquivos: {type(structure).__name__}")
+
+    count = 0
+    for value in iter_values(path, fmt, convert, encoding):
+        add(value)
+        count += 1
+    return count
+
+def load_avltree(tree, path, fmt=None, convert=None, encoding="utf-8"):
+    """
+    Carrega o arquivo numa AVLTree em O(n + m)
+
+    Uma primeira passada conta os valores e verifica se estão em ordem (como numa
+    exportação in-order). Se estiverem, a árvore é reconstruída em fluxo por load_sorted,
+    intercalando (heapq.merge) o percurso atual com uma segunda leitura do arquivo. Um
+    arquivo fora de ordem precisa ser ordenado e, por isso, é carregado com bulk_merge.
+
+    No modo multiconjunto, os valores vão direto para bulk_merge, que soma as contagens
+    aos nós existentes e preserva os payloads.
+
+    Retorna:
+        Quantidade de valores carregados
+    """
+    if tree.multiset:
+        values = list(iter_values(path, fmt, convert, encoding))
+        tree.bulk_merge(values)
+        return len(values)
+
+    count = 0
+    ordered = True
+    previous = None
+    for value in iter_values(path, fmt, convert, encoding):
+        if count and value < previous:
+            ordered = False
+            break
+        previous = value
+        count += 1
+
+    if not ordered:
+        values = list(iter_values(path, fmt, convert, encoding))
+        tree.bulk_merge(values)
+        return len(values)
+
+    existing = len(tree)
+    stream = iter_values(path, fmt, convert, encoding)
+    if existing:
+        stream = heapq.merge(tree.iter_inorder(), stream)
+    tree.load_sorted(stream, existing + count)
+    return count
+
+# ================================================================
+# EXPORTAÇÃO EM FLUXO
+# ================================================================
+
+def export_order(structure):
+    """
+    Retorna os registros da estrutura na ordem de exportação e se são pares (chave, valor)
+
+    Retorna:
+        Tupla (iterador, pares)
+    """
+    if isinstance(structure, (HashTable, OpenHashTable)):
+        return structure.items(), True
+    if isinstance(structure, AVLTree):
+        return structure.iter_inorder(), False
+    if isinstance(structure, BinaryTree):
+        return structure.iter_levelorder(), False
+    if isinstance(structure, ListaEncadeada):
+        return (node.value for node in structure), False
+    if isinstance(structure, (Pilha, Fila)):
+        return iter(structure), False
+    raise TypeError(f"Estrutura sem suporte a arquivos: {type(structure).__name__}")
+
+def dump(structure, path, fmt=None, encoding="utf-8"):
+    """
+    Grava o conteúdo da estrutura no arquivo, um registro por linha
+
+    Parâmetros:
+        structure: Estrutura do pacote engine
+        path: Caminho do arquivo (sobrescrito)
+        fmt: "csv", "jsonl" ou "lines" (padrão: deduzido da extensão)
+        encoding: Codificação do arquivo
+
+    Retorna:
+        Quantidade de registros gravados
+    """
+    fmt = detect_format(path, fmt)
+    records, pairs = export_order(structure)
+    count = 0
+    with open(path, "w", encoding=encoding, newline="" if fmt == "csv" else None) as output:
+        if fmt == "csv":
+            writer = csv.writer(output)
+            for record in records:
+                if pairs:
+                    key, value = record
+                    record = (key,) if value is None else (key, value)
+                else:
+                    record = (record,)
+                writer.writerow(record)
+                count += 1
+        elif fmt == "jsonl":
+            for record in records:
+                if pairs:
+                    record = {"key": record[0], "value": record[1]}
+                output.write(json.dumps(record, ensure_ascii=False))
+                output.write("\n")
+                count += 1
+        else:
+            for record in records:
+                if pairs:
+                    key, value = record
+                    record = key if value is None else f"{key}\t{value}"
+                output.write(f"{record}\n")
+                count += 1
+    return count
@@ -0,0 +1,206 @@
+"""
+Núcleo da Árvore Binária Completa (sem interface gráfica)
+
+Descrição:
+Implementa uma árvore binária completa (não de busca) como objetos Python puros, sem nenhuma
+dependência do Tkinter. A árvore mantém sua propriedade de completude em todas as operações.
+Pode ser usada em processos de trabalho, servidores sem display ou pela visualização gráfica
+em binarytree.py.
+
+Representação:
+Como a árvore é sempre completa, os nós ficam implícitos num vetor em ordem de nível (como
+num heap): a raiz está no índice 0 e os filhos do índice i estão em 2i+1 e 2i+2. A próxima
+posição vaga é simplesmente o tamanho do vetor. Um dicionário valor -> índices permite
+localizar qualquer valor sem percorrer a árvore.
+
+Características:
+- Inserção em nível em O(1) (mantém a árvore completa)
+- Remoção substituindo pelo nó mais profundo em O(1) por posição
+- Busca e remoção por valor em O(1) esperado pelo índice de valores (com valores repetidos,
+  vale qualquer uma das ocorrências)
+- Suporte a quatro tipos de percurso (geradores iterativos, sem recursão)
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+class BinaryTree:
+    """
+    Classe que implementa uma árvore binária completa sem dependência de interface gráfica
+
+    Atributos:
+        values: Valores dos nós em ordem de nível (filhos de i em 2i+1 e 2i+2)
+        positions: Dicionário valor -> conjunto de índices onde o valor aparece
+    """
+
+    def __init__(self):
+        """Inicializa uma árvore vazia"""
+        self.values = []
+        self.positions = {}
+
+    def __len__(self):
+        """Retorna o número de nós da árvore"""
+        return len(self.values)
+
+    def size(self):
+        """Retorna o número de nós da árvore"""
+        return len(self.values)
+
+    def is_empty(self):
+        """Verifica se a árvore está vazia"""
+        return not self.values
+
+    def insert(self, value):
+        """
+        Insere um novo nó com o valor especificado na próxima posição vaga (em nível)
+        Mantém a árvore binária completa.
+        """
+        self.positions.setdefault(value, set()).add(len(self.values))
+        self.values.append(value)
+
+    def delete(self, value):
+        """
+        Remove o nó com o valor especificado, substituindo-o pelo nó mais profundo
+
+        Com valores repetidos, remove qualquer uma das ocorrências (a primeira do conjunto
+        de índices do valor), sem percorrer as demais.
+
+        Retorna:
+            True se removeu, False se o valor não foi encontrado
+        """
+        indices = self.positions.get(value)
+        if not indices:
+            return False
+        self.delete_at(next(iter(indices)))
+        return True
+
+    def delete_at(self, index):
+        """
+        Remove o nó da posição informada, movendo para ela o nó mais profundo
+
+        Parâmetros:
+            index: Índice do nó (ordem de nível)
+
+        Retorna:
+            Valor removido
+        """
+        if not 0 <= index < len(self.values):
+            raise IndexError("Índice fora da árvore")
+        removed = self.values[index]
+        self.forget(removed, index)
+
+        # O nó mais profundo é sempre o último do vetor
+        last = len(self.values) - 1
+        if index != last:
+            deepest = self.values[last]
+            self.forget(deepest, last)
+            self.positions.setdefault(deepest, set()).add(index)
+            self.values[index] = deepest
+        self.values.pop()
+        return removed
+
+    def forget(self, value, index):
+        """Remove um índice do mapa de posições do valor"""
+        indices = self.positions[value]
+        indices.discard(index)
+        if not indices:
+            del self.positions[value]
+
+    def clear(self):
+        """Remove todos os nós da árvore"""
+        self.values = []
+        self.positions = {}
+
+    def subtree_size(self, index):
+        """
+        Retorna o número de nós da subárvore enraizada no índice, em O(log n)
+
+        Na camada d abaixo do índice, os descendentes ocupam o intervalo contíguo
+        [(index + 1) * 2^d - 1, (index + 2) * 2^d - 1) do vetor.
+        """
+        count = len(self.values)
+        total = 0
+        first, width = index, 1
+        while first < count:
+            total += min(width, count - first)
+            first = 2 * first + 1
+            width *= 2
+        return total
+
+    def search(self, value):
+        """
+        Busca um valor na árvore
+
+        Retorna:
+            Índice de uma das ocorrências (qualquer uma, com valores repetidos), ou -1 se
+            não encontrado
+        """
+        indices = self.positions.get(value)
+        return next(iter(indices)) if indices else -1
+
+    # ================================================================
+    # PERCURSOS DA ÁRVORE
+    # ================================================================
+
+    def iter_inorder(self):
+        """Gera os valores em percurso in-order (esquerda, raiz, direita), sem recursão"""
+        values, n = self.values, len(self.values)
+        stack = []
+        index = 0
+        while stack or index < n:
+            # Desce pela esquerda empilhando os ancestrais
+            while index < n:
+                stack.append(index)
+                index = 2 * index + 1
+            index = stack.pop()
+            yield values[index]
+            index = 2 * index + 2
+
+    def iter_preorder(self):
+        """Gera os valores em percurso pre-order (raiz, esquerda, direita), sem recursão"""
+        values, n = self.values, len(self.values)
+        stack = [0] if n else []
+        while stack:
+            index = stack.pop()
+            yield values[index]
+            # A direita é empilhada primeiro para a esquerda sair antes
+            if 2 * index + 2 < n:
+                stack.append(2 * index + 2)
+            if 2 * index + 1 < n:
+                stack.append(2 * index + 1)
+
+    def iter_postorder(self):
+        """Gera os valores em percurso post-order (esquerda, direita, raiz), sem recursão"""
+        values, n = self.values, len(self.values)
+        # Cada entrada indica se os filhos do índice já foram empilhados
+        stack = [(0, False)] if n else []
+        while stack:
+            index, expanded = stack.pop()
+            if expanded:
+                yield values[index]
+                continue
+            stack.append((index, True))
+            if 2 * index + 2 < n:
+                stack.append((2 * index + 2, False))
+            if 2 * index + 1 < n:
+                stack.append((2 * index + 1, False))
+
+    def iter_levelorder(self):
+        """Gera os valores em percurso por nível (a própria ordem do vetor)"""
+        return iter(self.values)
+
+    def traverse_inorder(self):
+        """Retorna lista de valores em percurso in-order (esquerda, raiz, direita)"""
+        return list(self.iter_inorder())
+
+    def traverse_preorder(self):
+        """Retorna lista de valores em percurso pre-order (raiz, esquerda, direita)"""
+        return list(self.iter_preorder())
+
+    def traverse_postorder(self):
+        """Retorna lista de valores em percurso post-order (esquerda, direita, raiz)"""
+        return list(self.iter_postorder())
+
+    def traverse_levelorder(self):
+        """Retorna lista de valores em percurso por nível (largura)"""
+        return list(self.values)
@@ -0,0 +1,143 @@
+"""
+Núcleo da Fila (sem interface gráfica)
+
+Descrição:
+Implementa a estrutura de dados fila (FIFO - First In, First Out) como um objeto Python
+puro, sem nenhuma dependência do Tkinter. Pode ser usada em processos de trabalho, servidores
+sem display ou pela visualização gráfica em fila.py.
+
+Componentes Principais:
+1. Estrutura de dados: collections.deque (enqueue e dequeue em O(1) amortizado)
+2. Operações básicas: enqueue, dequeue, front, is_empty, is_full, size, clear
+3. Modo de capacidade fixa opcional com política de contrapressão configurável:
+   - "block": enqueue aguarda (com timeout opcional) até haver espaço
+   - "drop_oldest": descarta o elemento mais antigo para abrir espaço
+   - "raise": lança OverflowError quando a fila está cheia
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+from collections import deque
+import threading
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "raise")
+
+class Fila:
+    """
+    Classe que implementa uma fila sem dependência de interface gráfica
+
+    Atributos:
+        items: deque com os elementos (a frente à esquerda)
+        capacity: Capacidade máxima (None para fila ilimitada)
+        overflow: Política aplicada quando a fila está cheia
+        timeout: Tempo máximo de espera (s) na política "block" (None espera indefinidamente)
+        dropped: Quantidade de elementos descartados pela política "drop_oldest"
+        not_full: Condição usada pela política "block" (None nas demais)
+        head_seq: Número de sequência do elemento da frente (total de elementos que já
+            saíram da fila); o i-ésimo elemento tem sequência head_seq + i
+    """
+
+    def __init__(self, capacity=None, overflow="raise", timeout=None):
+        """
+        Inicializa uma fila vazia
+
+        Parâmetros:
+            capacity: Capacidade máxima da fila (padrão=None, ilimitada)
+            overflow: Política quando cheia: "block", "drop_oldest" ou "raise" (padrão)
+            timeout: Tempo máximo de espera na política "block" (padrão=None)
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("A capacidade deve ser pelo menos 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Política inválida: {overflow} (use {', '.join(OVERFLOW_POLICIES)})")
+
+        self.items = deque()
+        self.capacity = capacity
+        self.overflow = overflow
+        self.timeout = timeout
+        self.dropped = 0
+        self.head_seq = 0
+        # Somente o modo bloqueante precisa de sincronização entre threads
+        self.not_full = threading.Condition() if capacity is not None and overflow == "block" else None
+
+    def __len__(self):
+        """Retorna o número de elementos na fila"""
+        return len(self.items)
+
+    def __iter__(self):
+        """Percorre os elementos da frente para o final"""
+        return iter(self.items)
+
+    def enqueue(self, value):
+        """
+        Adiciona um elemento no final da fila
+
+        Observação:
+            Em uma fila com capacidade fixa e cheia, aplica a política de contrapressão
+            (pode bloquear, descartar o elemento mais antigo ou lançar OverflowError)
+        """
+        if self.not_full is not None:
+            with self.not_full:
+                if not self.not_full.wait_for(self.has_room, self.timeout):
+                    raise OverflowError("Fila cheia! (tempo de espera esgotado)")
+                self.items.append(value)
+            return
+
+        if self.capacity is not None and len(self.items) >= self.capacity:
+            if self.overflow == "raise":
+                raise OverflowError("Fila cheia!")
+            # Política "drop_oldest": abre espaço descartando a frente
+            self.items.popleft()
+            self.dropped += 1
+            self.head_seq += 1
+        self.items.append(value)
+
+    def dequeue(self):
+        """Remove e retorna o elemento da frente da fila"""
+        if self.not_full is not None:
+            with self.not_full:
+                value = self.pop_front()
+                self.not_full.notify()
+            return value
+        return self.pop_front()
+
+    def pop_front(self):
+        """Remove a frente da fila (sem sincronização)"""
+        if not self.items:
+            raise IndexError("Fila vazia!")
+        self.head_seq += 1
+        return self.items.popleft()
+
+    def front(self):
+        """Retorna o elemento da frente sem removê-lo"""
+        if not self.items:
+            raise IndexError("Fila vazia!")
+        return self.items[0]
+
+    def has_room(self):
+        """Verifica se há espaço para mais um elemento"""
+        return self.capacity is None or len(self.items) < self.capacity
+
+    def is_empty(self):
+        """Verifica se a fila está vazia"""
+        return len(self.items) == 0
+
+    def is_full(self):
+        """Verifica se a fila atingiu a capacidade máxima"""
+        return not self.has_room()
+
+    def size(self):
+        """Retorna o número de elementos na fila"""
+        return len(self.items)
+
+    def clear(self):
+        """Remove todos os elementos da fila"""
+        if self.not_full is not None:
+            with self.not_full:
+                self.head_seq += len(self.items)
+                self.items.clear()
+                self.not_full.notify_all()
+            return
+        self.head_seq += len(self.items)
+        self.items.clear()
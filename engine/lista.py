@@ -0,0 +1,182 @@
+"""
+Núcleo da Lista Encadeada Simples (sem interface gráfica)
+
+Descrição:
+Implementa uma lista encadeada simples como objetos Python puros, sem nenhuma dependência
+do Tkinter. Pode ser usada em processos de trabalho, servidores sem display ou pela
+visualização gráfica em lista.py.
+
+Componentes Principais:
+1. Classe Node: Representa um nó da lista
+2. Classe ListaEncadeada: Operações de inserção no início/fim, remoção, busca e limpeza
+3. Referência ao último nó e contador de tamanho (inserção no fim e size() em O(1))
+4. Operações em lote: extend encadeia vários valores no fim e remove_many remove vários
+   valores numa única passada pela lista
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+class Node:
+    """
+    Classe que representa um nó da lista encadeada
+
+    Atributos:
+        value: Valor armazenado no nó
+        next: Referência ao próximo nó
+
+    As posições de desenho ficam na visualização (lista.py), não no nó.
+    """
+    __slots__ = ("value", "next")  # Sem __dict__ por nó
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+
+class ListaEncadeada:
+    """
+    Classe que implementa uma lista encadeada sem dependência de interface gráfica
+
+    Atributos:
+        head: Primeiro nó da lista
+        tail: Último nó da lista
+        length: Número de nós na lista
+    """
+
+    def __init__(self):
+        """Inicializa uma lista vazia"""
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def __len__(self):
+        """Retorna o número de nós na lista"""
+        return self.length
+
+    def __iter__(self):
+        """Percorre os nós do início ao fim"""
+        current = self.head
+        while current:
+            yield current
+            current = current.next
+
+    def insert_start(self, value):
+        """Insere novo nó no início da lista"""
+        new_node = Node(value)
+        new_node.next = self.head
+        self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.length += 1
+
+    def insert_end(self, value):
+        """Insere novo nó no final da lista"""
+        new_node = Node(value)
+        if not self.head:
+            self.head = new_node
+        else:
+            # Encadeia diretamente após o último nó (sem percorrer a lista)
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+
+    def extend(self, values):
+        """Insere vários valores no final da lista, na ordem recebida"""
+        for value in values:
+            self.insert_end(value)
+
+    def remove_many(self, values):
+        """
+        Remove a primeira ocorrência de cada valor informado numa única passada
+
+        Equivale a chamar remove para cada valor (um valor repetido n vezes remove as n
+        primeiras ocorrências), mas em O(tamanho da lista + quantidade de valores) em vez
+        de percorrer a lista uma vez por valor.
+
+        Retorna:
+            Quantidade de nós removidos
+        """
+        pending = {}
+        for value in values:
+            pending[value] = pending.get(value, 0) + 1
+
+        removed = 0
+        previous = None
+        current = self.head
+        while current and pending:
+            count = pending.get(current.value)
+            if count:
+                # Desliga o nó atual (previous continua o mesmo)
+                if count == 1:
+                    del pending[current.value]
+                else:
+                    pending[current.value] = count - 1
+                if previous is None:
+                    self.head = current.next
+                else:
+                    previous.next = current.next
+                if current is self.tail:
+                    self.tail = previous
+                removed += 1
+            else:
+                previous = current
+            current = current.next
+
+        self.length -= removed
+        return removed
+
+    def remove(self, value):
+        """
+        Remove o primeiro nó com o valor especificado
+
+        Retorna:
+            True se removeu, False se não encontrou
+        """
+        # Lista vazia
+        if not self.head:
+            return False
+
+        # Remoção do primeiro nó
+        if self.head.value == value:
+            self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self.length -= 1
+            return True
+
+        # Busca pelo nó a ser removido
+        current = self.head
+        while current.next:
+            if current.next.value == value:
+                if current.next is self.tail:
+                    self.tail = current
+                current.next = current.next.next
+                self.length -= 1
+                return True
+            current = current.next
+
+        return False  # Valor não encontrado
+
+    def search(self, value):
+        """
+        Busca um valor na lista
+
+        Retorna:
+            Nó contendo o valor, ou None se não encontrado
+        """
+        current = self.head
+        while current:
+            if current.value == value:
+                return current
+            current = current.next
+        return None
+
+    def size(self):
+        """Retorna o número de nós na lista"""
+        return self.length
+
+    def clear(self):
+        """Remove todos os nós da lista"""
+        self.head = None
+        self.tail = None
+        self.length = 0
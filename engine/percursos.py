@@ -0,0 +1,104 @@
+"""
+Percursos Iterativos de Árvores Binárias (sem interface gráfica)
+
+Descrição:
+Geradores que percorrem qualquer árvore de nós com atributos left, right e value usando
+uma pilha explícita (ou fila, no percurso por níveis) em vez de recursão. Os valores são
+produzidos sob demanda: quem chama pode processar em fluxo, parar no meio ou pegar apenas
+um prefixo sem materializar a árvore inteira, e a profundidade da árvore não esbarra no
+limite de recursão do Python.
+
+Com counted=True (árvores AVL no modo multiconjunto), o valor de cada nó é produzido
+node.count vezes, como se as cópias fossem nós separados.
+
+Funções:
+- iter_inorder: esquerda, raiz, direita
+- iter_preorder: raiz, esquerda, direita
+- iter_postorder: esquerda, direita, raiz
+- iter_levelorder: por níveis (largura)
+- iter_nodes_inorder: os próprios nós (não os valores), em in-order
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+from collections import deque
+from itertools import repeat
+
+def iter_inorder(root, counted=False):
+    """Percurso in-order iterativo: esquerda, raiz, direita"""
+    stack = []
+    node = root
+    while stack or node:
+        # Desce pela esquerda empilhando os ancestrais
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        if counted:
+            yield from repeat(node.value, node.count)
+        else:
+            yield node.value
+        node = node.right
+
+def iter_preorder(root, counted=False):
+    """Percurso pre-order iterativo: raiz, esquerda, direita"""
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        if counted:
+            yield from repeat(node.value, node.count)
+        else:
+            yield node.value
+        # A direita é empilhada primeiro para a esquerda sair antes
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+def iter_postorder(root, counted=False):
+    """Percurso post-order iterativo: esquerda, direita, raiz"""
+    stack = []
+    node = root
+    last_visited = None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        # Visita a subárvore direita antes da raiz, se ainda não visitada
+        if top.right and top.right is not last_visited:
+            node = top.right
+        else:
+            stack.pop()
+            if counted:
+                yield from repeat(top.value, top.count)
+            else:
+                yield top.value
+            last_visited = top
+
+def iter_levelorder(root, counted=False):
+    """Percurso por níveis (largura) usando uma fila de O(1) nas duas pontas"""
+    queue = deque([root] if root else [])
+    while queue:
+        node = queue.popleft()
+        if counted:
+            yield from repeat(node.value, node.count)
+        else:
+            yield node.value
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+def iter_nodes_inorder(root):
+    """Gera os nós (não os valores) em in-order, sem recursão"""
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
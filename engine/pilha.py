@@ -0,0 +1,63 @@
+"""
+Núcleo da Pilha (sem interface gráfica)
+
+Descrição:
+Implementa a estrutura de dados pilha (LIFO - Last In, First Out) como um objeto Python
+puro, sem nenhuma dependência do Tkinter. Pode ser usada em processos de trabalho, servidores
+sem display ou pela visualização gráfica em pilha.py.
+
+Componentes Principais:
+1. Estrutura de dados: Lista para armazenar os elementos
+2. Operações básicas: push, pop, top, is_empty, size, clear
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+class Pilha:
+    """
+    Classe que implementa uma pilha sem dependência de interface gráfica
+
+    Atributos:
+        items: Lista para armazenar os elementos (a base no índice 0)
+    """
+
+    def __init__(self):
+        """Inicializa uma pilha vazia"""
+        self.items = []
+
+    def __len__(self):
+        """Retorna o número de elementos na pilha"""
+        return len(self.items)
+
+    def __iter__(self):
+        """Percorre os elementos da base para o topo"""
+        return iter(self.items)
+
+    def push(self, value):
+        """Adiciona um elemento no topo da pilha"""
+        self.items.append(value)
+
+    def pop(self):
+        """Remove e retorna o elemento do topo"""
+        if not self.items:
+            raise IndexError("Pilha vazia!")
+        return self.items.pop()
+
+    def top(self):
+        """Retorna o elemento do topo sem removê-lo"""
+        if not self.items:
+            raise IndexError("Pilha vazia!")
+        return self.items[-1]
+
+    def is_empty(self):
+        """Verifica se a pilha está vazia"""
+        return len(self.items) == 0
+
+    def size(self):
+        """Retorna o número de elementos na pilha"""
+        return len(self.items)
+
+    def clear(self):
+        """Remove todos os elementos da pilha"""
+        self.items = []
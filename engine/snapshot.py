@@ -0,0 +1,316 @@
+"""
+Snapshots Binários das Estruturas (carga por mmap)
+
+Descrição:
+Grava o estado de AVLTree, BinaryTree, HashTable e OpenHashTable num formato binário
+compacto e o recarrega mapeando o arquivo na memória (mmap). Chaves numéricas de largura
+fixa (inteiros de 64 bits ou floats) ficam num vetor contíguo que é lido diretamente do
+mapeamento, por um memoryview, sem cópia nem conversão; as demais chaves são serializadas
+com pickle.
+
+Conteúdo por Estrutura:
+- AVLTree: chaves em in-order e a altura de cada nó (1 byte). Como a raiz de qualquer
+  subárvore é o nó mais alto do seu intervalo in-order, e o filho de um nó de altura h tem
+  altura h-1 ou h-2, a forma exata da árvore é recuperada sem ponteiros.
+- BinaryTree: o vetor em ordem de nível
+- HashTable / OpenHashTable: os pares (chave, valor), a capacidade e as opções da tabela
+
+Carga Preguiçosa da AVL:
+A árvore carregada começa só com a raiz. Os filhos de cada nó (MappedNode) são criados no
+primeiro acesso a left/right, localizando o nó de altura h-1 (ou h-2) no intervalo com
+uma busca de byte no mapeamento (mmap.find, em C). Abrir uma árvore de 10^7 chaves custa
+apenas o mapeamento do arquivo; uma busca materializa somente o caminho percorrido.
+
+Formato (little-endian):
+    cabeçalho | chaves (n x 8 bytes, se numéricas) | alturas (n bytes, só AVL) | metadados
+O cabeçalho traz a assinatura, a versão, o tipo da estrutura, o tipo das chaves, n, a
+posição in-order da raiz (AVL) e o tamanho dos metadados (dicionário em pickle com as
+opções da tabela, os valores e as chaves não numéricas).
+
+Observação:
+O arquivo é gravado num temporário e renomeado ao final, de modo que regravar o snapshot de
+uma árvore ainda mapeada não altera o arquivo que ela está lendo. Como o conteúdo inclui
+pickle, carregue apenas snapshots de origem confiável.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+from array import array
+import mmap
+import os
+import pickle
+import struct
+
+from .binarytree import BinaryTree
+from .percursos import iter_nodes_inorder
+from .tabelaHash import HashTable
+from .tabelaHashAberta import OpenHashTable
+from .treeavl import AVLTree, TreeNode
+
+MAGIC = b"EDSNAP"
+VERSION = 1
+HEADER = struct.Struct("<6sBBc7xQQQ")  # Assinatura, versão, tipo, chaves, n, raiz, metadados
+
+# Tipos de estrutura gravados no cabeçalho
+KINDS = {AVLTree: 1, BinaryTree: 2, HashTable: 3, OpenHashTable: 4}
+
+KEY_INT = b"q"     # Inteiros de 64 bits com sinal
+KEY_FLOAT = b"d"   # Floats de 64 bits
+KEY_PICKLE = b"p"  # Qualquer outro tipo (nos metadados)
+
+NOT_LOADED = object()  # Filho de um MappedNode ainda não criado
+
+def encode_keys(keys):
+    """
+    Escolhe a representação das chaves
+
+    Retorna:
+        Tupla (tipo, array com as chaves numéricas ou None para pickle)
+    """
+    if all(type(key) is int for key in keys):
+        try:
+            return KEY_INT, array("q", keys)
+        except OverflowError:
+            pass  # Inteiros maiores que 64 bits
+    elif all(type(key) is float for key in keys):
+        return KEY_FLOAT, array("d", keys)
+    return KEY_PICKLE, None
+
+# ================================================================
+# GRAVAÇÃO
+# ================================================================
+
+def save_snapshot(structure, path):
+    """
+    Grava o estado da estrutura num snapshot binário
+
+    Parâmetros:
+        structure: AVLTree, BinaryTree, HashTable ou OpenHashTable
+        path: Caminho do arquivo (substituído ao final da gravação)
+
+    Retorna:
+        Quantidade de chaves gravadas
+    """
+    kind = KINDS.get(type(structure))
+    if kind is None:
+        raise TypeError(f"Estrutura sem suporte a snapshots: {type(structure).__name__}")
+
+    metadata = {}
+    heights = b""
+    root = 0
+    if isinstance(structure, AVLTree):
+        if structure.multiset:
+            # As alturas e os intervalos in-order supõem um valor por nó
+            raise ValueError("AVL no modo multiconjunto não tem snapshot binário: "
+                             "use engine.arquivo")
+        keys = []
+        heights = bytearray()
+        for node in iter_nodes_inorder(structure.root):
+            if node is structure.root:
+                root = len(keys)
+            keys.append(node.value)
+            heights.append(node.height)
+    elif isinstance(structure, BinaryTree):
+        keys = structure.values
+    else:
+        keys, values = [], []
+        for key, value in structure.items():
+            keys.append(key)
+            values.append(value)
+        metadata["values"] = values
+        metadata["capacity"] = structure.capacity
+        metadata["options"] = table_options(structure)
+
+    key_code, key_array = encode_keys(keys)
+    if key_array is None:
+        metadata["keys"] = list(keys)
+    meta_bytes = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as output:
+        output.write(HEADER.pack(MAGIC, VERSION, kind, key_code, len(keys), root, len(meta_bytes)))
+        if key_array is not None:
+            output.write(key_array)
+        output.write(heights)
+        output.write(meta_bytes)
+    os.replace(temporary, path)
+    return len(keys)
+
+def table_options(table):
+    """Opções do construtor necessárias para recriar uma tabela hash"""
+    options = {
+        "capacity": table.initial_capacity,
+        "max_load_factor": table.max_load_factor,
+        "min_load_factor": table.min_load_factor,
+        "hash_strategy": table.hash_strategy,
+    }
+    if isinstance(table, HashTable):
+        options["rehash_step"] = table.rehash_step
+    return options
+
+# ================================================================
+# CARGA
+# ================================================================
+
+class SnapshotImage:
+    """
+    Snapshot mapeado na memória
+
+    Atributos:
+        mapping: Objeto mmap com o arquivo inteiro (somente leitura)
+        kind, key_code, count, root: Campos do cabeçalho
+        buffer: memoryview do mapeamento inteiro (chaves numéricas)
+        keys: Chaves (memoryview sobre o mapeamento, ou lista para chaves em pickle)
+        heights_offset: Posição das alturas no arquivo (AVL)
+        metadata: Dicionário de metadados
+    """
+
+    def __init__(self, path):
+        """Mapeia o arquivo e interpreta o cabeçalho"""
+        with open(path, "rb") as source:
+            self.mapping = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mapping) < HEADER.size:
+            raise ValueError(f"Snapshot inválido: {path}")
+        magic, version, self.kind, self.key_code, self.count, self.root, meta_length = \
+            HEADER.unpack_from(self.mapping)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Snapshot inválido ou de versão não suportada: {path}")
+
+        offset = HEADER.size
+        key_bytes = 0 if self.key_code == KEY_PICKLE else 8 * self.count
+        self.heights_offset = offset + key_bytes
+        meta_offset = self.heights_offset + (self.count if self.kind == KINDS[AVLTree] else 0)
+        self.metadata = pickle.loads(self.mapping[meta_offset:meta_offset + meta_length])
+
+        if self.key_code == KEY_PICKLE:
+            self.keys = self.metadata["keys"]
+        else:
+            # Acesso direto aos bytes do arquivo, sem cópia
+            self.buffer = memoryview(self.mapping)
+            self.keys = self.buffer[offset:offset + key_bytes].cast(self.key_code.decode())
+
+    def height(self, index):
+        """Altura gravada do nó na posição in-order"""
+        return self.mapping[self.heights_offset + index]
+
+    def child(self, lo, hi, parent_height):
+        """
+        Cria o nó raiz do intervalo in-order [lo, hi), filho de um nó de altura parent_height
+
+        Na AVL, o filho tem altura h-1 ou h-2, e a raiz é o único nó com a maior altura do
+        intervalo: basta achar o primeiro byte h-1 (ou, se não houver, h-2) nas alturas.
+
+        Retorna:
+            MappedNode, ou None para intervalo vazio
+        """
+        if lo >= hi:
+            return None
+        start, end = self.heights_offset + lo, self.heights_offset + hi
+        for height in (parent_height - 1, parent_height - 2):
+            index = self.mapping.find(bytes((height,)), start, end) if height > 0 else -1
+            if index >= 0:
+                return MappedNode(self, lo, index - self.heights_offset, hi)
+        raise ValueError("Snapshot corrompido: altura de subárvore inconsistente")
+
+    def close(self):
+        """Libera o mapeamento (só para estruturas já copiadas para a memória)"""
+        if isinstance(self.keys, memoryview):
+            self.keys.release()
+            self.buffer.release()
+        self.mapping.close()
+
+class MappedNode(TreeNode):
+    """
+    Nó de uma AVL carregada de snapshot: os filhos são criados no primeiro acesso
+
+    Atributos:
+        image: SnapshotImage de origem
+        lo, index, hi: Intervalo in-order da subárvore e a posição do próprio nó
+        left_node, right_node: Filhos já criados (NOT_LOADED até o primeiro acesso)
+    """
+    __slots__ = ("image", "lo", "index", "hi", "left_node", "right_node")
+
+    def __init__(self, image, lo, index, hi):
+        """Cria o nó da posição in-order index, cuja subárvore ocupa [lo, hi)"""
+        self.image = image
+        self.lo = lo
+        self.index = index
+        self.hi = hi
+        self.value = image.keys[index]
+        self.height = image.height(index)
+        self.size = hi - lo  # A subárvore ocupa exatamente o intervalo in-order
+        self.left_node = NOT_LOADED
+        self.right_node = NOT_LOADED
+
+    @property
+    def left(self):
+        """Filho esquerdo (criado a partir do snapshot no primeiro acesso)"""
+        if self.left_node is NOT_LOADED:
+            self.left_node = self.image.child(self.lo, self.index, self.image.height(self.index))
+        return self.left_node
+
+    @left.setter
+    def left(self, node):
+        self.left_node = node
+
+    @property
+    def right(self):
+        """Filho direito (criado a partir do snapshot no primeiro acesso)"""
+        if self.right_node is NOT_LOADED:
+            self.right_node = self.image.child(self.index + 1, self.hi,
+                                               self.image.height(self.index))
+        return self.right_node
+
+    @right.setter
+    def right(self, node):
+        self.right_node = node
+
+def load_snapshot(path, **options):
+    """
+    Carrega um snapshot gravado por save_snapshot
+
+    Parâmetros:
+        path: Caminho do arquivo
+        options: Opções que substituem as gravadas ao recriar tabelas hash
+                 (obrigatório informar hash_strategy se a original era uma função própria)
+
+    Retorna:
+        Nova estrutura com o estado gravado (AVLTree carregada sob demanda)
+    """
+    image = SnapshotImage(path)
+
+    if image.kind == KINDS[AVLTree]:
+        tree = AVLTree()
+        if image.count:
+            tree.root = MappedNode(image, 0, image.root, image.count)
+        return tree  # O mapeamento permanece aberto enquanto os nós o referenciarem
+
+    try:
+        keys = image.keys.tolist() if isinstance(image.keys, memoryview) else image.keys
+        if image.kind == KINDS[BinaryTree]:
+            tree = BinaryTree()
+            for value in keys:
+                tree.insert(value)
+            return tree
+        return load_table(image, keys, options)
+    finally:
+        image.close()
+
+def load_table(image, keys, options):
+    """Recria uma tabela hash já com a capacidade gravada (sem redimensionamentos)"""
+    table_class = HashTable if image.kind == KINDS[HashTable] else OpenHashTable
+    settings = {**image.metadata["options"], **options}
+    if settings["hash_strategy"] == "custom":
+        raise ValueError("A tabela gravada usava uma função de hash própria: informe hash_strategy")
+    table = table_class(**settings)
+
+    capacity = image.metadata["capacity"]
+    if table_class is HashTable:
+        table.capacity = capacity
+        table.table = [[] for _ in range(capacity)]
+    else:
+        table.allocate(capacity)
+    for key, value in zip(keys, image.metadata["values"]):
+        table.insert(key, value)
+    return table
@@ -0,0 +1,365 @@
+"""
+Núcleo da Tabela Hash (sem interface gráfica)
+
+Descrição:
+Implementa uma tabela hash com tratamento de colisões por encadeamento como um objeto
+Python puro, sem nenhuma dependência do Tkinter. Pode ser usada em processos de trabalho,
+servidores sem display ou pela visualização gráfica em tabelaHash.py.
+
+Componentes Principais:
+1. Estrutura de dados: Lista de listas para armazenar os buckets; cada item é guardado
+   como (hash, chave, valor), de modo que o rehash nunca recalcula o hash de uma chave
+2. Função hash plugável (parâmetro hash_strategy):
+   - "builtin": hash() nativo do Python (mais rápida; padrão)
+   - "fast": 64 bits calculados em C (CRC-32 e Adler-32 do zlib), não criptográfica e
+     estável entre processos ("fnv1a" é aceito como nome antigo)
+   - "keyed": BLAKE2b com chave secreta, para chaves não confiáveis (papel do SipHash)
+   - "sha256": SHA-256 (comportamento original, mais lento)
+   - ou qualquer função chave -> inteiro
+3. Operações básicas: insert, search, remove, clear
+4. Redimensionamento automático (crescimento e encolhimento) por fator de carga
+5. Rehash incremental: a migração dos buckets é distribuída entre as operações seguintes,
+   de modo que nenhuma inserção isolada paga o custo de um rehash completo
+
+Funcionamento do Rehash Incremental:
+Ao redimensionar, a tabela atual passa a ser a "tabela antiga" e uma nova tabela vazia é
+criada. Cada operação migra alguns buckets antigos (rehash_step) e, antes de tocar uma chave,
+migra também o bucket antigo dessa chave. Assim, insert/search/remove sempre operam somente
+sobre a tabela nova, e os índices retornados por search referem-se sempre a self.table.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+import hashlib
+import os
+import time
+import zlib
+
+MASK_64 = (1 << 64) - 1
+
+# ================================================================
+# ESTRATÉGIAS DE HASH
+# ================================================================
+
+def key_bytes(key):
+    """Converte uma chave em bytes (inteiros são tratados como texto, como no original)"""
+    if isinstance(key, bytes):
+        return key
+    return str(key).encode()
+
+def hash_builtin(key):
+    """Hash nativo do Python (SipHash com semente aleatória por processo para textos)"""
+    return hash(key) & MASK_64
+
+def hash_fast(key):
+    """
+    Hash de 64 bits não criptográfico, estável entre processos e execuções
+
+    Os bytes são percorridos em C pelo zlib: os 32 bits baixos (os que escolhem o bucket)
+    vêm do CRC-32, bem distribuído mesmo em chaves curtas, e os altos, do Adler-32.
+    """
+    data = key_bytes(key)
+    return (zlib.adler32(data) << 32) | zlib.crc32(data)
+
+def hash_sha256(key):
+    """SHA-256 completo convertido em inteiro (estratégia original da tabela)"""
+    return int(hashlib.sha256(key_bytes(key)).hexdigest(), 16)
+
+class KeyedHash:
+    """
+    Função hash com chave secreta (BLAKE2b de 64 bits)
+
+    Cumpre o papel do SipHash: sem conhecer a chave, um atacante não consegue fabricar
+    chaves que colidam no mesmo bucket. É uma classe (e não uma função aninhada) para que
+    a tabela possa ser serializada com pickle e enviada a outros processos.
+
+    Atributos:
+        secret: Chave secreta (bytes)
+    """
+
+    def __init__(self, secret):
+        """Inicializa a função com a chave secreta informada"""
+        self.secret = secret
+        self.base = hashlib.blake2b(digest_size=8, key=secret)
+
+    def __call__(self, key):
+        """Calcula o hash da chave"""
+        hasher = self.base.copy()
+        hasher.update(key_bytes(key))
+        return int.from_bytes(hasher.digest(), "little")
+
+    def __reduce__(self):
+        """Serializa apenas a chave secreta (o objeto BLAKE2b é recriado)"""
+        return (KeyedHash, (self.secret,))
+
+def make_keyed_hash(secret=None):
+    """
+    Cria uma função hash com chave secreta (BLAKE2b de 64 bits)
+
+    Parâmetros:
+        secret: Chave secreta de até 64 bytes (padrão=None, gera uma aleatória)
+    """
+    return KeyedHash(secret if secret is not None else os.urandom(16))
+
+HASH_STRATEGIES = {
+    "builtin": lambda secret: hash_builtin,
+    "fast": lambda secret: hash_fast,
+    "fnv1a": lambda secret: hash_fast,  # Nome antigo (o laço em Python era mais lento que o sha256)
+    "keyed": make_keyed_hash,
+    "sha256": lambda secret: hash_sha256,
+}
+
+def resolve_hash_strategy(strategy, secret=None):
+    """Retorna a função hash correspondente a um nome de estratégia (ou a própria função)"""
+    if callable(strategy):
+        return strategy
+    if strategy not in HASH_STRATEGIES:
+        raise ValueError(f"Estratégia de hash inválida: {strategy} "
+                         f"(use {', '.join(HASH_STRATEGIES)} ou uma função)")
+    return HASH_STRATEGIES[strategy](secret)
+
+class HashTable:
+    """
+    Classe que implementa uma tabela hash sem dependência de interface gráfica
+
+    Atributos:
+        capacity: Capacidade atual da tabela (número de buckets)
+        table: Estrutura de dados para armazenar os itens (listas de (hash, chave, valor))
+        hash_strategy: Nome da estratégia de hash (ou "custom" para funções próprias)
+        hash_key: Função que calcula o hash completo (inteiro) de uma chave
+        count: Número de itens armazenados
+        initial_capacity: Capacidade mínima (a tabela nunca encolhe abaixo dela)
+        max_load_factor: Fator de carga que dispara o crescimento
+        min_load_factor: Fator de carga que dispara o encolhimento
+        rehash_step: Buckets antigos migrados por operação durante um rehash
+        old_table: Buckets ainda não migrados (None fora de um rehash)
+        old_capacity: Capacidade da tabela antiga
+        rehash_index: Próximo bucket antigo a migrar
+        resize_count: Quantidade de redimensionamentos realizados
+        resize_time: Tempo total (s) gasto em redimensionamentos e migrações
+    """
+
+    def __init__(self, capacity=10, max_load_factor=0.75, min_load_factor=0.1, rehash_step=4,
+                 hash_strategy="builtin", hash_secret=None):
+        """
+        Inicializa uma tabela hash vazia
+
+        Parâmetros:
+            capacity: Capacidade inicial da tabela hash (padrão=10)
+            max_load_factor: Fator de carga máximo antes de crescer (padrão=0.75)
+            min_load_factor: Fator de carga mínimo antes de encolher (padrão=0.1)
+            rehash_step: Buckets migrados por operação durante o rehash (padrão=4)
+            hash_strategy: "builtin" (padrão), "fast", "keyed", "sha256" ou uma função
+            hash_secret: Chave secreta da estratégia "keyed" (padrão=None, aleatória)
+        """
+        if capacity < 1:
+            raise ValueError("A capacidade deve ser pelo menos 1")
+        if not 0 <= min_load_factor < max_load_factor / 2:
+            raise ValueError("min_load_factor deve ser menor que metade de max_load_factor")
+        if rehash_step < 1:
+            raise ValueError("rehash_step deve ser pelo menos 1")
+
+        self.hash_key = resolve_hash_strategy(hash_strategy, hash_secret)
+        self.hash_strategy = hash_strategy if isinstance(hash_strategy, str) else "custom"
+        self.initial_capacity = capacity
+        self.capacity = capacity
+        self.table = [[] for _ in range(capacity)]  # Tabela vazia
+        self.count = 0
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.rehash_step = rehash_step
+
+        # Estado do rehash incremental
+        self.old_table = None
+        self.old_capacity = 0
+        self.rehash_index = 0
+
+        # Estatísticas de redimensionamento
+        self.resize_count = 0
+        self.resize_time = 0.0
+
+    def __len__(self):
+        """Retorna o número de itens armazenados"""
+        return self.count
+
+    def hash_function(self, key):
+        """
+        Calcula o índice do bucket para uma chave usando a estratégia de hash configurada
+
+        Parâmetros:
+            key: Chave a ser hasheada (string ou inteiro)
+
+        Retorna:
+            Índice do bucket (0 a capacidade-1)
+        """
+        # Calcula o hash completo e aplica módulo pela capacidade
+        return self.hash_key(key) % self.capacity
+
+    # ================================================================
+    # OPERAÇÕES DA TABELA HASH
+    # ================================================================
+
+    def insert(self, key, value):
+        """
+        Insere um par chave-valor na tabela
+
+        Parâmetros:
+            key: Chave do item
+            value: Valor associado à chave
+
+        Observação:
+            Se a chave já existe, atualiza o valor
+        """
+        key_hash, index = self.prepare(key)
+        bucket = self.table[index]
+        # Verifica se chave já existe no bucket (compara o hash guardado antes da chave)
+        for i, (h, k, v) in enumerate(bucket):
+            if h == key_hash and k == key:
+                # Atualiza valor existente
+                bucket[i] = (key_hash, key, value)
+                return
+        # Adiciona novo item no final do bucket
+        bucket.append((key_hash, key, value))
+        self.count += 1
+        if self.count > self.max_load_factor * self.capacity:
+            self.start_resize(self.capacity * 2)
+
+    def search(self, key):
+        """
+        Busca uma chave na tabela
+
+        Parâmetros:
+            key: Chave a ser buscada
+
+        Retorna:
+            (valor, índice_bucket, índice_item) se encontrado
+            (None, -1, -1) se não encontrado
+        """
+        key_hash, index = self.prepare(key)
+        for i, (h, k, v) in enumerate(self.table[index]):
+            if h == key_hash and k == key:
+                return v, index, i
+        return None, -1, -1
+
+    def remove(self, key):
+        """
+        Remove uma chave da tabela
+
+        Parâmetros:
+            key: Chave a ser removida
+
+        Retorna:
+            True se a chave foi removida, False se não foi encontrada
+        """
+        key_hash, index = self.prepare(key)
+        bucket = self.table[index]
+        for i, (h, k, v) in enumerate(bucket):
+            if h == key_hash and k == key:
+                del bucket[i]  # Remove o item
+                self.count -= 1
+                if (self.capacity > self.initial_capacity
+                        and self.count < self.min_load_factor * self.capacity):
+                    self.start_resize(max(self.initial_capacity, self.capacity // 2))
+                return True
+        return False
+
+    def clear(self):
+        """Remove todos os itens da tabela (volta à capacidade inicial)"""
+        self.capacity = self.initial_capacity
+        self.table = [[] for _ in range(self.capacity)]
+        self.count = 0
+        self.old_table = None
+        self.old_capacity = 0
+        self.rehash_index = 0
+
+    def items(self):
+        """Percorre todos os pares (chave, valor) armazenados"""
+        if self.old_table is not None:
+            for bucket in self.old_table[self.rehash_index:]:
+                for key_hash, key, value in bucket:
+                    yield key, value
+        for bucket in self.table:
+            for key_hash, key, value in bucket:
+                yield key, value
+
+    # ================================================================
+    # REDIMENSIONAMENTO E REHASH INCREMENTAL
+    # ================================================================
+
+    def prepare(self, key):
+        """
+        Avança o rehash incremental e garante que o bucket antigo da chave já foi migrado
+
+        Retorna:
+            (hash da chave, índice do bucket da chave na tabela atual)
+        """
+        key_hash = self.hash_key(key)
+        if self.old_table is not None:
+            started = time.perf_counter()
+            self.migrate_bucket(key_hash % self.old_capacity)
+            self.rehash_steps(self.rehash_step)
+            self.resize_time += time.perf_counter() - started
+        return key_hash, key_hash % self.capacity
+
+    def start_resize(self, new_capacity):
+        """Inicia a migração para uma tabela com a nova capacidade"""
+        if self.old_table is not None or new_capacity == self.capacity:
+            return  # Um redimensionamento por vez: o próximo é avaliado após o atual
+        started = time.perf_counter()
+        self.old_table = self.table
+        self.old_capacity = self.capacity
+        self.rehash_index = 0
+        self.capacity = new_capacity
+        self.table = [[] for _ in range(new_capacity)]
+        self.resize_count += 1
+        self.resize_time += time.perf_counter() - started
+
+    def migrate_bucket(self, old_index):
+        """Move todos os itens de um bucket antigo para a tabela atual (usando o hash guardado)"""
+        bucket = self.old_table[old_index]
+        if not bucket:
+            return
+        table = self.table
+        capacity = self.capacity
+        for entry in bucket:
+            table[entry[0] % capacity].append(entry)
+        self.old_table[old_index] = []
+
+    def rehash_steps(self, steps):
+        """Migra até 'steps' buckets antigos e encerra o rehash quando todos foram migrados"""
+        end = min(self.old_capacity, self.rehash_index + steps)
+        for old_index in range(self.rehash_index, end):
+            self.migrate_bucket(old_index)
+        self.rehash_index = end
+        if self.rehash_index >= self.old_capacity:
+            self.old_table = None
+            self.old_capacity = 0
+            self.rehash_index = 0
+
+    def finish_rehash(self):
+        """Conclui imediatamente qualquer rehash em andamento"""
+        if self.old_table is not None:
+            started = time.perf_counter()
+            self.rehash_steps(self.old_capacity)
+            self.resize_time += time.perf_counter() - started
+
+    def is_rehashing(self):
+        """Verifica se há um rehash incremental em andamento"""
+        return self.old_table is not None
+
+    def load_factor(self):
+        """Retorna o fator de carga atual (itens / buckets)"""
+        return self.count / self.capacity
+
+    def stats(self):
+        """Retorna um dicionário com as estatísticas de ocupação e redimensionamento"""
+        return {
+            "capacity": self.capacity,
+            "size": self.count,
+            "load_factor": self.load_factor(),
+            "resizes": self.resize_count,
+            "resize_time": self.resize_time,
+            "rehashing": self.is_rehashing(),
+            "hash_strategy": self.hash_strategy,
+        }
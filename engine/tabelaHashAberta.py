@@ -0,0 +1,275 @@
+"""
+Núcleo da Tabela Hash com Endereçamento Aberto (sem interface gráfica)
+
+Descrição:
+Variante da tabela hash que guarda os itens diretamente em vetores paralelos (hashes,
+chaves e valores), sem listas por bucket. As colisões são resolvidas por sondagem linear
+com deslocamento Robin Hood, e a remoção usa deslocamento para trás (backward shift), de
+modo que a tabela nunca acumula lápides (tombstones). Expõe a mesma API de
+engine.HashTable (insert, search, remove, clear, items, stats).
+
+Componentes Principais:
+1. hashes: array('Q') com o hash de 64 bits de cada slot (0 indica slot vazio)
+2. keys / values: listas paralelas com a chave e o valor de cada slot
+3. Robin Hood: ao inserir, um item "pobre" (mais longe do seu slot ideal) toma o lugar de
+   um item "rico", mantendo as distâncias de sondagem curtas e uniformes
+4. Redimensionamento por fator de carga (capacidade sempre potência de 2), reaproveitando
+   os hashes guardados
+5. Estratégias de hash compartilhadas com engine.HashTable
+
+Comparação com engine.HashTable:
+Sem uma lista e uma tupla por item, cada entrada custa apenas um inteiro de 8 bytes no
+vetor de hashes e dois ponteiros, e uma busca percorre posições contíguas dos vetores em
+vez de seguir ponteiros bucket -> lista -> tupla.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+from array import array
+import time
+
+from .tabelaHash import MASK_64, resolve_hash_strategy
+
+EMPTY = 0  # Valor de hash que marca um slot vazio
+
+class OpenHashTable:
+    """
+    Classe que implementa uma tabela hash com endereçamento aberto (Robin Hood)
+
+    Atributos:
+        capacity: Número de slots (sempre potência de 2)
+        mask: capacity - 1, usado no lugar do módulo
+        hashes: Hash de 64 bits de cada slot (EMPTY para slot vazio)
+        keys: Chave de cada slot
+        values: Valor de cada slot
+        count: Número de itens armazenados
+        initial_capacity: Capacidade mínima (a tabela nunca encolhe abaixo dela)
+        max_load_factor: Fator de carga que dispara o crescimento
+        min_load_factor: Fator de carga que dispara o encolhimento
+        hash_strategy: Nome da estratégia de hash (ou "custom" para funções próprias)
+        hash_key: Função que calcula o hash completo (inteiro) de uma chave
+        resize_count: Quantidade de redimensionamentos realizados
+        resize_time: Tempo total (s) gasto em redimensionamentos
+    """
+
+    def __init__(self, capacity=16, max_load_factor=0.85, min_load_factor=0.2,
+                 hash_strategy="builtin", hash_secret=None):
+        """
+        Inicializa uma tabela vazia
+
+        Parâmetros:
+            capacity: Capacidade inicial (arredondada para potência de 2, padrão=16)
+            max_load_factor: Fator de carga máximo antes de crescer (padrão=0.85)
+            min_load_factor: Fator de carga mínimo antes de encolher (padrão=0.2)
+            hash_strategy: "builtin" (padrão), "fast", "keyed", "sha256" ou uma função
+            hash_secret: Chave secreta da estratégia "keyed" (padrão=None, aleatória)
+        """
+        if capacity < 1:
+            raise ValueError("A capacidade deve ser pelo menos 1")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor deve estar entre 0 e 1")
+        if not 0 <= min_load_factor < max_load_factor / 2:
+            raise ValueError("min_load_factor deve ser menor que metade de max_load_factor")
+
+        self.hash_key = resolve_hash_strategy(hash_strategy, hash_secret)
+        self.hash_strategy = hash_strategy if isinstance(hash_strategy, str) else "custom"
+        self.initial_capacity = 1 << (capacity - 1).bit_length()
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.resize_count = 0
+        self.resize_time = 0.0
+        self.allocate(self.initial_capacity)
+
+    def __len__(self):
+        """Retorna o número de itens armazenados"""
+        return self.count
+
+    def allocate(self, capacity):
+        """Cria vetores vazios com a capacidade informada"""
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.hashes = array("Q", bytes(8 * capacity))
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+        self.count = 0
+
+    def hash_of(self, key):
+        """Calcula o hash de 64 bits de uma chave (nunca EMPTY)"""
+        return (self.hash_key(key) & MASK_64) or 1
+
+    def probe_distance(self, slot):
+        """Retorna a distância entre um slot ocupado e o slot ideal do seu item"""
+        return (slot - self.hashes[slot]) & self.mask
+
+    # ================================================================
+    # OPERAÇÕES DA TABELA HASH
+    # ================================================================
+
+    def insert(self, key, value):
+        """
+        Insere um par chave-valor na tabela
+
+        Parâmetros:
+            key: Chave do item
+            value: Valor associado à chave
+
+        Observação:
+            Se a chave já existe, atualiza o valor
+        """
+        key_hash = self.hash_of(key)
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        slot = key_hash & mask
+        distance = 0
+        while True:
+            slot_hash = hashes[slot]
+            if slot_hash == EMPTY:
+                break
+            if slot_hash == key_hash and keys[slot] == key:
+                values[slot] = value  # Atualiza valor existente
+                return
+            slot_distance = (slot - slot_hash) & mask
+            if slot_distance < distance:
+                # Invariante Robin Hood: a chave não pode estar adiante; o item atual
+                # ocupa este slot e o item deslocado segue procurando lugar
+                key_hash, hashes[slot] = slot_hash, key_hash
+                key, keys[slot] = keys[slot], key
+                value, values[slot] = values[slot], value
+                distance = slot_distance
+            slot = (slot + 1) & mask
+            distance += 1
+
+        hashes[slot] = key_hash
+        keys[slot] = key
+        values[slot] = value
+        self.count += 1
+        if self.count > self.max_load_factor * self.capacity:
+            self.resize(self.capacity * 2)
+
+    def find_slot(self, key):
+        """Retorna o slot que contém a chave, ou -1 se ela não estiver na tabela"""
+        key_hash = (self.hash_key(key) & MASK_64) or 1  # Mesmo cálculo de hash_of, sem a chamada extra
+        hashes, keys, mask = self.hashes, self.keys, self.mask
+        slot = key_hash & mask
+        distance = 0
+        while True:
+            slot_hash = hashes[slot]
+            # Um slot vazio ou um item mais próximo do ideal encerra a busca (Robin Hood)
+            if slot_hash == EMPTY or ((slot - slot_hash) & mask) < distance:
+                return -1
+            if slot_hash == key_hash and keys[slot] == key:
+                return slot
+            slot = (slot + 1) & mask
+            distance += 1
+
+    def search(self, key):
+        """
+        Busca uma chave na tabela
+
+        Parâmetros:
+            key: Chave a ser buscada
+
+        Retorna:
+            (valor, índice_slot, 0) se encontrado
+            (None, -1, -1) se não encontrado
+        """
+        slot = self.find_slot(key)
+        if slot < 0:
+            return None, -1, -1
+        return self.values[slot], slot, 0
+
+    def remove(self, key):
+        """
+        Remove uma chave da tabela (deslocamento para trás, sem lápides)
+
+        Parâmetros:
+            key: Chave a ser removida
+
+        Retorna:
+            True se a chave foi removida, False se não foi encontrada
+        """
+        slot = self.find_slot(key)
+        if slot < 0:
+            return False
+
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        # Puxa para trás os itens seguintes que não estão no seu slot ideal
+        following = (slot + 1) & mask
+        while hashes[following] != EMPTY and ((following - hashes[following]) & mask) > 0:
+            hashes[slot] = hashes[following]
+            keys[slot] = keys[following]
+            values[slot] = values[following]
+            slot = following
+            following = (following + 1) & mask
+        hashes[slot] = EMPTY
+        keys[slot] = None
+        values[slot] = None
+
+        self.count -= 1
+        if (self.capacity > self.initial_capacity
+                and self.count < self.min_load_factor * self.capacity):
+            self.resize(max(self.initial_capacity, self.capacity // 2))
+        return True
+
+    def clear(self):
+        """Remove todos os itens da tabela (volta à capacidade inicial)"""
+        self.allocate(self.initial_capacity)
+
+    def items(self):
+        """Percorre todos os pares (chave, valor) armazenados"""
+        for slot in range(self.capacity):
+            if self.hashes[slot] != EMPTY:
+                yield self.keys[slot], self.values[slot]
+
+    # ================================================================
+    # REDIMENSIONAMENTO
+    # ================================================================
+
+    def resize(self, new_capacity):
+        """Realoca os vetores e reinsere os itens usando os hashes guardados"""
+        started = time.perf_counter()
+        old_entries = [(self.hashes[slot], self.keys[slot], self.values[slot])
+                       for slot in range(self.capacity) if self.hashes[slot] != EMPTY]
+        self.allocate(new_capacity)
+        hashes, keys, values, mask = self.hashes, self.keys, self.values, self.mask
+        for key_hash, key, value in old_entries:
+            slot = key_hash & mask
+            distance = 0
+            while hashes[slot] != EMPTY:
+                slot_distance = (slot - hashes[slot]) & mask
+                if slot_distance < distance:
+                    key_hash, hashes[slot] = hashes[slot], key_hash
+                    key, keys[slot] = keys[slot], key
+                    value, values[slot] = values[slot], value
+                    distance = slot_distance
+                slot = (slot + 1) & mask
+                distance += 1
+            hashes[slot] = key_hash
+            keys[slot] = key
+            values[slot] = value
+        self.count = len(old_entries)
+        self.resize_count += 1
+        self.resize_time += time.perf_counter() - started
+
+    def finish_rehash(self):
+        """Compatibilidade com engine.HashTable (o redimensionamento aqui é imediato)"""
+
+    def is_rehashing(self):
+        """Compatibilidade com engine.HashTable (nunca há rehash pendente)"""
+        return False
+
+    def load_factor(self):
+        """Retorna o fator de carga atual (itens / slots)"""
+        return self.count / self.capacity
+
+    def stats(self):
+        """Retorna um dicionário com as estatísticas de ocupação e redimensionamento"""
+        return {
+            "capacity": self.capacity,
+            "size": self.count,
+            "load_factor": self.load_factor(),
+            "resizes": self.resize_count,
+            "resize_time": self.resize_time,
+            "rehashing": False,
+            "hash_strategy": self.hash_strategy,
+        }
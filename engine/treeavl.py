@@ -0,0 +1,990 @@
+"""
+Núcleo da Árvore AVL (sem interface gráfica)
+
+Descrição:
+Implementa uma árvore AVL (árvore binária de busca balanceada) como objetos Python puros,
+sem nenhuma dependência do Tkinter. Pode ser usada em processos de trabalho, servidores sem
+display ou pela visualização gráfica em treeavl.py.
+
+Componentes Principais:
+1. Classe TreeNode: Representa um nó da árvore
+2. Classe AVLTree: Inserção, remoção, busca e percursos
+3. Operações de rotação para balanceamento; inserção, remoção e busca iterativas (pilha
+   explícita com o caminho, rebalanceando só enquanto a altura da subárvore muda)
+4. Percursos por geradores iterativos (sem recursão nem listas intermediárias)
+5. Carga e mescla em lote em O(n), gerando uma árvore perfeitamente balanceada
+   (load_sorted monta a árvore direto de um fluxo ordenado, sem lista intermediária)
+6. Estatísticas de ordem: cada nó guarda o tamanho da sua subárvore, o que permite rank,
+   select, count_range e range em O(log n) (mais k valores produzidos, no range)
+7. Divisão e junção (split, join) em O(log n), e delete_range, que remove um intervalo
+   inteiro de valores com duas divisões e uma junção
+8. Modo persistente (cópia de caminho): snapshot() retorna em O(1) uma versão imutável, e
+   as alterações seguintes copiam só os O(log n) nós do caminho, compartilhando o resto.
+   A classe AVLHistory guarda essas versões para voltar e avançar entre operações
+9. Modo multiconjunto: valores repetidos ficam num único nó com contagem (e um payload
+   opcional); inserir ou remover uma cópia só mexe na estrutura quando a contagem passa
+   de 0 para 1 ou de 1 para 0
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+import heapq
+from itertools import count, groupby, islice, repeat
+from operator import itemgetter
+
+from .percursos import (iter_inorder, iter_preorder, iter_postorder, iter_levelorder,
+                        iter_nodes_inorder)
+
+EPOCHS = count(1)  # Gerações das árvores persistentes (únicas entre todas as árvores)
+STREAM_END = object()  # Marca o fim do fluxo em load_sorted
+
+def is_sorted(values):
+    """Verifica em O(n) se uma lista já está em ordem não decrescente"""
+    return all(a <= b for a, b in zip(values, islice(values, 1, None)))
+
+def count_runs(items):
+    """
+    Junta os valores iguais de uma sequência ordenada de trincas (valor, contagem, payload)
+
+    As contagens são somadas e fica o primeiro payload diferente de None.
+
+    Retorna:
+        Lista de trincas com valores distintos, em ordem
+    """
+    runs = []
+    for value, group in groupby(items, key=itemgetter(0)):
+        copies, payload = 0, None
+        for _, run_copies, run_payload in group:
+            copies += run_copies
+            if payload is None:
+                payload = run_payload
+        runs.append((value, copies, payload))
+    return runs
+
+class TreeNode:
+    """
+    Classe que representa um nó da árvore AVL
+
+    Com __slots__, o nó não tem __dict__: guarda só os cinco campos abaixo. As posições
+    de desenho ficam no layout da visualização (render.TidyLayout), não no nó.
+    """
+    __slots__ = ("value", "left", "right", "height", "size")
+    count = 1       # Cópias do valor (só os nós do modo multiconjunto guardam outra)
+    payload = None  # Dado associado ao valor (modo multiconjunto)
+
+    def __init__(self, value):
+        """
+        Inicializa um novo nó
+
+        Parâmetros:
+            value: Valor a ser armazenado no nó
+
+        Atributos:
+            value: Valor do nó
+            left: Filho esquerdo
+            right: Filho direito
+            height: Altura do nó na árvore
+            size: Número de valores da subárvore (o próprio nó incluído, com as cópias)
+        """
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1  # Altura inicial do nó
+        self.size = 1    # Subárvore só com o próprio nó
+
+    def __str__(self):
+        """Retorna representação string do nó"""
+        return str(self.value)
+
+class CountedNode(TreeNode):
+    """Nó do modo multiconjunto: guarda quantas cópias do valor existem e um payload"""
+    __slots__ = ("count", "payload")
+
+    def __init__(self, value):
+        """Inicializa um nó com uma cópia do valor e sem payload"""
+        super().__init__(value)
+        self.count = 1
+        self.payload = None
+
+class PersistentNode(TreeNode):
+    """
+    Nó criado por uma árvore no modo persistente
+
+    Guarda a geração (epoch) da árvore que o criou: só essa árvore, e só até o próximo
+    snapshot, pode alterá-lo no lugar. Qualquer outro nó (TreeNode comum, de geração
+    anterior ou de outra árvore) pode estar compartilhado com alguma versão e é copiado
+    antes de ser alterado.
+    """
+    __slots__ = ("epoch",)
+
+class PersistentCountedNode(CountedNode):
+    """Nó do modo multiconjunto criado por uma árvore persistente (ver PersistentNode)"""
+    __slots__ = ("epoch",)
+
+class AVLTree:
+    """
+    Classe que implementa a árvore AVL sem dependência de interface gráfica
+
+    Atributos:
+        root: Raiz da árvore
+        touched: Conjunto opcional que acumula os nós cujas subárvores mudaram (com todos
+                 os seus ancestrais); usado pelo layout incremental da interface gráfica
+        epoch: Geração atual no modo persistente (None fora dele)
+        multiset: Se valores repetidos ficam num só nó, com contagem e payload
+    """
+
+    def __init__(self, persistent=False, multiset=False):
+        """
+        Inicializa uma árvore vazia
+
+        Parâmetros:
+            persistent: Se True, as alterações copiam o caminho em vez de alterar nós que
+                        possam estar compartilhados com snapshots (o primeiro snapshot()
+                        também liga o modo)
+            multiset: Se True, um valor repetido incrementa a contagem do nó existente em
+                      vez de criar outro nó. Tamanhos, rank, select e percursos contam as
+                      cópias, como se cada uma fosse um nó
+        """
+        self.root = None
+        self.touched = None
+        self.epoch = next(EPOCHS) if persistent else None
+        self.multiset = multiset
+
+    def __len__(self):
+        """Retorna o número de valores da árvore (com as cópias), em O(1)"""
+        return self.get_size(self.root)
+
+    def size(self):
+        """Retorna o número de valores da árvore (com as cópias), em O(1)"""
+        return self.get_size(self.root)
+
+    # ================================================================
+    # MODO PERSISTENTE (CÓPIA DE CAMINHO)
+    # ================================================================
+
+    def snapshot(self):
+        """
+        Retorna em O(1) uma versão imutável da árvore no estado atual
+
+        A versão compartilha todos os nós com esta árvore. Para preservá-la, esta árvore
+        passa a uma nova geração: os nós existentes ficam congelados, e cada inserção ou
+        remoção seguinte copia só os O(log n) nós do caminho alterado. Leitores podem
+        percorrer a versão em outras threads, sem travas, enquanto esta árvore é alterada.
+
+        Retorna:
+            Nova AVLTree (também persistente) com a mesma raiz
+        """
+        version = AVLTree(persistent=True, multiset=self.multiset)
+        version.root = self.root
+        self.epoch = next(EPOCHS)  # Liga o modo persistente e congela os nós atuais
+        return version
+
+    def new_node(self, value):
+        """Cria um nó folha do tipo do modo da árvore (da geração atual, se persistente)"""
+        if self.epoch is None:
+            return CountedNode(value) if self.multiset else TreeNode(value)
+        node = PersistentCountedNode(value) if self.multiset else PersistentNode(value)
+        node.epoch = self.epoch
+        return node
+
+    def writable(self, node):
+        """
+        Retorna o nó pronto para ser alterado
+
+        Fora do modo persistente, é o próprio nó. No modo persistente, um nó que não é da
+        geração atual pode estar numa versão anterior e é substituído por uma cópia; quem
+        chama deve religar a cópia no lugar do original.
+        """
+        epoch = self.epoch
+        if epoch is None or getattr(node, "epoch", None) == epoch:
+            return node
+        if self.multiset:
+            copy = PersistentCountedNode(node.value)
+            copy.count, copy.payload = node.count, node.payload
+        else:
+            copy = PersistentNode(node.value)
+        copy.epoch = epoch
+        copy.left, copy.right = node.left, node.right
+        copy.height, copy.size = node.height, node.size
+        return copy
+
+    def copy_path(self, path):
+        """
+        Troca os nós compartilhados do caminho (da raiz para baixo) por cópias religadas
+
+        Parâmetros:
+            path: Nós da raiz até o ponto de alteração (atualizado no lugar)
+        """
+        parent = None
+        for depth, node in enumerate(path):
+            copy = self.writable(node)
+            if copy is not node:
+                if parent is None:
+                    self.root = copy
+                elif parent.left is node:
+                    parent.left = copy
+                else:
+                    parent.right = copy
+                path[depth] = copy
+            parent = copy
+
+    # ================================================================
+    # OPERAÇÕES BÁSICAS DA AVL
+    # ================================================================
+
+    def get_height(self, node):
+        """Retorna a altura de um nó (0 para nós nulos)"""
+        return node.height if node else 0
+
+    def get_size(self, node):
+        """Retorna o tamanho da subárvore de um nó (0 para nós nulos)"""
+        return node.size if node else 0
+
+    def get_balance(self, node):
+        """Calcula o fator de balanceamento do nó"""
+        return self.get_height(node.left) - self.get_height(node.right) if node else 0
+
+    def update_height(self, node):
+        """
+        Atualiza a altura e o tamanho da subárvore de um nó com base nos filhos
+
+        Todo nó cujos filhos mudam (no caminho de uma inserção/remoção ou numa rotação)
+        passa por aqui, por isso é também onde os nós alterados são registrados.
+        """
+        if node:
+            left, right = node.left, node.right
+            node.height = 1 + max(self.get_height(left), self.get_height(right))
+            node.size = node.count + self.get_size(left) + self.get_size(right)
+            if self.touched is not None:
+                self.touched.add(node)
+
+    def rotate_right(self, z):
+        """Rotação simples à direita"""
+        z = self.writable(z)
+        y = self.writable(z.left)  # Na remoção, o filho pode estar fora do caminho copiado
+        T3 = y.right
+
+        # Realiza a rotação
+        y.right = z
+        z.left = T3
+
+        # Atualiza alturas
+        self.update_height(z)
+        self.update_height(y)
+
+        return y  # Nova raiz da subárvore
+
+    def rotate_left(self, z):
+        """Rotação simples à esquerda"""
+        z = self.writable(z)
+        y = self.writable(z.right)  # Na remoção, o filho pode estar fora do caminho copiado
+        T2 = y.left
+
+        # Realiza a rotação
+        y.left = z
+        z.right = T2
+
+        # Atualiza alturas
+        self.update_height(z)
+        self.update_height(y)
+
+        return y  # Nova raiz da subárvore
+
+    def balance_node(self, node):
+        """Aplica rotações para balancear o nó se necessário"""
+        if not node:
+            return node
+
+        # Atualiza altura e calcula balanceamento
+        self.update_height(node)
+        balance = self.get_balance(node)
+
+        # Casos de desbalanceamento e rotações correspondentes
+        # Caso Left Left
+        if balance > 1 and self.get_balance(node.left) >= 0:
+            return self.rotate_right(node)
+
+        # Caso Right Right
+        if balance < -1 and self.get_balance(node.right) <= 0:
+            return self.rotate_left(node)
+
+        # Caso Left Right
+        if balance > 1 and self.get_balance(node.left) < 0:
+            node.left = self.rotate_left(node.left)
+            return self.rotate_right(node)
+
+        # Caso Right Left
+        if balance < -1 and self.get_balance(node.right) > 0:
+            node.right = self.rotate_right(node.right)
+            return self.rotate_left(node)
+
+        return node  # Nó já balanceado
+
+    # ================================================================
+    # OPERAÇÕES DA ÁRVORE
+    # ================================================================
+
+    def insert(self, value, payload=None):
+        """
+        Insere um valor na árvore e rebalanceia, sem recursão
+
+        A descida guarda o caminho numa pilha explícita; na volta, os nós são rebalanceados
+        só enquanto a altura da subárvore muda. Depois disso, os ancestrais restantes
+        apenas ganham um nó no tamanho (e são registrados em touched).
+
+        No modo multiconjunto, um valor que já existe só incrementa a contagem do nó (e o
+        tamanho dos ancestrais), sem criar nó nem rotacionar.
+
+        Parâmetros:
+            value: Valor a inserir
+            payload: Dado associado ao valor (só no modo multiconjunto; se informado,
+                     substitui o do nó existente)
+        """
+        multiset = self.multiset
+        if payload is not None and not multiset:
+            raise ValueError("Payload só é guardado no modo multiconjunto (multiset=True)")
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            if multiset and value == node.value:
+                # Valor repetido: a forma da árvore não muda
+                if self.epoch is not None:
+                    self.copy_path(path)
+                node = path[-1]
+                node.count += 1
+                if payload is not None:
+                    node.payload = payload
+                self.adjust_sizes(path, 1)
+                return
+            node = node.left if value < node.value else node.right
+
+        leaf = self.new_node(value)
+        if payload is not None:
+            leaf.payload = payload
+        if not path:
+            self.root = leaf
+            return
+        if self.epoch is not None:
+            self.copy_path(path)
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = leaf
+        else:
+            parent.right = leaf
+        self.retrace(path, 1)
+
+    def delete(self, value):
+        """
+        Remove um valor da árvore (se existir) e rebalanceia, sem recursão
+
+        Um nó com dois filhos recebe o valor do sucessor in-order, e é o sucessor (que
+        não tem filho esquerdo) que sai da árvore. No modo multiconjunto, remove uma cópia:
+        o nó só sai da árvore quando a contagem chega a zero.
+
+        Retorna:
+            True se removeu, False se o valor não foi encontrado
+        """
+        path = []
+        node = self.root
+        while node and value != node.value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if not node:
+            return False
+
+        if node.count > 1:
+            # Ainda restam cópias: só a contagem e os tamanhos mudam
+            path.append(node)
+            if self.epoch is not None:
+                self.copy_path(path)
+            path[-1].count -= 1
+            self.adjust_sizes(path, -1)
+            return True
+
+        target = None
+        if node.left and node.right:
+            # Nó com dois filhos: o sucessor é o menor da subárvore direita
+            target = len(path)
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node = successor
+
+        # Agora o nó tem no máximo um filho, que toma o seu lugar
+        child = node.left or node.right
+        if not path:
+            self.root = child
+            return True
+        if self.epoch is not None:
+            self.copy_path(path)  # O nó removido só é desligado, não precisa de cópia
+        if target is not None:
+            keeper = path[target]
+            keeper.value = node.value
+            if self.multiset:
+                keeper.count, keeper.payload = node.count, node.payload
+                # Entre os dois, as subárvores perdem todas as cópias do sucessor, que sobe
+                for ancestor in path[target + 1:]:
+                    ancestor.size -= node.count - 1
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self.retrace(path, -1)
+        return True
+
+    def retrace(self, path, delta):
+        """
+        Refaz, de baixo para cima, alturas, tamanhos e balanceamento do caminho alterado
+
+        Parâmetros:
+            path: Nós da raiz até o pai do ponto de inserção/remoção
+            delta: Variação do número de nós (+1 na inserção, -1 na remoção)
+        """
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = node.height
+            subtree = self.balance_node(node)
+            if subtree is not node:
+                # Rotação: religa a nova raiz da subárvore ao pai
+                if depth == 0:
+                    self.root = subtree
+                elif path[depth - 1].left is node:
+                    path[depth - 1].left = subtree
+                else:
+                    path[depth - 1].right = subtree
+            if subtree.height == old_height:
+                # Altura estável: os ancestrais não precisam de rebalanceamento
+                self.adjust_sizes(path[:depth], delta)
+                return
+
+    def adjust_sizes(self, nodes, delta):
+        """Soma delta ao tamanho das subárvores dos nós, sem mudar a forma (registra em touched)"""
+        touched = self.touched
+        for node in nodes:
+            node.size += delta
+            if touched is not None:
+                touched.add(node)
+
+    def search(self, value):
+        """Busca um valor na árvore e retorna o nó correspondente (ou None), sem recursão"""
+        node = self.root
+        while node and value != node.value:
+            node = node.left if value < node.value else node.right
+        return node
+
+    def clear(self):
+        """Remove todos os nós da árvore"""
+        self.root = None
+
+    def get_min_node(self, node):
+        """Obtém o nó com menor valor na subárvore"""
+        current = node
+        while current.left:
+            current = current.left
+        return current
+
+    # ================================================================
+    # ESTATÍSTICAS DE ORDEM
+    # ================================================================
+
+    def rank(self, value):
+        """
+        Conta os valores menores que value, em O(log n)
+
+        Retorna:
+            Quantidade de valores estritamente menores (a posição de value em in-order)
+        """
+        total = 0
+        node = self.root
+        while node:
+            if value <= node.value:
+                node = node.left
+            else:
+                # O nó (com as cópias) e toda a sua subárvore esquerda são menores
+                total += self.get_size(node.left) + node.count
+                node = node.right
+        return total
+
+    def count_at_most(self, value):
+        """Conta os valores menores ou iguais a value, em O(log n)"""
+        total = 0
+        node = self.root
+        while node:
+            if value < node.value:
+                node = node.left
+            else:
+                total += self.get_size(node.left) + node.count
+                node = node.right
+        return total
+
+    def count(self, value):
+        """Conta as cópias de value na árvore (a contagem do nó no modo multiconjunto)"""
+        return self.count_at_most(value) - self.rank(value)
+
+    def select(self, k):
+        """
+        Retorna o k-ésimo menor valor (k a partir de 0), em O(log n)
+
+        Valores negativos contam a partir do fim, como nos índices de lista.
+        """
+        if k < 0:
+            k += self.get_size(self.root)
+        if not 0 <= k < self.get_size(self.root):
+            raise IndexError("Posição fora da árvore")
+        node = self.root
+        while True:
+            left_size = self.get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k < left_size + node.count:
+                return node.value
+            else:
+                k -= left_size + node.count
+                node = node.right
+
+    def count_range(self, low, high):
+        """Conta os valores v com low <= v <= high, em O(log n)"""
+        if high < low:
+            return 0
+        return self.count_at_most(high) - self.rank(low)
+
+    def range(self, low, high):
+        """
+        Gera em ordem os valores v com low <= v <= high
+
+        A descida pula as subárvores inteiramente menores que low e a geração para no
+        primeiro valor maior que high: visita O(log n + k) nós para k valores produzidos.
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.value < low:
+                    node = node.right  # O nó e a subárvore esquerda ficam abaixo do intervalo
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value > high:
+                return
+            if self.multiset:
+                yield from repeat(node.value, node.count)
+            else:
+                yield node.value
+            node = node.right
+
+    # ================================================================
+    # DIVISÃO E JUNÇÃO
+    # ================================================================
+
+    def split(self, key):
+        """
+        Divide a árvore em O(log n): esta fica com os valores menores que key
+
+        Retorna:
+            Nova AVLTree com os valores maiores ou iguais a key
+        """
+        self.root, right = self.split_node(self.root, key, True)
+        tree = AVLTree(persistent=self.epoch is not None, multiset=self.multiset)
+        tree.root = right
+        return tree
+
+    def join(self, other):
+        """
+        Junta à direita desta árvore todos os valores de other, em O(log n)
+
+        Todos os valores de other devem ser maiores ou iguais aos desta árvore; other fica
+        vazia. Se other for persistente, esta árvore também passa ao modo persistente, para
+        não alterar nós compartilhados com snapshots de other. No modo multiconjunto, os
+        valores de other devem ser estritamente maiores (cada valor fica num só nó).
+        """
+        if self.multiset != other.multiset:
+            raise ValueError("As duas árvores devem estar no mesmo modo (multiconjunto ou não)")
+        if self.root and other.root:
+            smallest = other.get_min_node(other.root).value
+            largest = self.get_max_node(self.root).value
+            if smallest < largest:
+                raise ValueError("Os valores da outra árvore devem ser maiores ou iguais aos desta")
+            if self.multiset and smallest == largest:
+                raise ValueError("No modo multiconjunto, os valores da outra árvore devem ser "
+                                 "maiores que os desta")
+        if other.epoch is not None and self.epoch is None:
+            self.epoch = next(EPOCHS)
+        self.root = self.join_roots(self.root, other.root)
+        other.root = None
+
+    def delete_range(self, low=None, high=None):
+        """
+        Remove todos os valores v com low <= v <= high em O(log n), por divisão e junção
+
+        A árvore é dividida antes de low e depois de high, e as duas pontas são juntadas; o
+        trecho do meio é descartado inteiro, sem uma remoção por valor.
+
+        Parâmetros:
+            low, high: Limites do intervalo (None deixa o lado aberto, ex.: tudo abaixo de
+                       uma marca d'água com delete_range(high=marca))
+
+        Retorna:
+            Quantidade de valores removidos
+        """
+        left, middle = None, self.root
+        if low is not None:
+            left, middle = self.split_node(middle, low, True)
+        right = None
+        if high is not None:
+            middle, right = self.split_node(middle, high, False)
+        self.root = self.join_roots(left, right)
+        return self.get_size(middle)
+
+    def split_node(self, node, key, equal_right):
+        """
+        Divide a subárvore pelo valor key (recursão limitada à altura da árvore)
+
+        Parâmetros:
+            node: Raiz da subárvore
+            key: Valor de corte
+            equal_right: Se valores iguais a key vão para a direita (senão, para a esquerda)
+
+        Retorna:
+            Tupla (raiz da parte esquerda, raiz da parte direita)
+        """
+        if not node:
+            return None, None
+        left, right = node.left, node.right
+        if key < node.value or (equal_right and key == node.value):
+            # O nó e a subárvore direita ficam à direita do corte
+            split_left, split_right = self.split_node(left, key, equal_right)
+            return split_left, self.join_nodes(split_right, node, right)
+        split_left, split_right = self.split_node(right, key, equal_right)
+        return self.join_nodes(left, node, split_left), split_right
+
+    def join_nodes(self, left, middle, right):
+        """
+        Junta duas subárvores AVL com um nó do meio (left < middle <= right), em
+        O(|diferença de altura|)
+
+        A mais baixa é pendurada no nó do meio e encaixada ao longo da borda da mais alta,
+        onde as alturas se aproximam; o caminho de volta é rebalanceado.
+
+        Retorna:
+            Raiz da árvore resultante
+        """
+        left_height, right_height = self.get_height(left), self.get_height(right)
+        if left_height > right_height + 1:
+            left = self.writable(left)
+            left.right = self.join_nodes(left.right, middle, right)
+            return self.balance_node(left)
+        if right_height > left_height + 1:
+            right = self.writable(right)
+            right.left = self.join_nodes(left, middle, right.left)
+            return self.balance_node(right)
+        middle = self.writable(middle)
+        middle.left = left
+        middle.right = right
+        self.update_height(middle)
+        return middle
+
+    def join_roots(self, left, right):
+        """Junta duas subárvores (valores de left <= valores de right) sem nó do meio"""
+        if not left:
+            return right
+        if not right:
+            return left
+        right, middle = self.pop_min(right)
+        return self.join_nodes(left, middle, right)
+
+    def pop_min(self, node):
+        """
+        Retira o menor nó da subárvore
+
+        Retorna:
+            Tupla (nova raiz da subárvore, nó retirado)
+        """
+        if not node.left:
+            return node.right, node
+        node = self.writable(node)
+        node.left, smallest = self.pop_min(node.left)
+        return self.balance_node(node), smallest
+
+    def get_max_node(self, node):
+        """Obtém o nó com maior valor na subárvore"""
+        current = node
+        while current.right:
+            current = current.right
+        return current
+
+    # ================================================================
+    # CARGA EM LOTE
+    # ================================================================
+
+    def bulk_load(self, values):
+        """
+        Substitui o conteúdo da árvore pelos valores informados
+
+        Em vez de n inserções (cada uma descendo da raiz e rebalanceando), os valores são
+        ordenados uma única vez (a ordenação é pulada quando já vêm em ordem, e a montagem
+        fica O(n)) e a árvore é construída diretamente, escolhendo o elemento do meio de
+        cada intervalo como raiz. O resultado é perfeitamente balanceado, com as alturas
+        já corretas.
+
+        Parâmetros:
+            values: Iterável com os valores (em qualquer ordem; duplicatas são mantidas,
+                    ou viram contagens no modo multiconjunto)
+        """
+        values = list(values)
+        if not is_sorted(values):
+            values.sort()
+        if self.multiset:
+            runs = count_runs((value, 1, None) for value in values)
+            self.root = self.build_counted(runs, 0, len(runs))
+            return
+        self.root = self.build_balanced(values, 0, len(values))
+
+    def bulk_merge(self, values):
+        """
+        Mescla um lote de valores com a árvore atual em O(n + m)
+
+        O percurso in-order (já ordenado) e o lote ordenado são intercalados com
+        heapq.merge e a árvore é reconstruída com build_balanced. No modo multiconjunto, a
+        intercalação é feita por nó, somando as contagens e mantendo os payloads.
+
+        Parâmetros:
+            values: Iterável com os novos valores (ordenado de preferência)
+        """
+        batch = list(values)
+        if not is_sorted(batch):
+            batch.sort()
+        if self.multiset:
+            existing = ((node.value, node.count, node.payload)
+                        for node in iter_nodes_inorder(self.root))
+            runs = count_runs(heapq.merge(existing, ((value, 1, None) for value in batch),
+                                          key=itemgetter(0)))
+            self.root = self.build_counted(runs, 0, len(runs))
+            return
+        merged = list(heapq.merge(self.iter_inorder(), batch))
+        self.root = self.build_balanced(merged, 0, len(merged))
+
+    def insert_many(self, values):
+        """
+        Insere um lote de valores escolhendo a estratégia mais barata
+
+        Lotes pequenos em relação à árvore são inseridos um a um (O(m log n)); lotes
+        grandes são mesclados com bulk_merge (O(n + m)), que reconstrói a árvore inteira.
+
+        Parâmetros:
+            values: Iterável com os valores
+        """
+        batch = list(values)
+        # Inserções custam O(log n) cada (a altura); a mescla, O(n) no total
+        if len(batch) * max(1, self.get_height(self.root)) >= self.get_size(self.root):
+            self.bulk_merge(batch)
+        else:
+            for value in batch:
+                self.insert(value)
+
+    def load_sorted(self, values, count):
+        """
+        Substitui o conteúdo da árvore por um fluxo de valores já ordenados, em O(n)
+
+        Diferente de bulk_load, os valores não são reunidos numa lista: cada um é consumido
+        do iterável no momento em que seu nó é criado (em in-order), e a forma da árvore é
+        a mesma de build_balanced. Serve para recarregar exportações in-order grandes.
+
+        No modo multiconjunto, os valores iguais precisam virar um só nó antes da montagem,
+        e o fluxo é reunido por bulk_load.
+
+        Parâmetros:
+            values: Iterável com exatamente count valores em ordem não decrescente
+            count: Quantidade de valores do iterável (um fluxo mais curto ou mais longo gera
+                   ValueError, e a árvore não é alterada)
+        """
+        if self.multiset:
+            self.bulk_load(values)
+            return
+        iterator = iter(values)
+        root = self.build_from_iterator(iterator, count)
+        if next(iterator, STREAM_END) is not STREAM_END:
+            # Valores além da quantidade informada seriam descartados em silêncio
+            raise ValueError("O fluxo tem mais valores que a quantidade informada")
+        self.root = root
+
+    def build_from_iterator(self, iterator, count):
+        """
+        Constrói a subárvore balanceada com os próximos count valores do iterador
+
+        Retorna:
+            Raiz da subárvore (ou None para count igual a 0)
+        """
+        if count <= 0:
+            return None
+        left = self.build_from_iterator(iterator, count // 2)
+        try:
+            node = TreeNode(next(iterator))
+        except StopIteration:
+            raise ValueError("O fluxo terminou antes da quantidade de valores informada") from None
+        node.left = left
+        node.right = self.build_from_iterator(iterator, count - count // 2 - 1)
+        self.update_height(node)
+        return node
+
+    def build_balanced(self, values, lo, hi):
+        """
+        Constrói a subárvore balanceada com values[lo:hi] (lista ordenada)
+
+        Retorna:
+            Raiz da subárvore (ou None para intervalo vazio)
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = TreeNode(values[mid])
+        node.left = self.build_balanced(values, lo, mid)
+        node.right = self.build_balanced(values, mid + 1, hi)
+        self.update_height(node)
+        return node
+
+    def build_counted(self, runs, lo, hi):
+        """
+        Constrói a subárvore balanceada do modo multiconjunto com runs[lo:hi]
+
+        Parâmetros:
+            runs: Lista ordenada de trincas (valor, contagem, payload) com valores distintos
+
+        Retorna:
+            Raiz da subárvore (ou None para intervalo vazio)
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        value, copies, payload = runs[mid]
+        node = CountedNode(value)
+        node.count, node.payload = copies, payload
+        node.left = self.build_counted(runs, lo, mid)
+        node.right = self.build_counted(runs, mid + 1, hi)
+        self.update_height(node)
+        return node
+
+    # ================================================================
+    # PERCURSOS DA ÁRVORE
+    # ================================================================
+
+    def iter_inorder(self):
+        """Gera os valores em percurso in-order (esquerda, raiz, direita), sem recursão"""
+        return iter_inorder(self.root, self.multiset)
+
+    def iter_preorder(self):
+        """Gera os valores em percurso pre-order (raiz, esquerda, direita), sem recursão"""
+        return iter_preorder(self.root, self.multiset)
+
+    def iter_postorder(self):
+        """Gera os valores em percurso post-order (esquerda, direita, raiz), sem recursão"""
+        return iter_postorder(self.root, self.multiset)
+
+    def iter_levelorder(self):
+        """Gera os valores em percurso por níveis (largura)"""
+        return iter_levelorder(self.root, self.multiset)
+
+    def traverse_inorder(self):
+        """Percurso in-order: esquerda, raiz, direita"""
+        return list(self.iter_inorder())
+
+    def traverse_preorder(self):
+        """Percurso pre-order: raiz, esquerda, direita"""
+        return list(self.iter_preorder())
+
+    def traverse_postorder(self):
+        """Percurso post-order: esquerda, direita, raiz"""
+        return list(self.iter_postorder())
+
+    def traverse_levelorder(self):
+        """Percurso por níveis (largura)"""
+        return list(self.iter_levelorder())
+
+class AVLHistory:
+    """
+    Histórico de versões de uma AVLTree persistente, para voltar e avançar entre operações
+
+    Cada versão é um snapshot (O(1)) que compartilha com as demais todos os nós fora dos
+    caminhos alterados; voltar ou avançar só troca a raiz da árvore, sem refazer operações.
+    Registrar uma versão depois de voltar descarta as versões que estavam à frente.
+
+    Atributos:
+        tree: Árvore acompanhada (passa ao modo persistente)
+        versions: Lista de pares (snapshot, descrição), da mais antiga para a mais nova
+        position: Índice da versão exibida pela árvore
+        limit: Máximo de versões guardadas (None para ilimitado); as mais antigas saem
+    """
+
+    def __init__(self, tree, label="", limit=None):
+        """
+        Inicia o histórico com o estado atual da árvore
+
+        Parâmetros:
+            tree: engine.AVLTree
+            label: Descrição da versão inicial
+            limit: Máximo de versões guardadas (None para ilimitado)
+        """
+        self.tree = tree
+        self.limit = limit
+        self.versions = [(tree.snapshot(), label)]
+        self.position = 0
+
+    def __len__(self):
+        """Retorna o número de versões guardadas"""
+        return len(self.versions)
+
+    def record(self, label=""):
+        """Registra o estado atual da árvore como nova versão (após uma operação)"""
+        del self.versions[self.position + 1:]
+        self.versions.append((self.tree.snapshot(), label))
+        if self.limit is not None and len(self.versions) > self.limit:
+            del self.versions[:len(self.versions) - self.limit]
+        self.position = len(self.versions) - 1
+
+    def label(self):
+        """Retorna a descrição da versão exibida"""
+        return self.versions[self.position][1]
+
+    def can_back(self):
+        """Verifica se há versão anterior"""
+        return self.position > 0
+
+    def can_forward(self):
+        """Verifica se há versão posterior"""
+        return self.position < len(self.versions) - 1
+
+    def back(self):
+        """
+        Volta a árvore para a versão anterior, em O(1)
+
+        Retorna:
+            True se voltou, False se já estava na mais antiga
+        """
+        if not self.can_back():
+            return False
+        self.go(self.position - 1)
+        return True
+
+    def forward(self):
+        """
+        Avança a árvore para a versão seguinte, em O(1)
+
+        Retorna:
+            True se avançou, False se já estava na mais nova
+        """
+        if not self.can_forward():
+            return False
+        self.go(self.position + 1)
+        return True
+
+    def go(self, position):
+        """Coloca na árvore a versão da posição informada (os nós dela seguem congelados)"""
+        self.position = position
+        self.tree.root = self.versions[position][0].root
@@ -0,0 +1,357 @@
+"""
+Núcleo da Árvore AVL Compacta (sem interface gráfica)
+
+Descrição:
+Variante da árvore AVL em que os nós não são objetos: cada nó é um índice inteiro em
+colunas paralelas do módulo array (estrutura de vetores, "struct of arrays"). Um nó ocupa
+só os bytes das suas colunas, em vez de um objeto Python com cabeçalho, ponteiros e um int
+por campo, o que reduz a memória por nó várias vezes em árvores com milhões de chaves.
+Expõe a mesma API de engine.AVLTree (insert, delete, search, clear, bulk_load, bulk_merge
+e os percursos), mas as chaves precisam ser numéricas de largura fixa.
+
+Componentes Principais:
+1. keys: array("q") com as chaves (ou array("d") para floats)
+2. left / right: array("i") com os índices dos filhos (NIL = -1 para filho ausente)
+3. height: array("b") com a altura de cada nó
+4. Lista livre: índices de nós removidos são encadeados pela coluna left e reaproveitados
+   pelas próximas inserções, sem deixar buracos crescendo nas colunas
+5. Carga em lote que grava as chaves já ordenadas diretamente na coluna keys
+
+Comparação com engine.AVLTree:
+Um TreeNode, mesmo com __slots__, ocupa cerca de 96 bytes por nó contando o objeto int da
+chave; aqui cada nó custa 8 + 4 + 4 + 1 = 17 bytes. Em troca, as chaves ficam restritas ao
+tipo da coluna e não há objetos de nó para a visualização gráfica.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+from array import array
+from collections import deque
+import heapq
+
+from .treeavl import is_sorted
+
+NIL = -1  # Índice de filho ausente
+
+class CompactAVLTree:
+    """
+    Classe que implementa a árvore AVL sobre colunas de array
+
+    Atributos:
+        typecode: Tipo da coluna de chaves ("q" para inteiros de 64 bits, "d" para floats)
+        keys, left, right, height: Colunas dos nós (o nó i ocupa a posição i de cada uma)
+        root: Índice da raiz (NIL para árvore vazia)
+        count: Número de nós na árvore
+        free: Primeiro índice da lista de posições livres (NIL se não houver)
+    """
+
+    def __init__(self, typecode="q"):
+        """
+        Inicializa uma árvore vazia
+
+        Parâmetros:
+            typecode: "q" (padrão, inteiros de 64 bits) ou "d" (floats)
+        """
+        if typecode not in ("q", "d"):
+            raise ValueError(f"Tipo de chave inválido: {typecode} (use q ou d)")
+        self.typecode = typecode
+        self.clear()
+
+    def __len__(self):
+        """Retorna o número de nós da árvore"""
+        return self.count
+
+    def __contains__(self, value):
+        """Verifica se o valor está na árvore"""
+        return self.search(value) != NIL
+
+    def clear(self):
+        """Remove todos os nós da árvore (e libera as colunas)"""
+        self.keys = array(self.typecode)
+        self.left = array("i")
+        self.right = array("i")
+        self.height = array("b")
+        self.root = NIL
+        self.count = 0
+        self.free = NIL
+
+    def new_node(self, value):
+        """Aloca um nó folha (reaproveitando uma posição livre, se houver) e retorna o índice"""
+        if self.free != NIL:
+            index = self.free
+            self.free = self.left[index]
+            self.keys[index] = value
+            self.left[index] = NIL
+            self.right[index] = NIL
+            self.height[index] = 1
+            return index
+        self.keys.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.height.append(1)
+        return len(self.keys) - 1
+
+    def release_node(self, index):
+        """Devolve a posição de um nó removido à lista livre"""
+        self.left[index] = self.free
+        self.free = index
+
+    # ================================================================
+    # OPERAÇÕES BÁSICAS DA AVL
+    # ================================================================
+
+    def get_height(self, index):
+        """Retorna a altura de um nó (0 para NIL)"""
+        return self.height[index] if index != NIL else 0
+
+    def get_balance(self, index):
+        """Calcula o fator de balanceamento do nó"""
+        if index == NIL:
+            return 0
+        return self.get_height(self.left[index]) - self.get_height(self.right[index])
+
+    def update_height(self, index):
+        """Atualiza a altura de um nó com base nos filhos"""
+        self.height[index] = 1 + max(self.get_height(self.left[index]),
+                                     self.get_height(self.right[index]))
+
+    def rotate_right(self, z):
+        """Rotação simples à direita"""
+        y = self.left[z]
+        self.left[z] = self.right[y]
+        self.right[y] = z
+        self.update_height(z)
+        self.update_height(y)
+        return y  # Nova raiz da subárvore
+
+    def rotate_left(self, z):
+        """Rotação simples à esquerda"""
+        y = self.right[z]
+        self.right[z] = self.left[y]
+        self.left[y] = z
+        self.update_height(z)
+        self.update_height(y)
+        return y  # Nova raiz da subárvore
+
+    def balance_node(self, index):
+        """Aplica rotações para balancear o nó se necessário"""
+        self.update_height(index)
+        balance = self.get_balance(index)
+
+        if balance > 1:
+            if self.get_balance(self.left[index]) < 0:  # Caso Left Right
+                self.left[index] = self.rotate_left(self.left[index])
+            return self.rotate_right(index)             # Caso Left Left
+        if balance < -1:
+            if self.get_balance(self.right[index]) > 0:  # Caso Right Left
+                self.right[index] = self.rotate_right(self.right[index])
+            return self.rotate_left(index)               # Caso Right Right
+        return index  # Nó já balanceado
+
+    # ================================================================
+    # OPERAÇÕES DA ÁRVORE
+    # ================================================================
+
+    def insert(self, value):
+        """Insere um valor na árvore e rebalanceia"""
+        self.root = self.insert_helper(self.root, value)
+
+    def delete(self, value):
+        """Remove um valor da árvore (se existir) e rebalanceia"""
+        self.root = self.delete_helper(self.root, value)
+
+    def search(self, value):
+        """
+        Busca um valor na árvore
+
+        Retorna:
+            Índice do nó com o valor, ou NIL (-1) se não encontrado
+        """
+        keys, left, right = self.keys, self.left, self.right
+        index = self.root
+        while index != NIL:
+            key = keys[index]
+            if value == key:
+                return index
+            index = left[index] if value < key else right[index]
+        return NIL
+
+    def insert_helper(self, index, value):
+        """Insere valor recursivamente e balanceia a árvore"""
+        if index == NIL:
+            self.count += 1
+            return self.new_node(value)
+        if value < self.keys[index]:
+            self.left[index] = self.insert_helper(self.left[index], value)
+        else:
+            self.right[index] = self.insert_helper(self.right[index], value)
+        return self.balance_node(index)
+
+    def delete_helper(self, index, value):
+        """Remove valor recursivamente e balanceia a árvore"""
+        if index == NIL:
+            return NIL
+
+        key = self.keys[index]
+        if value < key:
+            self.left[index] = self.delete_helper(self.left[index], value)
+        elif value > key:
+            self.right[index] = self.delete_helper(self.right[index], value)
+        else:
+            # Nó com um ou nenhum filho
+            left, right = self.left[index], self.right[index]
+            if left == NIL or right == NIL:
+                self.release_node(index)
+                self.count -= 1
+                return right if left == NIL else left
+
+            # Nó com dois filhos: copia o sucessor in-order e o remove da direita
+            successor = self.get_min_node(right)
+            self.keys[index] = self.keys[successor]
+            self.right[index] = self.delete_helper(right, self.keys[successor])
+        return self.balance_node(index)
+
+    def get_min_node(self, index):
+        """Obtém o índice do menor valor na subárvore"""
+        while self.left[index] != NIL:
+            index = self.left[index]
+        return index
+
+    # ================================================================
+    # CARGA EM LOTE
+    # ================================================================
+
+    def bulk_load(self, values):
+        """
+        Substitui o conteúdo da árvore pelos valores informados, em O(n) se já ordenados
+
+        Os valores ordenados vão direto para a coluna keys (o nó i é o i-ésimo em
+        in-order) e só os filhos e as alturas são calculados.
+
+        Parâmetros:
+            values: Iterável com os valores (em qualquer ordem; duplicatas são mantidas)
+        """
+        keys = array(self.typecode, values)
+        if not is_sorted(keys):
+            keys = array(self.typecode, sorted(keys))
+        count = len(keys)
+        self.clear()
+        self.keys = keys
+        self.left = array("i", [NIL]) * count
+        self.right = array("i", [NIL]) * count
+        self.height = array("b", [1]) * count
+        self.count = count
+        self.root = self.build_balanced(0, count)
+
+    def bulk_merge(self, values):
+        """
+        Mescla um lote de valores com a árvore atual em O(n + m)
+
+        Parâmetros:
+            values: Iterável com os novos valores (ordenado de preferência)
+        """
+        batch = list(values)
+        if not is_sorted(batch):
+            batch.sort()
+        self.bulk_load(heapq.merge(self.iter_inorder(), batch))
+
+    def build_balanced(self, lo, hi):
+        """
+        Liga os nós lo..hi-1 (já em ordem) numa subárvore balanceada
+
+        Retorna:
+            Índice da raiz da subárvore (ou NIL para intervalo vazio)
+        """
+        if lo >= hi:
+            return NIL
+        mid = (lo + hi) // 2
+        self.left[mid] = self.build_balanced(lo, mid)
+        self.right[mid] = self.build_balanced(mid + 1, hi)
+        self.update_height(mid)
+        return mid
+
+    # ================================================================
+    # PERCURSOS DA ÁRVORE
+    # ================================================================
+
+    def iter_inorder(self):
+        """Gera os valores em percurso in-order (esquerda, raiz, direita), sem recursão"""
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        index = self.root
+        while stack or index != NIL:
+            # Desce pela esquerda empilhando os ancestrais
+            while index != NIL:
+                stack.append(index)
+                index = left[index]
+            index = stack.pop()
+            yield keys[index]
+            index = right[index]
+
+    def iter_preorder(self):
+        """Gera os valores em percurso pre-order (raiz, esquerda, direita), sem recursão"""
+        keys, left, right = self.keys, self.left, self.right
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            index = stack.pop()
+            yield keys[index]
+            # A direita é empilhada primeiro para a esquerda sair antes
+            if right[index] != NIL:
+                stack.append(right[index])
+            if left[index] != NIL:
+                stack.append(left[index])
+
+    def iter_postorder(self):
+        """Gera os valores em percurso post-order (esquerda, direita, raiz), sem recursão"""
+        keys, left, right = self.keys, self.left, self.right
+        # Cada entrada indica se os filhos do índice já foram empilhados
+        stack = [(self.root, False)] if self.root != NIL else []
+        while stack:
+            index, expanded = stack.pop()
+            if expanded:
+                yield keys[index]
+                continue
+            stack.append((index, True))
+            if right[index] != NIL:
+                stack.append((right[index], False))
+            if left[index] != NIL:
+                stack.append((left[index], False))
+
+    def iter_levelorder(self):
+        """Gera os valores em percurso por níveis (largura)"""
+        keys, left, right = self.keys, self.left, self.right
+        queue = deque([self.root] if self.root != NIL else [])
+        while queue:
+            index = queue.popleft()
+            yield keys[index]
+            if left[index] != NIL:
+                queue.append(left[index])
+            if right[index] != NIL:
+                queue.append(right[index])
+
+    def traverse_inorder(self):
+        """Retorna lista de valores em percurso in-order (esquerda, raiz, direita)"""
+        return list(self.iter_inorder())
+
+    def traverse_preorder(self):
+        """Retorna lista de valores em percurso pre-order (raiz, esquerda, direita)"""
+        return list(self.iter_preorder())
+
+    def traverse_postorder(self):
+        """Retorna lista de valores em percurso post-order (esquerda, direita, raiz)"""
+        return list(self.iter_postorder())
+
+    def traverse_levelorder(self):
+        """Retorna lista de valores em percurso por níveis (largura)"""
+        return list(self.iter_levelorder())
+
+    def stats(self):
+        """Retorna um dicionário com a ocupação das colunas"""
+        columns = (self.keys, self.left, self.right, self.height)
+        return {
+            "size": self.count,
+            "slots": len(self.keys),
+            "bytes": sum(len(column) * column.itemsize for column in columns),
+            "bytes_per_node": sum(column.itemsize for column in columns),
+        }
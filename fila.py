@@ -7,18 +7,25 @@ com interface gráfica usando Tkinter. Permite realizar operações básicas de
 e visualizar os elementos em formato de fila horizontal com indicações de entrada e saída.
 
 Componentes Principais:
-1. Estrutura de dados: Lista para armazenar os elementos
+1. Estrutura de dados: engine.Fila (núcleo sem interface gráfica)
 2. Visualização horizontal dos elementos enfileirados
 3. Setas indicando a direção do fluxo (entrada e saída)
 4. Rótulos para frente (próximo a sair) e final (último a entrar)
 5. Feedback visual para operações
+6. Desenho incremental (render.RetainedCanvas): cada operação só toca os itens afetados
+7. Rolagem e zoom, desenhando apenas os elementos visíveis (glifos para os demais)
 
 Autor: Agostinho Ferreira (little_agosto)
 Data da última atualização: 02/08/2025
 """
 
+import math
 import tkinter as tk
 from tkinter import messagebox
+import engine
+from lote import BatchDialog
+from render import Scene, RetainedCanvas, RedrawScheduler, Viewport, format_count
+from render.viewport import MIN_ITEM_PIXELS
 
 class Fila:
     """
@@ -26,8 +33,11 @@ class Fila:
     
     Atributos:
         parent_frame: Frame do Tkinter para conter a visualização
-        queue: Lista para armazenar os elementos da fila
+        queue: Núcleo da fila (engine.Fila) com os elementos
         canvas: Área de desenho para visualização
+        renderer: Renderizador em modo retido sobre o canvas
+        redraw: Agendador que agrupa os pedidos de redesenho
+        viewport: Rolagem e zoom do canvas
         control_frame: Área para controles (entrada e botões)
         status: Barra de status para mensagens
     """
@@ -40,12 +50,17 @@ class Fila:
             parent_frame: Frame do Tkinter para renderização
         """
         self.parent_frame = parent_frame
-        self.queue = []  # Inicializa fila vazia
+        self.queue = engine.Fila()  # Inicializa fila vazia
         
         # Configuração da área de desenho
         self.canvas = tk.Canvas(self.parent_frame, bg='white')
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.canvas.bind("<Configure>", self.on_resize)  # Redesenha ao redimensionar
+        self.renderer = RetainedCanvas(self.canvas)  # Mantém os itens entre desenhos
+        # Agrupa os redesenhos: no máximo um por quadro e nenhum com a aba escondida
+        self.redraw = RedrawScheduler(self.canvas, self.visualize_queue, self.parent_frame)
+        self.viewport = Viewport()  # Rolagem e zoom (roda do mouse, Ctrl+roda, arraste)
+        self.viewport.attach(self.canvas, self.redraw.request)
         
         # Área de controles
         self.control_frame = tk.Frame(self.parent_frame)
@@ -59,6 +74,7 @@ class Fila:
         tk.Button(self.control_frame, text="Enqueue", command=self.enqueue_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Dequeue", command=self.dequeue_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Limpar", command=self.clear_queue).pack(side=tk.LEFT, padx=5)
+        tk.Button(self.control_frame, text="Lote...", command=self.batch_gui).pack(side=tk.LEFT, padx=5)
         
         # Barra de status
         self.status = tk.Label(self.parent_frame, text="Fila Vazia", 
@@ -66,11 +82,11 @@ class Fila:
         self.status.pack(fill=tk.X)
         
         # Desenha a fila inicial
-        self.visualize_queue()
+        self.redraw.request()
 
     def on_resize(self, event=None):
         """Redesenha a fila ao redimensionar o canvas"""
-        self.visualize_queue()
+        self.redraw.request()
 
     # ================================================================
     # INTERFACE GRÁFICA PARA OPERAÇÕES
@@ -81,8 +97,8 @@ class Fila:
         try:
             value = self.entry.get()
             if value:
-                self.enqueue(value)
-                self.visualize_queue()
+                self.queue.enqueue(value)
+                self.redraw.request()
                 self.status.config(text=f"Enfileirado: {value}")
                 self.entry.delete(0, tk.END)  # Limpa o campo de entrada
             else:
@@ -97,48 +113,52 @@ class Fila:
             return
             
         try:
-            value = self.dequeue()
-            self.visualize_queue()
+            value = self.queue.dequeue()
+            self.redraw.request()
             self.status.config(text=f"Desenfileirado: {value}")
         except Exception as e:
             messagebox.showerror("Erro", str(e))
     
     def clear_queue(self):
         """Limpa toda a fila"""
-        self.queue = []
-        self.visualize_queue()
+        self.queue.clear()
+        self.redraw.request()
         self.status.config(text="Fila limpa")
 
-    # ================================================================
-    # OPERAÇÕES DA FILA
-    # ================================================================
-    
-    def enqueue(self, value):
-        """Adiciona um elemento no final da fila"""
-        self.queue.append(value)
-    
-    def dequeue(self):
-        """Remove e retorna o elemento da frente da fila"""
-        if not self.queue:
-            raise IndexError("Fila vazia!")
-        return self.queue.pop(0)
+    def batch_gui(self):
+        """Abre a janela de operações em lote (valores digitados, colados ou de arquivo)"""
+        BatchDialog(self.parent_frame, "Fila - Lote", ["Enqueue"], self.apply_batch)
     
-    def is_empty(self):
-        """Verifica se a fila está vazia"""
-        return len(self.queue) == 0
-    
-    def size(self):
-        """Retorna o número de elementos na fila"""
-        return len(self.queue)
+    def apply_batch(self, operation, values):
+        """
+        Enfileira um lote de valores com um único redesenho
+
+        Parâmetros:
+            operation: Operação escolhida ("Enqueue")
+            values: Valores do lote, na ordem de chegada
+        """
+        done = 0
+        try:
+            for value in values:
+                self.queue.enqueue(value)
+                done += 1
+        except Exception as e:
+            messagebox.showerror("Erro", str(e))
+        self.redraw.request()
+        self.status.config(text=f"Lote: {format_count(done)} enfileirados")
 
     # ================================================================
     # VISUALIZAÇÃO GRÁFICA
     # ================================================================
     
     def visualize_queue(self):
-        """Renderiza a representação visual da fila"""
-        self.canvas.delete("all")  # Limpa o canvas
+        """
+        Renderiza a representação visual da fila (apenas os itens que mudaram)
         
+        Somente os elementos que cruzam a área visível são desenhados; os demais são
+        resumidos em glifos "… N mais" nas bordas. Com zoom muito reduzido a fila inteira
+        vira um único bloco com a contagem de elementos.
+        """
         # Obtém dimensões atuais do canvas
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
@@ -148,84 +168,155 @@ class Fila:
             canvas_width = 300
             canvas_height = 300
         
-        # Mostra mensagem se a fila estiver vazia
+        # Mostra mensagem se a fila estiver vazia (fixa na tela)
         if not self.queue:
-            self.canvas.create_text(
+            scene = Scene()
+            scene.text(
+                "empty",
                 canvas_width/2, canvas_height/2, 
                 text="Fila Vazia", 
                 font=("Arial", 24), 
                 fill="gray"
             )
+            self.renderer.render(scene)
             return
         
-        # Configurações de desenho
+        # Configurações de desenho (em coordenadas de mundo, sem zoom)
         element_width = min(80, canvas_width // 12)  # Largura do elemento
         element_height = min(60, canvas_height // 10) # Altura do elemento
         spacing = 10  # Espaçamento entre elementos
+        step = element_width + spacing
+        count = len(self.queue)
         
         # Calcula a largura total necessária
-        total_width = len(self.queue) * (element_width + spacing) - spacing
+        total_width = count * step - spacing
         
         # Posição inicial (centralizada horizontalmente)
         start_x = (canvas_width - total_width) / 2
         start_y = canvas_height / 2
         
+        # Cada elemento fica na posição fixa do seu número de sequência; recentralizar ou
+        # rolar a fila apenas desloca a origem da cena (um único canvas.move)
+        viewport = self.viewport
+        z = viewport.zoom
+        head = self.queue.head_seq
+        scene = Scene(origin=viewport.to_screen(start_x - head * step, 0))
+        first_x = head * step
+        end_x = first_x + total_width
+        y = start_y * z
+        
         # Desenha seta de entrada (lado esquerdo)
-        self.canvas.create_line(
-            start_x - 50, start_y, 
-            start_x, start_y, 
+        scene.line(
+            "in_arrow",
+            (first_x - 50) * z, y, 
+            first_x * z, y, 
             arrow=tk.LAST, width=2
         )
-        self.canvas.create_text(
-            start_x - 25, start_y - 20, 
+        scene.text(
+            "in_label",
+            (first_x - 25) * z, y - 20, 
             text="Entrada", 
             font=("Arial", 10)
         )
         
         # Desenha seta de saída (lado direito)
-        end_x = start_x + total_width
-        self.canvas.create_line(
-            end_x, start_y, 
-            end_x + 50, start_y, 
+        scene.line(
+            "out_arrow",
+            end_x * z, y, 
+            (end_x + 50) * z, y, 
             arrow=tk.LAST, width=2
         )
-        self.canvas.create_text(
-            end_x + 25, start_y - 20, 
+        scene.text(
+            "out_label",
+            (end_x + 25) * z, y - 20, 
             text="Saída", 
             font=("Arial", 10)
         )
         
-        # Desenha cada elemento da fila
-        for i, value in enumerate(self.queue):
-            x = start_x + i * (element_width + spacing)
-            y = start_y
+        visible_left, _, visible_right, _ = viewport.visible_rect(canvas_width, canvas_height)
+        screen_y = start_y * z - viewport.scroll_y
+        
+        if element_width * z < MIN_ITEM_PIXELS:
+            # Nível de detalhe reduzido: um bloco único no lugar dos elementos
+            block_left = max(visible_left - start_x, 0) + first_x
+            block_right = min(visible_right - start_x, total_width) + first_x
+            if block_left < block_right:
+                scene.rectangle(
+                    "aggregate",
+                    block_left * z, y - element_height/2 * z,
+                    block_right * z, y + element_height/2 * z,
+                    fill="lightblue", outline="black", width=1
+                )
+            scene.text(
+                "aggregate_label",
+                *scene.screen(canvas_width / 2, screen_y + element_height/2 * z + 15),
+                text=f"{format_count(count)} elementos",
+                font=("Arial", 10, "bold")
+            )
+            self.renderer.render(scene)
+            return
+        
+        # Intervalo [first, last) de posições (a partir da frente) que cruzam a tela
+        first = min(count, max(0, math.ceil((visible_left - start_x - element_width) / step)))
+        last = min(count, max(first, math.floor((visible_right - start_x) / step) + 1))
+        show_values = element_width * z >= 16
+        font_size = max(1, round(min(12, element_width//6) * z))
+        label_font = ("Arial", max(1, round(min(9, element_width//8) * z)))
+        
+        # Desenha cada elemento visível da fila (chave = número de sequência); o deque é
+        # indexado só nas posições visíveis (islice percorreria os first elementos anteriores)
+        items = self.queue.items
+        for seq, value in enumerate((items[i] for i in range(first, last)), head + first):
+            x = seq * step * z
             
             # Retângulo do elemento
-            self.canvas.create_rectangle(
-                x, y - element_height/2,
-                x + element_width, y + element_height/2,
+            scene.rectangle(
+                ("box", seq),
+                x, y - element_height/2 * z,
+                x + element_width * z, y + element_height/2 * z,
                 fill="lightblue", outline="black", width=2
             )
             
             # Valor do elemento
-            self.canvas.create_text(
-                x + element_width/2, y,
-                text=str(value), 
-                font=("Arial", min(12, element_width//6), "bold")
-            )
-            
-            # Rótulo "Frente" para o primeiro elemento (índice 0)
-            if i == 0:
-                self.canvas.create_text(
-                    x + element_width/2, y + element_height/2 + 15,
-                    text="Frente", 
-                    font=("Arial", min(9, element_width//8))
+            if show_values:
+                scene.text(
+                    ("value", seq),
+                    x + element_width/2 * z, y,
+                    text=str(value), 
+                    font=("Arial", font_size, "bold")
                 )
-            
-            # Rótulo "Final" para o último elemento (índice -1)
-            if i == len(self.queue) - 1:
-                self.canvas.create_text(
-                    x + element_width/2, y + element_height/2 + 15,
-                    text="Final", 
-                    font=("Arial", min(9, element_width//8))
-                )
\ No newline at end of file
+        
+        # Glifos com a quantidade de elementos fora da tela (fixos nas bordas)
+        if first > 0:
+            scene.text(
+                "hidden_front",
+                *scene.screen(8, screen_y - element_height/2 * z - 12),
+                text=f"… {format_count(first)} mais", anchor=tk.W,
+                font=("Arial", 9), fill="gray30"
+            )
+        if last < count:
+            scene.text(
+                "hidden_back",
+                *scene.screen(canvas_width - 8, screen_y - element_height/2 * z - 12),
+                text=f"{format_count(count - last)} mais …", anchor=tk.E,
+                font=("Arial", 9), fill="gray30"
+            )
+        
+        # Rótulo "Frente" para o primeiro elemento
+        scene.text(
+            "front_label",
+            (first_x + element_width/2) * z, y + element_height/2 * z + 15,
+            text="Frente", 
+            font=label_font
+        )
+        
+        # Rótulo "Final" para o último elemento
+        last_x = (head + count - 1) * step
+        scene.text(
+            "back_label",
+            (last_x + element_width/2) * z, y + element_height/2 * z + 15,
+            text="Final", 
+            font=label_font
+        )
+        
+        self.renderer.render(scene)
\ No newline at end of file
@@ -7,32 +7,26 @@ Permite realizar operações básicas como inserção no início/fim, remoção,
 com visualização dos nós e conexões entre eles.
 
 Componentes Principais:
-1. Classe Node: Representa um nó da lista
-2. Classe ListaEncadeada: Gerencia a lista e a interface gráfica
+1. Núcleo engine.ListaEncadeada: Nós e operações da lista (sem interface gráfica)
+2. Classe ListaEncadeada: Visualização e controles da lista
 3. Visualização horizontal dos nós com setas indicando as conexões
 4. Destaque para nó selecionado em operações de busca
+5. Desenho incremental (render.RetainedCanvas): cada operação só toca os itens afetados
+6. Rolagem e zoom a partir da cabeça, desenhando apenas os nós visíveis (glifos para os demais)
 
 Autor: Agostinho Ferreira (little_agosto)
 Data da última atualização: 02/08/2025
 """
 
+import math
 import tkinter as tk
 from tkinter import messagebox
+import engine
+from lote import BatchDialog
+from render import Scene, RetainedCanvas, RedrawScheduler, Viewport, format_count
+from render.viewport import MIN_ITEM_PIXELS
 
-class Node:
-    """
-    Classe que representa um nó da lista encadeada
-    
-    Atributos:
-        value: Valor armazenado no nó
-        next: Referência ao próximo nó
-        x, y: Coordenadas para posicionamento visual
-    """
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        self.x = 0  # Coordenada x para desenho
-        self.y = 0  # Coordenada y para desenho
+CHECKPOINT_STEP = 256  # Distância em slots entre os nós guardados como atalho
 
 class ListaEncadeada:
     """
@@ -40,9 +34,14 @@ class ListaEncadeada:
     
     Atributos:
         parent_frame: Frame do Tkinter para conter a visualização
-        head: Primeiro nó da lista
+        linked_list: Núcleo da lista (engine.ListaEncadeada)
         selected_node: Nó selecionado para destaque visual
         canvas: Área de desenho para visualização
+        renderer: Renderizador em modo retido sobre o canvas
+        redraw: Agendador que agrupa os pedidos de redesenho
+        viewport: Rolagem e zoom do canvas
+        slots: Posição horizontal (slot) da cabeça e do segundo nó no último desenho
+        checkpoints: Slot -> nó a cada CHECKPOINT_STEP slots, pontos de partida do percurso
         control_frame: Área para controles (entrada e botões)
         status: Barra de status para mensagens
     """
@@ -55,13 +54,20 @@ class ListaEncadeada:
             parent_frame: Frame do Tkinter para renderização
         """
         self.parent_frame = parent_frame
-        self.head = None  # Lista inicia vazia
+        self.linked_list = engine.ListaEncadeada()  # Lista inicia vazia
         self.selected_node = None  # Nenhum nó selecionado inicialmente
         
         # Configuração da área de desenho
         self.canvas = tk.Canvas(self.parent_frame, bg='white')
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.canvas.bind("<Configure>", self.on_resize)  # Redesenha ao redimensionar
+        self.renderer = RetainedCanvas(self.canvas)  # Mantém os itens entre desenhos
+        # Agrupa os redesenhos: no máximo um por quadro e nenhum com a aba escondida
+        self.redraw = RedrawScheduler(self.canvas, self.visualize_list, self.parent_frame)
+        self.viewport = Viewport()  # Rolagem e zoom (roda do mouse, Ctrl+roda, arraste)
+        self.viewport.attach(self.canvas, self.redraw.request)
+        self.slots = {}  # Nó -> posição horizontal no último desenho (só as âncoras)
+        self.checkpoints = {}  # Slot -> nó já visitado (atalhos para o primeiro nó visível)
         
         # Área de controles
         self.control_frame = tk.Frame(self.parent_frame)
@@ -77,6 +83,7 @@ class ListaEncadeada:
         tk.Button(self.control_frame, text="Remover", command=self.remove_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Buscar", command=self.search_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Limpar", command=self.clear_list).pack(side=tk.LEFT, padx=5)
+        tk.Button(self.control_frame, text="Lote...", command=self.batch_gui).pack(side=tk.LEFT, padx=5)
         
         # Barra de status
         self.status = tk.Label(self.parent_frame, text="Lista Vazia", 
@@ -84,11 +91,11 @@ class ListaEncadeada:
         self.status.pack(fill=tk.X)
         
         # Desenha a lista inicial
-        self.visualize_list()
+        self.redraw.request()
 
     def on_resize(self, event):
         """Redesenha a lista ao redimensionar o canvas"""
-        self.visualize_list()
+        self.redraw.request()
 
     # ================================================================
     # INTERFACE GRÁFICA PARA OPERAÇÕES
@@ -99,8 +106,8 @@ class ListaEncadeada:
         try:
             value = self.entry.get()
             if value:
-                self.insert_start(value)
-                self.visualize_list()
+                self.linked_list.insert_start(value)
+                self.redraw.request()
                 self.status.config(text=f"Inserido no início: {value}")
                 self.entry.delete(0, tk.END)  # Limpa o campo de entrada
             else:
@@ -113,8 +120,8 @@ class ListaEncadeada:
         try:
             value = self.entry.get()
             if value:
-                self.insert_end(value)
-                self.visualize_list()
+                self.linked_list.insert_end(value)
+                self.redraw.request()
                 self.status.config(text=f"Inserido no fim: {value}")
                 self.entry.delete(0, tk.END)
             else:
@@ -127,8 +134,14 @@ class ListaEncadeada:
         try:
             value = self.entry.get()
             if value:
-                if self.remove(value):
-                    self.visualize_list()
+                # Remover a cabeça não muda o slot dos demais; remover no meio desloca os
+                # nós seguintes, então os atalhos guardados deixam de valer
+                head = self.linked_list.head
+                removes_head = head is not None and head.value == value
+                if self.linked_list.remove(value):
+                    if not removes_head:
+                        self.checkpoints = {}
+                    self.redraw.request()
                     self.status.config(text=f"Removido: {value}")
                 else:
                     self.status.config(text=f"Valor {value} não encontrado")
@@ -143,14 +156,14 @@ class ListaEncadeada:
         try:
             value = self.entry.get()
             if value:
-                node = self.search(value)
+                node = self.linked_list.search(value)
                 if node:
                     self.selected_node = node
-                    self.visualize_list()
+                    self.redraw.request()
                     self.status.config(text=f"Valor {value} encontrado")
                 else:
                     self.selected_node = None
-                    self.visualize_list()
+                    self.redraw.request()
                     self.status.config(text=f"Valor {value} não encontrado")
                 self.entry.delete(0, tk.END)
             else:
@@ -160,146 +173,201 @@ class ListaEncadeada:
     
     def clear_list(self):
         """Limpa completamente a lista"""
-        self.head = None
+        self.linked_list.clear()
         self.selected_node = None
-        self.visualize_list()
+        self.checkpoints = {}
+        self.redraw.request()
         self.status.config(text="Lista limpa")
 
-    # ================================================================
-    # OPERAÇÕES DA LISTA ENCADEADA
-    # ================================================================
+    def batch_gui(self):
+        """Abre a janela de operações em lote (valores digitados, colados ou de arquivo)"""
+        BatchDialog(self.parent_frame, "Lista Encadeada - Lote", ["Inserir Fim", "Inserir Início", "Remover"], self.apply_batch)
     
-    def insert_start(self, value):
-        """Insere novo nó no início da lista"""
-        new_node = Node(value)
-        new_node.next = self.head
-        self.head = new_node
-    
-    def insert_end(self, value):
-        """Insere novo nó no final da lista"""
-        new_node = Node(value)
-        if not self.head:
-            self.head = new_node
-            return
-        
-        # Percorre até o último nó
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
-    
-    def remove(self, value):
+    def apply_batch(self, operation, values):
         """
-        Remove o primeiro nó com o valor especificado
-        
-        Retorna:
-            True se removeu, False se não encontrou
-        """
-        # Lista vazia
-        if not self.head:
-            return False
-        
-        # Remoção do primeiro nó
-        if self.head.value == value:
-            self.head = self.head.next
-            return True
-        
-        # Busca pelo nó a ser removido
-        current = self.head
-        while current.next:
-            if current.next.value == value:
-                current.next = current.next.next
-                return True
-            current = current.next
-        
-        return False  # Valor não encontrado
-    
-    def search(self, value):
-        """
-        Busca um valor na lista
-        
-        Retorna:
-            Nó contendo o valor, ou None se não encontrado
+        Aplica um lote de operações com um único redesenho
+
+        Parâmetros:
+            operation: "Inserir Fim", "Inserir Início" ou "Remover"
+            values: Valores do lote
         """
-        current = self.head
-        while current:
-            if current.value == value:
-                return current
-            current = current.next
-        return None
-    
-    def size(self):
-        """Retorna o número de nós na lista"""
-        count = 0
-        current = self.head
-        while current:
-            count += 1
-            current = current.next
-        return count
+        if operation == "Remover":
+            # Uma única passada pela lista para todos os valores
+            removed = self.linked_list.remove_many(values)
+            self.selected_node = None  # O nó selecionado pode ter sido removido
+            self.checkpoints = {}  # Os nós seguintes às remoções mudam de slot
+            message = f"Lote: {format_count(removed)} de {format_count(len(values))} removidos"
+        elif operation == "Inserir Início":
+            for value in values:
+                self.linked_list.insert_start(value)
+            message = f"Lote: {format_count(len(values))} inseridos no início"
+        else:
+            self.linked_list.extend(values)
+            message = f"Lote: {format_count(len(values))} inseridos no fim"
+        self.redraw.request()
+        self.status.config(text=message)
 
     # ================================================================
     # VISUALIZAÇÃO GRÁFICA
     # ================================================================
     
     def visualize_list(self):
-        """Renderiza a representação visual da lista encadeada"""
-        self.canvas.delete("all")  # Limpa o canvas
-        
+        """
+        Renderiza a representação visual da lista encadeada (apenas os itens que mudaram)
+
+        A lista começa na cabeça (centralizada enquanto couber no canvas) e o restante é
+        alcançado pela rolagem. Somente os nós que cruzam a área visível são desenhados; os
+        demais são resumidos em glifos "… N antes" e "N depois …". A cada CHECKPOINT_STEP
+        slots o nó visitado fica guardado, de modo que o próximo desenho parte do atalho
+        mais próximo em vez de percorrer a lista desde a cabeça.
+        """
         # Mostra mensagem se a lista estiver vazia
-        if not self.head:
-            self.canvas.create_text(
+        if not self.linked_list.head:
+            scene = Scene()
+            scene.text(
+                "empty",
                 self.canvas.winfo_width()/2, 
                 self.canvas.winfo_height()/2, 
                 text="Lista Vazia", 
                 font=("Arial", 24), 
                 fill="gray"
             )
+            self.slots = {}
+            self.checkpoints = {}
+            self.renderer.render(scene)
             return
         
         # Obtém dimensões atuais do canvas
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
-        # Configurações de desenho
+        # Configurações de desenho (em coordenadas de mundo, sem zoom)
         node_radius = min(30, canvas_width // 20)  # Raio do nó
         spacing = min(80, canvas_width // 10)      # Espaçamento entre nós
         
-        # Posição inicial (centralizada horizontalmente)
-        x = canvas_width / 2 - ((self.size() - 1) * spacing) / 2
-        y = canvas_height / 2
+        # Cada nó ocupa um "slot" horizontal. O slot do primeiro nó é ancorado no desenho
+        # anterior, de modo que inserir ou remover no início não desloca os demais nós
+        head = self.linked_list.head
+        if head in self.slots:
+            first_slot = self.slots[head]
+        elif head.next in self.slots:
+            first_slot = self.slots[head.next] - 1
+        else:
+            first_slot = 0
+            self.checkpoints = {}  # Âncoras perdidas: os slots foram renumerados
         
-        # Percorre todos os nós para desenhá-los
-        current = self.head
-        while current:
+        # Posição da cabeça: centralizada se a lista couber no canvas, senão na borda
+        # esquerda (o restante é alcançado pela rolagem)
+        count = len(self.linked_list)
+        total_width = (count - 1) * spacing
+        start_x = max(node_radius + 20, canvas_width / 2 - total_width / 2)
+        start_y = canvas_height / 2
+        viewport = self.viewport
+        z = viewport.zoom
+        scene = Scene(origin=viewport.to_screen(start_x - first_slot * spacing, 0))
+        y = start_y * z
+        screen_y = y - viewport.scroll_y
+        
+        # Só a cabeça e o segundo nó são guardados: bastam para ancorar o próximo desenho
+        self.slots = {head: first_slot}
+        if head.next:
+            self.slots[head.next] = first_slot + 1
+        
+        visible_left, _, visible_right, _ = viewport.visible_rect(canvas_width, canvas_height)
+        
+        if spacing * z < MIN_ITEM_PIXELS:
+            # Nível de detalhe reduzido: um bloco único no lugar dos nós
+            block_left = max(visible_left - start_x, -node_radius) + first_slot * spacing
+            block_right = min(visible_right - start_x, total_width + node_radius) + first_slot * spacing
+            if block_left < block_right:
+                scene.rectangle(
+                    "aggregate",
+                    block_left * z, y - node_radius * z,
+                    block_right * z, y + node_radius * z,
+                    fill="lightblue", outline="black", width=1
+                )
+            scene.text(
+                "aggregate_label",
+                *scene.screen(canvas_width / 2, screen_y + node_radius * z + 15),
+                text=f"{format_count(count)} nós",
+                font=("Arial", 10, "bold")
+            )
+            self.renderer.render(scene)
+            return
+        
+        # Nós antes da borda esquerda: a lista é simplesmente encadeada, então o ponteiro
+        # avança até o primeiro visível sem desenhar nada, partindo do atalho mais próximo
+        # antes dele (no máximo CHECKPOINT_STEP passos, em vez de desde a cabeça)
+        hidden_left = min(count, max(0, math.ceil((visible_left - spacing - start_x) / spacing)))
+        checkpoints = self.checkpoints
+        slot = first_slot + hidden_left
+        slot -= slot % CHECKPOINT_STEP
+        while slot > first_slot and slot not in checkpoints:
+            slot -= CHECKPOINT_STEP
+        if slot > first_slot:
+            current, index = checkpoints[slot], slot - first_slot
+        else:
+            current, index = head, 0
+        while index < hidden_left:
+            current = current.next
+            index += 1
+            if (first_slot + index) % CHECKPOINT_STEP == 0:
+                checkpoints[first_slot + index] = current
+        show_values = node_radius * z >= 8
+        value_font = ("Arial", max(1, round(min(12, node_radius//2) * z)), "bold")
+        
+        # Desenha até passar da borda direita; os nós seguintes nem são visitados
+        while current and start_x + index * spacing <= visible_right + spacing:
+            x = (first_slot + index) * spacing * z
+            
             # Cor do nó: destaque se selecionado
             fill_color = "lightgreen" if current == self.selected_node else "lightblue"
             
             # Desenha o nó (círculo)
-            self.canvas.create_oval(
-                x - node_radius, y - node_radius,
-                x + node_radius, y + node_radius,
+            scene.oval(
+                ("node", current),
+                x - node_radius * z, y - node_radius * z,
+                x + node_radius * z, y + node_radius * z,
                 fill=fill_color, outline="black", width=2
             )
             
             # Valor do nó
-            self.canvas.create_text(
-                x, y, 
-                text=str(current.value), 
-                font=("Arial", min(12, node_radius//2), "bold")
-            )
+            if show_values:
+                scene.text(
+                    ("value", current),
+                    x, y, 
+                    text=str(current.value), 
+                    font=value_font
+                )
             
             # Desenha seta para o próximo nó, se existir
             if current.next:
-                self.canvas.create_line(
-                    x + node_radius, y,
-                    x + spacing - node_radius, y,
+                scene.line(
+                    ("arrow", current),
+                    x + node_radius * z, y,
+                    x + (spacing - node_radius) * z, y,
                     arrow=tk.LAST, width=2  # Seta no final da linha
                 )
             
-            # Armazena coordenadas para possível uso futuro
-            current.x = x
-            current.y = y
-            
             # Avança para o próximo nó
             current = current.next
-            x += spacing  # Move para a próxima posição horizontal
\ No newline at end of file
+            index += 1  # Move para a próxima posição horizontal
+        hidden_right = count - index
+        
+        # Quantidade de nós fora do canvas em cada lado (fixos nas bordas)
+        if hidden_left:
+            scene.text(
+                "hidden_left",
+                *scene.screen(10, screen_y + node_radius * z + 20),
+                text=f"… {format_count(hidden_left)} antes",
+                anchor=tk.W, font=("Arial", 9), fill="gray30"
+            )
+        if hidden_right:
+            scene.text(
+                "hidden_right",
+                *scene.screen(canvas_width - 10, screen_y + node_radius * z + 20),
+                text=f"{format_count(hidden_right)} depois …",
+                anchor=tk.E, font=("Arial", 9), fill="gray30"
+            )
+        
+        self.renderer.render(scene)
@@ -0,0 +1,143 @@
+"""
+Operações em Lote para as Visualizações
+
+Descrição:
+Janela compartilhada pelas abas para aplicar muitas operações de uma vez. Os valores podem
+ser digitados ou colados (separados por vírgula, ponto e vírgula ou quebra de linha) ou
+lidos de um arquivo de texto. A aba recebe a lista completa, aplica tudo no núcleo (engine)
+e só então pede um único redesenho e atualiza a barra de status uma vez, em vez de um
+redesenho por valor.
+
+Componentes Principais:
+1. parse_batch: Separa um bloco de texto em valores
+2. read_batch_file: Lê os valores de um arquivo
+   (split_integers converte os valores para as árvores, que guardam inteiros)
+   (format_traversal resume na barra de status os percursos das árvores)
+3. Classe BatchDialog: Janela com a área de texto, a escolha da operação e a abertura
+   de arquivos
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+from itertools import islice
+import re
+import tkinter as tk
+from tkinter import filedialog, messagebox
+
+SEPARATORS = re.compile(r"[,;\r\n]+")  # Vírgula, ponto e vírgula ou quebra de linha
+TRAVERSAL_LIMIT = 200  # Máximo de valores exibidos na barra de status por percurso
+
+def parse_batch(text):
+    """
+    Separa um bloco de texto em valores (espaços nas pontas são removidos)
+
+    Retorna:
+        Lista de valores não vazios, na ordem do texto
+    """
+    return [value.strip() for value in SEPARATORS.split(text) if value.strip()]
+
+def read_batch_file(path):
+    """Lê os valores de um arquivo de texto (mesmos separadores de parse_batch)"""
+    with open(path, encoding="utf-8") as source:
+        return parse_batch(source.read())
+
+def split_integers(values):
+    """
+    Converte os valores em inteiros, descartando os inválidos
+
+    Retorna:
+        Tupla (lista de inteiros, quantidade de valores inválidos)
+    """
+    numbers = []
+    for value in values:
+        try:
+            numbers.append(int(value))
+        except ValueError:
+            pass
+    return numbers, len(values) - len(numbers)
+
+def invalid_note(invalid):
+    """Complemento da mensagem de status para valores inválidos ignorados"""
+    return f" ({invalid} inválidos ignorados)" if invalid else ""
+
+def format_traversal(values):
+    """
+    Formata um percurso para a barra de status consumindo o gerador sob demanda
+
+    Apenas os primeiros TRAVERSAL_LIMIT valores são lidos; o restante da árvore não é
+    percorrido e a mensagem termina com reticências.
+    """
+    prefix = list(islice(values, TRAVERSAL_LIMIT + 1))
+    text = ' '.join(map(str, prefix[:TRAVERSAL_LIMIT]))
+    return text + " …" if len(prefix) > TRAVERSAL_LIMIT else text
+
+class BatchDialog:
+    """
+    Janela de operações em lote
+
+    Atributos:
+        window: Janela (Toplevel) do diálogo
+        text: Área de texto com os valores
+        operation: Variável do Tkinter com a operação escolhida
+        on_apply: Função chamada com (operação, valores) ao aplicar
+    """
+
+    def __init__(self, parent, title, operations, on_apply):
+        """
+        Cria e exibe a janela
+
+        Parâmetros:
+            parent: Widget pai
+            title: Título da janela
+            operations: Nomes das operações disponíveis (a primeira vem selecionada)
+            on_apply: Função chamada com (operação, lista de valores)
+        """
+        self.on_apply = on_apply
+        self.window = tk.Toplevel(parent)
+        self.window.title(title)
+
+        tk.Label(self.window, text="Valores (separados por vírgula ou um por linha):",
+                 anchor=tk.W).pack(fill=tk.X, padx=10, pady=(10, 0))
+        self.text = tk.Text(self.window, width=40, height=12)
+        self.text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        # Escolha da operação
+        self.operation = tk.StringVar(self.window, value=operations[0])
+        operation_frame = tk.Frame(self.window)
+        operation_frame.pack(fill=tk.X, padx=10)
+        for name in operations:
+            tk.Radiobutton(operation_frame, text=name, variable=self.operation,
+                           value=name).pack(side=tk.LEFT)
+
+        # Botões
+        button_frame = tk.Frame(self.window)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+        tk.Button(button_frame, text="Abrir arquivo...", command=self.load_file).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="Cancelar", command=self.window.destroy).pack(side=tk.RIGHT)
+        tk.Button(button_frame, text="Aplicar", command=self.apply).pack(side=tk.RIGHT, padx=5)
+
+    def load_file(self):
+        """Carrega na área de texto os valores de um arquivo escolhido pelo usuário"""
+        path = filedialog.askopenfilename(
+            parent=self.window,
+            filetypes=[("Texto", "*.txt *.csv"), ("Todos os arquivos", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            values = read_batch_file(path)
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Erro", f"Não foi possível ler o arquivo: {e}", parent=self.window)
+            return
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", "\n".join(values))
+
+    def apply(self):
+        """Fecha a janela e entrega os valores à aba"""
+        values = parse_batch(self.text.get("1.0", tk.END))
+        if not values:
+            messagebox.showwarning("Aviso", "Digite ou carregue ao menos um valor", parent=self.window)
+            return
+        self.window.destroy()
+        self.on_apply(self.operation.get(), values)
@@ -19,6 +19,8 @@ Módulos Importados:
 - tkinter: Interface gráfica principal
 - ttk: Componentes temáticos do Tkinter (Notebook para abas)
 - Estruturas personalizadas (binarytree, treeavl, fila, pilha, lista, tabelaHash)
+  construídas sobre o núcleo sem interface gráfica do pacote engine, importadas com
+  importlib apenas quando a aba correspondente é aberta pela primeira vez
 
 Classe Principal:
 MainWindow: Gerencia a janela principal e a organização das abas
@@ -27,20 +29,30 @@ Autor: Agostinho Ferreira (little_agosto)
 Data da última atualização: 02/08/2025
 """
 
+import importlib
 import tkinter as tk
 from tkinter import ttk
-from binarytree import BinaryTree
-from fila import Fila
-from pilha import Pilha
-from lista import ListaEncadeada
-from tabelaHash import HashTable
-from treeavl import AVLTree
+
+# Abas do notebook: (título, módulo, classe da visualização, atributo em MainWindow)
+TABS = [
+    ("Árvore Binária", "binarytree", "BinaryTree", "tree"),
+    ("Árvore AVL", "treeavl", "AVLTree", "avltree"),
+    ("Pilha", "pilha", "Pilha", "stack"),
+    ("Fila", "fila", "Fila", "queue"),
+    ("Lista Encadeada", "lista", "ListaEncadeada", "linked_list"),
+    ("Tabela Hash", "tabelaHash", "HashTable", "hash_table"),
+]
 
 class MainWindow():
     """Classe principal que cria e gerencia a janela da aplicação"""
     
-    def __init__(self):
-        """Inicializa a janela principal com configurações básicas"""
+    def __init__(self, run=True):
+        """
+        Inicializa a janela principal com configurações básicas
+        
+        Parâmetros:
+            run: Entra no laço de eventos do Tkinter (False para apenas montar a janela)
+        """
         self.root = tk.Tk()
         self.root.title("Estruturas De Dados")
         
@@ -59,45 +71,52 @@ class MainWindow():
         
         # Cria os componentes da interface
         self.Options()
-        self.root.mainloop()
+        if run:
+            self.root.mainloop()
         
     def Options(self):
         """
-        Cria o sistema de abas (notebook) e inicializa cada estrutura de dados
-        em seu respectivo frame
-        """
-        notebook = ttk.Notebook(self.root)
-        notebook.pack(fill='both', expand=True)
-        
-        # Cria frames para cada aba
-        frame_arvore = ttk.Frame(notebook)
-        frame_arvoreAVL = ttk.Frame(notebook)
-        frame_pilha = ttk.Frame(notebook)
-        frame_fila = ttk.Frame(notebook)
-        frame_lista = ttk.Frame(notebook)
-        frame_hash = ttk.Frame(notebook)
+        Cria o sistema de abas (notebook) com um frame vazio por estrutura de dados
         
-        # Adiciona as abas ao notebook
-        notebook.add(frame_arvore, text='Árvore Binária')
-        notebook.add(frame_arvoreAVL, text='Árvore AVL')
-        notebook.add(frame_pilha, text='Pilha')
-        notebook.add(frame_fila, text='Fila')
-        notebook.add(frame_lista, text='Lista Encadeada')
-        notebook.add(frame_hash, text='Tabela Hash')
+        Cada estrutura (e o seu módulo) só é carregada quando a aba é selecionada pela
+        primeira vez; a maioria das sessões usa apenas uma ou duas abas.
+        """
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill='both', expand=True)
         
-        # Configura expansão para todos os frames
-        for frame in [frame_arvore, frame_arvoreAVL, frame_pilha, 
-                      frame_fila, frame_lista, frame_hash]:
+        # Cria e adiciona um frame para cada aba
+        self.frames = []
+        for title, _, _, attribute in TABS:
+            frame = ttk.Frame(self.notebook)
             frame.grid_rowconfigure(0, weight=1)
             frame.grid_columnconfigure(0, weight=1)
+            self.notebook.add(frame, text=title)
+            self.frames.append(frame)
+            setattr(self, attribute, None)  # Preenchido em build_tab
+        
+        # Constrói a aba inicial agora e as demais ao serem selecionadas
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        self.on_tab_changed()
+    
+    def on_tab_changed(self, event=None):
+        """Constrói a estrutura da aba selecionada, se ainda não foi construída"""
+        self.build_tab(self.notebook.index(self.notebook.select()))
+    
+    def build_tab(self, index):
+        """
+        Importa o módulo da aba e instancia a estrutura no seu frame (apenas uma vez)
         
-        # Instancia cada estrutura de dados em seu frame correspondente
-        self.tree = BinaryTree(frame_arvore)          # Árvore Binária
-        self.avltree = AVLTree(frame_arvoreAVL)       # Árvore AVL
-        self.stack = Pilha(frame_pilha)               # Pilha
-        self.queue = Fila(frame_fila)                # Fila
-        self.linked_list = ListaEncadeada(frame_lista) # Lista Encadeada
-        self.hash_table = HashTable(frame_hash)       # Tabela Hash
+        Retorna:
+            Visualização da aba
+        """
+        _, module_name, class_name, attribute = TABS[index]
+        view = getattr(self, attribute)
+        if view is None:
+            module = importlib.import_module(module_name)
+            view = getattr(module, class_name)(self.frames[index])
+            setattr(self, attribute, view)
+        return view
     
-# Ponto de entrada da aplicação
-win = MainWindow()
\ No newline at end of file
+# Ponto de entrada da aplicação (importar o módulo não abre a janela)
+if __name__ == "__main__":
+    win = MainWindow()
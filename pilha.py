@@ -7,18 +7,26 @@ com interface gráfica usando Tkinter. Permite realizar operações básicas de
 e visualizar os elementos em formato de pilha vertical com destaque para o topo.
 
 Componentes Principais:
-1. Estrutura de dados: Lista para armazenar os elementos
+1. Estrutura de dados: engine.Pilha (núcleo sem interface gráfica)
 2. Visualização vertical dos elementos empilhados
 3. Destaque especial para o elemento do topo
 4. Seta indicadora do topo da pilha
 5. Feedback visual para operações
+6. Desenho incremental (render.RetainedCanvas): cada operação só toca os itens afetados
+7. Rolagem e zoom, desenhando apenas os elementos visíveis (glifos para os demais)
 
 Autor: Agostinho Ferreira (little_agosto)
 Data da última atualização: 02/08/2025
 """
 
+import math
 import tkinter as tk
 from tkinter import messagebox
+import engine
+from lote import BatchDialog
+from render import Scene, RetainedCanvas, RedrawScheduler, Viewport, format_count
+from render.retained import LAYER_INNER
+from render.viewport import MIN_ITEM_PIXELS
 
 class Pilha:
     """
@@ -26,8 +34,11 @@ class Pilha:
     
     Atributos:
         parent_frame: Frame do Tkinter para conter a visualização
-        stack: Lista para armazenar os elementos da pilha
+        stack: Núcleo da pilha (engine.Pilha) com os elementos
         canvas: Área de desenho para visualização
+        renderer: Renderizador em modo retido sobre o canvas
+        redraw: Agendador que agrupa os pedidos de redesenho
+        viewport: Rolagem e zoom do canvas
         control_frame: Área para controles (entrada e botões)
         status: Barra de status para mensagens
     """
@@ -40,12 +51,17 @@ class Pilha:
             parent_frame: Frame do Tkinter para renderização
         """
         self.parent_frame = parent_frame
-        self.stack = []  # Inicializa pilha vazia
+        self.stack = engine.Pilha()  # Inicializa pilha vazia
         
         # Configuração da área de desenho
         self.canvas = tk.Canvas(self.parent_frame, bg='white')
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.canvas.bind("<Configure>", self.on_resize)  # Redesenha ao redimensionar
+        self.renderer = RetainedCanvas(self.canvas)  # Mantém os itens entre desenhos
+        # Agrupa os redesenhos: no máximo um por quadro e nenhum com a aba escondida
+        self.redraw = RedrawScheduler(self.canvas, self.visualize_stack, self.parent_frame)
+        self.viewport = Viewport()  # Rolagem e zoom (roda do mouse, Ctrl+roda, arraste)
+        self.viewport.attach(self.canvas, self.redraw.request)
         
         # Área de controles
         self.control_frame = tk.Frame(self.parent_frame)
@@ -60,6 +76,7 @@ class Pilha:
         tk.Button(self.control_frame, text="Pop", command=self.pop_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Top", command=self.top_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Limpar", command=self.clear_stack).pack(side=tk.LEFT, padx=5)
+        tk.Button(self.control_frame, text="Lote...", command=self.batch_gui).pack(side=tk.LEFT, padx=5)
         
         # Barra de status
         self.status = tk.Label(self.parent_frame, text="Pilha Vazia", 
@@ -67,11 +84,11 @@ class Pilha:
         self.status.pack(fill=tk.X)
         
         # Desenha a pilha inicial
-        self.visualize_stack()
+        self.redraw.request()
 
     def on_resize(self, event=None):
         """Redesenha a pilha ao redimensionar o canvas"""
-        self.visualize_stack()
+        self.redraw.request()
 
     # ================================================================
     # INTERFACE GRÁFICA PARA OPERAÇÕES
@@ -82,8 +99,8 @@ class Pilha:
         try:
             value = self.entry.get()
             if value:
-                self.push(value)
-                self.visualize_stack()
+                self.stack.push(value)
+                self.redraw.request()
                 self.status.config(text=f"Empilhado: {value}")
                 self.entry.delete(0, tk.END)  # Limpa o campo de entrada
             else:
@@ -98,8 +115,8 @@ class Pilha:
             return
             
         try:
-            value = self.pop()
-            self.visualize_stack()
+            value = self.stack.pop()
+            self.redraw.request()
             self.status.config(text=f"Desempilhado: {value}")
         except Exception as e:
             messagebox.showerror("Erro", str(e))
@@ -111,53 +128,46 @@ class Pilha:
             return
             
         try:
-            value = self.top()
+            value = self.stack.top()
             self.status.config(text=f"Topo: {value}")
         except Exception as e:
             messagebox.showerror("Erro", str(e))
     
     def clear_stack(self):
         """Limpa toda a pilha"""
-        self.stack = []
-        self.visualize_stack()
+        self.stack.clear()
+        self.redraw.request()
         self.status.config(text="Pilha limpa")
 
-    # ================================================================
-    # OPERAÇÕES DA PILHA
-    # ================================================================
-    
-    def push(self, value):
-        """Adiciona um elemento no topo da pilha"""
-        self.stack.append(value)
-    
-    def pop(self):
-        """Remove e retorna o elemento do topo"""
-        if not self.stack:
-            raise IndexError("Pilha vazia!")
-        return self.stack.pop()
-    
-    def top(self):
-        """Retorna o elemento do topo sem removê-lo"""
-        if not self.stack:
-            raise IndexError("Pilha vazia!")
-        return self.stack[-1]
-    
-    def is_empty(self):
-        """Verifica se a pilha está vazia"""
-        return len(self.stack) == 0
+    def batch_gui(self):
+        """Abre a janela de operações em lote (valores digitados, colados ou de arquivo)"""
+        BatchDialog(self.parent_frame, "Pilha - Lote", ["Push"], self.apply_batch)
     
-    def size(self):
-        """Retorna o número de elementos na pilha"""
-        return len(self.stack)
+    def apply_batch(self, operation, values):
+        """
+        Empilha um lote de valores com um único redesenho
+
+        Parâmetros:
+            operation: Operação escolhida ("Push")
+            values: Valores do lote, da base para o topo
+        """
+        for value in values:
+            self.stack.push(value)
+        self.redraw.request()
+        self.status.config(text=f"Lote: {format_count(len(values))} empilhados")
 
     # ================================================================
     # VISUALIZAÇÃO GRÁFICA
     # ================================================================
     
     def visualize_stack(self):
-        """Renderiza a representação visual da pilha"""
-        self.canvas.delete("all")  # Limpa o canvas
+        """
+        Renderiza a representação visual da pilha (apenas os itens que mudaram)
         
+        Somente os elementos que cruzam a área visível são desenhados; os demais são
+        resumidos em glifos "… N abaixo" / "… N acima". Com zoom muito reduzido a pilha
+        inteira vira um único bloco com a contagem de elementos.
+        """
         # Obtém dimensões atuais do canvas
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
@@ -167,66 +177,129 @@ class Pilha:
             canvas_width = 300
             canvas_height = 300
         
-        # Mostra mensagem se a pilha estiver vazia
+        # Mostra mensagem se a pilha estiver vazia (fixa na tela)
         if not self.stack:
-            self.canvas.create_text(
+            scene = Scene()
+            scene.text(
+                "empty",
                 canvas_width/2, canvas_height/2, 
                 text="Pilha Vazia", 
                 font=("Arial", 24), 
                 fill="gray"
             )
+            self.renderer.render(scene)
             return
         
-        # Configurações de desenho
+        # Configurações de desenho (em coordenadas de mundo, sem zoom)
         element_width = min(100, canvas_width // 6)   # Largura do elemento
         element_height = min(60, canvas_height // 10) # Altura do elemento
         spacing = 10  # Espaçamento entre elementos
+        pitch = element_height + spacing
+        count = len(self.stack)
         
         # Posição inicial (base da pilha)
         start_x = canvas_width / 2
         start_y = canvas_height - 50  # Começa a empilhar a partir da base
         
+        # A cena usa coordenadas de mundo multiplicadas pelo zoom; a rolagem fica na origem
+        viewport = self.viewport
+        z = viewport.zoom
+        scene = Scene(origin=viewport.to_screen())
+        screen_x = start_x * z - viewport.scroll_x
+        
         # Desenha a seta indicadora do topo
-        if self.stack:
-            # Calcula a posição do topo
-            top_y = start_y - (len(self.stack) * (element_height + spacing) + element_height/2)
-            # Seta apontando para o topo
-            self.canvas.create_line(
-                start_x + element_width/2 + 20, top_y,
-                start_x + element_width/2 + 40, top_y,
-                arrow=tk.LAST, width=2
-            )
-            # Rótulo "Topo"
-            self.canvas.create_text(
-                start_x + element_width/2 + 50, top_y - 10,
-                text="Topo", 
-                font=("Arial", 10)
+        top_y = start_y - (count * pitch + element_height/2)
+        # Seta apontando para o topo
+        scene.line(
+            "top_arrow",
+            (start_x + element_width/2 + 20) * z, top_y * z,
+            (start_x + element_width/2 + 40) * z, top_y * z,
+            arrow=tk.LAST, width=2
+        )
+        # Rótulo "Topo"
+        scene.text(
+            "top_label",
+            (start_x + element_width/2 + 50) * z, (top_y - 10) * z,
+            text="Topo", 
+            font=("Arial", 10)
+        )
+        
+        _, visible_top, _, visible_bottom = viewport.visible_rect(
+            canvas_width, canvas_height, margin=element_height * z)
+        
+        if element_height * z < MIN_ITEM_PIXELS:
+            # Nível de detalhe reduzido: um bloco único no lugar dos elementos
+            block_top = max(visible_top, start_y - (count - 1) * pitch - element_height/2)
+            block_bottom = min(visible_bottom, start_y + element_height/2)
+            if block_top < block_bottom:
+                scene.rectangle(
+                    "aggregate",
+                    (start_x - element_width/2) * z, block_top * z,
+                    (start_x + element_width/2) * z, block_bottom * z,
+                    fill="lightblue", outline="black", width=1
+                )
+            scene.text(
+                "aggregate_label",
+                *scene.screen(screen_x, canvas_height / 2),
+                text=f"{format_count(count)} elementos",
+                font=("Arial", 10, "bold")
             )
+            self.renderer.render(scene)
+            return
+        
+        # Intervalo [first, last) de posições (a partir da base) que cruzam a tela
+        first = min(count, max(0, math.ceil((start_y - visible_bottom) / pitch)))
+        last = min(count, max(first, math.floor((start_y - visible_top) / pitch) + 1))
+        show_values = element_height * z >= 12
+        font_size = max(1, round(min(12, element_width//8) * z))
         
-        # Desenha cada elemento da pilha (de baixo para cima)
-        for i, value in enumerate(self.stack):
+        # Desenha cada elemento visível da pilha (de baixo para cima)
+        # A chave é a posição a partir da base: um push só cria os itens do novo topo
+        for i in range(first, last):
+            value = self.stack.items[i]
             # Posição vertical do elemento
-            y = start_y - i * (element_height + spacing)
+            y = start_y - i * pitch
             
             # Retângulo do elemento
-            self.canvas.create_rectangle(
-                start_x - element_width/2, y - element_height/2,
-                start_x + element_width/2, y + element_height/2,
+            scene.rectangle(
+                ("box", i),
+                (start_x - element_width/2) * z, (y - element_height/2) * z,
+                (start_x + element_width/2) * z, (y + element_height/2) * z,
                 fill="lightblue", outline="black", width=2
             )
             
             # Valor do elemento
-            self.canvas.create_text(
-                start_x, y,
-                text=str(value), 
-                font=("Arial", min(12, element_width//8), "bold")
+            if show_values:
+                scene.text(
+                    ("value", i),
+                    start_x * z, y * z,
+                    text=str(value), 
+                    font=("Arial", font_size, "bold")
+                )
+        
+        # Glifos com a quantidade de elementos fora da tela (fixos nas bordas)
+        if first > 0:
+            scene.text(
+                "hidden_below",
+                *scene.screen(screen_x, canvas_height - 12),
+                text=f"… {format_count(first)} abaixo",
+                font=("Arial", 9), fill="gray30"
+            )
+        if last < count:
+            scene.text(
+                "hidden_above",
+                *scene.screen(screen_x, 12),
+                text=f"… {format_count(count - last)} acima",
+                font=("Arial", 9), fill="gray30"
             )
         
         # Destaca o elemento do topo com um retângulo vermelho tracejado
-        if self.stack:
-            top_y = start_y - (len(self.stack) * (element_height + spacing)) + element_height/2
-            self.canvas.create_rectangle(
-                start_x - element_width/2 - 5, top_y - element_height/2 - 5,
-                start_x + element_width/2 + 5, top_y + element_height/2 + 5,
-                outline="red", width=2, dash=(4, 2),
-            )
\ No newline at end of file
+        top_y = start_y - (count * pitch) + element_height/2
+        scene.rectangle(
+            "top_highlight",
+            (start_x - element_width/2 - 5) * z, (top_y - element_height/2 - 5) * z,
+            (start_x + element_width/2 + 5) * z, (top_y + element_height/2 + 5) * z,
+            outline="red", width=2, dash=(4, 2), layer=LAYER_INNER,
+        )
+        
+        self.renderer.render(scene)
\ No newline at end of file
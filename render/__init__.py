@@ -0,0 +1,33 @@
+"""
+Renderização das Visualizações
+
+Descrição:
+Este pacote reúne o código de desenho compartilhado pelas abas da interface gráfica. As
+visualizações descrevem o desenho como uma cena (Scene) e o RetainedCanvas aplica no canvas
+apenas as diferenças em relação ao desenho anterior.
+
+Componentes Disponíveis:
+- Scene: Descrição de um desenho como dicionário chave -> item
+- RetainedCanvas: Sincroniza os itens do canvas com a última cena
+- Viewport: Rolagem e zoom, com o retângulo visível usado para recortar o desenho
+- TidyLayout: Layout organizado (Reingold-Tilford) incremental para árvores encadeadas
+- RedrawScheduler: Agrupa os pedidos de redesenho de uma aba em um desenho por quadro
+
+Submódulos importados sob demanda:
+- render.scenes: Cenas das árvores e da tabela hash descritas sem canvas
+- render.svg: Gravação de cenas em SVG
+- render.export: Exportação de estados em lote (SVG/PNG) em processos paralelos
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+from .retained import Scene, RetainedCanvas
+from .viewport import Viewport, format_count
+from .scheduler import RedrawScheduler
+from .layout import TidyLayout, NODE_SPACING
+
+__all__ = [
+    "Scene", "RetainedCanvas", "Viewport", "format_count", "RedrawScheduler",
+    "TidyLayout", "NODE_SPACING",
+]
@@ -0,0 +1,179 @@
+"""
+Exportação de Estados das Estruturas em Lote (SVG/PNG, sem display)
+
+Descrição:
+Grava imagens de estados (snapshots) de engine.AVLTree, engine.BinaryTree,
+engine.HashTable e engine.OpenHashTable sem abrir nenhuma janela: a cena de cada estrutura
+é descrita por render.scenes e gravada pelo escritor SVG (render.svg) ou, opcionalmente, em
+PNG com o Pillow. Como nada disso depende do Tkinter, milhares de estados podem ser
+exportados em paralelo, um processo por núcleo (concurrent.futures.ProcessPoolExecutor).
+
+Uso:
+    from render.export import export_snapshots
+    export_snapshots({"passo_001": arvore1, "passo_002": arvore2}, "relatorio/", fmt="svg")
+
+Observação:
+O PNG depende do Pillow (pip install pillow), que não é obrigatório para o restante do
+projeto; sem ele, pedir PNG gera um ImportError explicativo antes de qualquer trabalho.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .scenes import structure_scene
+from .svg import DEFAULT_OPTIONS, svg_color, write_svg
+
+DEFAULT_WIDTH = 800
+DEFAULT_HEIGHT = 600
+
+# Âncoras de texto do Tk -> âncoras do Pillow (horizontal + vertical)
+PIL_ANCHORS = {
+    "center": "mm", "n": "mt", "s": "mb", "e": "rm", "w": "lm",
+    "ne": "rt", "nw": "lt", "se": "rb", "sw": "lb",
+}
+
+# Fontes TrueType procuradas (a primeira encontrada é usada)
+FONT_FILES = {
+    False: ("DejaVuSans.ttf", "arial.ttf", "Arial.ttf"),
+    True: ("DejaVuSans-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf"),
+}
+
+def require_pillow():
+    """
+    Importa o Pillow, que é opcional
+
+    Retorna:
+        Os módulos (Image, ImageDraw, ImageFont)
+    """
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError as error:
+        raise ImportError("A exportação em PNG requer o Pillow: pip install pillow "
+                          "(a exportação em SVG não tem dependências)") from error
+    return Image, ImageDraw, ImageFont
+
+def load_font(image_font, font, cache):
+    """Carrega (com cache) a fonte do Pillow equivalente a uma fonte do Tk"""
+    if isinstance(font, str):
+        font = font.split()
+    size = int(font[1]) if len(font) > 1 else 10
+    pixels = max(1, round(size * 4 / 3) if size >= 0 else -size)  # Pontos -> pixels
+    bold = "bold" in font[2:]
+    if (pixels, bold) not in cache:
+        loaded = None
+        for name in FONT_FILES[bold]:
+            try:
+                loaded = image_font.truetype(name, pixels)
+                break
+            except OSError:
+                continue
+        if loaded is None:
+            try:
+                loaded = image_font.load_default(size=pixels)  # Pillow >= 10.1
+            except TypeError:
+                loaded = image_font.load_default()
+        cache[(pixels, bold)] = loaded
+    return cache[(pixels, bold)]
+
+def write_png(scene, path, width, height, background="white"):
+    """
+    Grava a cena como arquivo PNG (requer o Pillow)
+
+    Parâmetros:
+        scene: Scene a gravar
+        path: Caminho do arquivo
+        width, height: Dimensões da imagem
+        background: Cor de fundo
+    """
+    image_module, draw_module, font_module = require_pillow()
+    image = image_module.new("RGB", (width, height), svg_color(background))
+    draw = draw_module.Draw(image)
+    fonts = {}
+    ox, oy = scene.origin
+
+    def color(value):
+        return None if not value else svg_color(value)
+
+    for _, (kind, coords, options, _) in scene.ordered():
+        options = {**DEFAULT_OPTIONS[kind], **options}
+        points = [(x + ox, y + oy) for x, y in zip(coords[0::2], coords[1::2])]
+        line_width = max(1, round(options.get("width", 1)))
+
+        if kind == "line":
+            draw.line(points, fill=color(options["fill"]), width=line_width)
+        elif kind in ("oval", "rectangle"):
+            (x0, y0), (x1, y1) = points
+            box = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+            shape = draw.ellipse if kind == "oval" else draw.rectangle
+            shape(box, fill=color(options["fill"]), outline=color(options["outline"]),
+                  width=line_width)
+        elif kind == "polygon":
+            draw.polygon(points, fill=color(options["fill"]), outline=color(options["outline"]))
+        elif kind == "text":
+            font = load_font(font_module, options["font"], fonts)
+            anchor = PIL_ANCHORS.get(options["anchor"], "mm")
+            try:
+                draw.text(points[0], str(options.get("text", "")), fill=color(options["fill"]),
+                          font=font, anchor=anchor)
+            except ValueError:
+                # Fontes bitmap antigas não aceitam âncora: posiciona pelo canto
+                draw.text(points[0], str(options.get("text", "")), fill=color(options["fill"]),
+                          font=font)
+    image.save(path, "PNG")
+
+WRITERS = {
+    "svg": write_svg,
+    "png": write_png,
+}
+
+def render_snapshot(job):
+    """
+    Desenha e grava um estado (executado nos processos de trabalho)
+
+    Parâmetros:
+        job: Tupla (caminho, estrutura, formato, largura, altura)
+
+    Retorna:
+        Caminho do arquivo gravado
+    """
+    path, structure, fmt, width, height = job
+    WRITERS[fmt](structure_scene(structure, width, height), path, width, height)
+    return path
+
+def export_snapshots(snapshots, directory, fmt="svg", width=DEFAULT_WIDTH,
+                     height=DEFAULT_HEIGHT, workers=None):
+    """
+    Exporta vários estados de estruturas para um diretório, em paralelo
+
+    Parâmetros:
+        snapshots: Dicionário nome -> estrutura, ou iterável de pares (nome, estrutura)
+        directory: Diretório de saída (criado se não existir)
+        fmt: "svg" (padrão) ou "png"
+        width, height: Dimensões das imagens
+        workers: Número de processos (padrão: um por núcleo; 1 desenha no próprio processo)
+
+    Retorna:
+        Lista com os caminhos gravados, na ordem dos estados recebidos
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"Formato de exportação inválido: {fmt} (use {', '.join(WRITERS)})")
+    if fmt == "png":
+        require_pillow()  # Falha antes de distribuir o trabalho
+
+    if hasattr(snapshots, "items"):
+        snapshots = snapshots.items()
+    os.makedirs(directory, exist_ok=True)
+    jobs = [(os.path.join(directory, f"{name}.{fmt}"), structure, fmt, width, height)
+            for name, structure in snapshots]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        return [render_snapshot(job) for job in jobs]
+
+    # Lotes de tarefas por envio reduzem a troca de mensagens entre processos
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render_snapshot, jobs, chunksize=chunksize))
@@ -0,0 +1,156 @@
+"""
+Layout Organizado (Tidy Tree) para Árvores Binárias Encadeadas
+
+Descrição:
+Implementa o layout de Reingold-Tilford: cada subárvore é desenhada de forma compacta e os
+dois filhos de um nó são afastados apenas o necessário para que seus contornos (o x mais à
+esquerda e o mais à direita em cada profundidade) fiquem a pelo menos NODE_SPACING de
+distância. O resultado nunca sobrepõe nós nem arestas, e subárvores iguais têm o mesmo
+desenho em qualquer posição.
+
+Cada nó recebe um registro (Extent) com as posições dos filhos relativas a ele e os
+contornos da subárvore. As posições absolutas não são guardadas: o desenho as acumula
+descendo a partir da raiz, e a extensão de cada subárvore permite pular as que estão fora
+da tela. Assim, uma inserção ou remoção só recalcula os registros do caminho alterado até a
+raiz (O(h) registros de O(h) cada), sem refazer o restante da árvore.
+
+Observação:
+Os nós precisam ter os atributos left, right e height (altura da subárvore, usada para
+recalcular os filhos antes dos pais).
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+NODE_SPACING = 50  # Distância horizontal mínima (em pixels de mundo) entre dois nós
+
+class Extent:
+    """
+    Registro de layout de uma subárvore (coordenadas relativas ao nó raiz dela)
+
+    Atributos:
+        left_offset, right_offset: Deslocamento em x de cada filho em relação ao nó
+        left_contour, right_contour: Menor e maior x em cada profundidade da subárvore
+        min_x, max_x: Extensão horizontal da subárvore inteira
+        count: Número de nós da subárvore
+    """
+
+    def __init__(self, left_offset, right_offset, left_contour, right_contour, count):
+        """Inicializa o registro com os dados calculados por TidyLayout.compute"""
+        self.left_offset = left_offset
+        self.right_offset = right_offset
+        self.left_contour = left_contour
+        self.right_contour = right_contour
+        self.min_x = min(left_contour)
+        self.max_x = max(right_contour)
+        self.count = count
+
+class TidyLayout:
+    """
+    Mantém os registros de layout (Extent) dos nós de uma árvore binária encadeada
+
+    Atributos:
+        spacing: Distância horizontal mínima entre nós
+        records: Dicionário nó -> Extent
+    """
+
+    def __init__(self, spacing=NODE_SPACING):
+        """
+        Inicializa um layout vazio
+
+        Parâmetros:
+            spacing: Distância horizontal mínima entre nós
+        """
+        self.spacing = spacing
+        self.records = {}
+
+    def __getitem__(self, node):
+        """Retorna o registro de layout do nó"""
+        return self.records[node]
+
+    def update(self, root, changed=()):
+        """
+        Atualiza o layout depois de uma ou mais mudanças na árvore
+
+        Parâmetros:
+            root: Raiz atual da árvore
+            changed: Nós cujas subárvores mudaram, incluindo todos os seus ancestrais
+                     (nós novos, ainda sem registro, são calculados automaticamente)
+        """
+        if root is None:
+            self.records = {}
+            return
+        # Filhos antes dos pais: a altura do filho é sempre menor que a do pai
+        for node in sorted(changed, key=lambda node: node.height):
+            self.compute(node)
+        if root not in self.records:
+            self.layout_subtree(root)
+
+        # Registros de nós removidos se acumulam; refaz tudo quando passam do dobro
+        if len(self.records) > 2 * self.records[root].count + 64:
+            self.rebuild(root)
+
+    def rebuild(self, root):
+        """Descarta todos os registros e refaz o layout da árvore inteira"""
+        self.records = {}
+        if root is not None:
+            self.layout_subtree(root)
+
+    def layout_subtree(self, root):
+        """Calcula (em pós-ordem, sem recursão) os registros que faltam na subárvore"""
+        records = self.records
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                self.compute(node)
+                continue
+            stack.append((node, True))
+            for child in (node.left, node.right):
+                if child is not None and child not in records:
+                    stack.append((child, False))
+
+    def compute(self, node):
+        """
+        Calcula o registro de um nó a partir dos registros dos filhos
+
+        Os filhos são afastados simetricamente até que, em todas as profundidades
+        compartilhadas, o contorno direito da subárvore esquerda fique a pelo menos
+        spacing do contorno esquerdo da subárvore direita.
+        """
+        records, spacing = self.records, self.spacing
+        left, right = node.left, node.right
+        for child in (left, right):
+            if child is not None and child not in records:
+                self.layout_subtree(child)
+        left_record = records[left] if left is not None else None
+        right_record = records[right] if right is not None else None
+
+        left_offset = right_offset = 0.0
+        if left_record and right_record:
+            gap = max(a - b for a, b in zip(left_record.right_contour,
+                                            right_record.left_contour)) + spacing
+            left_offset, right_offset = -gap / 2, gap / 2
+        elif left_record:
+            left_offset = -spacing / 2   # Filho único ainda indica o lado
+        elif right_record:
+            right_offset = spacing / 2
+
+        # Contornos: o lado esquerdo vem da subárvore esquerda enquanto ela existir
+        # (e o direito, da direita); abaixo disso, do filho mais profundo
+        left_contour = [0.0]
+        right_contour = [0.0]
+        count = 1
+        if left_record:
+            left_contour.extend(x + left_offset for x in left_record.left_contour)
+            count += left_record.count
+        if right_record:
+            right_contour.extend(x + right_offset for x in right_record.right_contour)
+            count += right_record.count
+            depth = len(left_contour) - 1
+            left_contour.extend(x + right_offset for x in right_record.left_contour[depth:])
+        if left_record:
+            depth = len(right_contour) - 1
+            right_contour.extend(x + left_offset for x in left_record.right_contour[depth:])
+
+        records[node] = Extent(left_offset, right_offset, left_contour, right_contour, count)
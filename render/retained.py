@@ -0,0 +1,215 @@
+"""
+Renderização em Modo Retido para o Canvas
+
+Descrição:
+Em vez de apagar o canvas inteiro (canvas.delete("all")) e recriar todos os itens a cada
+operação, as visualizações descrevem o desenho desejado como uma cena: um dicionário que
+associa uma chave estável (o índice de um elemento, a identidade de um nó etc.) ao item
+que a representa. O RetainedCanvas guarda o id de canvas de cada chave e, a cada nova cena,
+só cria os itens novos, move ou reconfigura os que mudaram e apaga os que sumiram.
+
+Componentes Principais:
+1. Classe Scene: Descrição do desenho (tipo, coordenadas, opções e camada de cada item)
+2. Classe RetainedCanvas: Aplica a diferença entre a cena anterior e a nova no canvas
+3. Camadas: Mantêm a ordem de sobreposição (arestas < formas < formas internas < textos)
+   mesmo quando um item é criado depois dos que deveriam ficar acima dele
+4. Origem da cena: Deslocar a cena inteira (ex.: recentralizar a fila) custa uma única
+   chamada canvas.move, sem atualizar item por item
+
+Observação:
+Nenhum destes objetos importa o Tkinter; o RetainedCanvas apenas chama os métodos do canvas
+recebido (create_*, coords, itemconfig, delete, move, tag_raise).
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+SCENE_TAG = "scene"  # Tag comum a todos os itens desenhados pelo RetainedCanvas
+
+# Camadas de sobreposição (as maiores ficam por cima)
+LAYER_EDGES = 0
+LAYER_SHAPES = 1
+LAYER_INNER = 2
+LAYER_TEXT = 3
+LAYER_TAGS = ("layer0", "layer1", "layer2", "layer3")
+
+# Camada padrão de cada tipo de item
+DEFAULT_LAYERS = {
+    "line": LAYER_EDGES,
+    "rectangle": LAYER_SHAPES,
+    "oval": LAYER_SHAPES,
+    "polygon": LAYER_SHAPES,
+    "text": LAYER_TEXT,
+}
+
+class Scene:
+    """
+    Descrição de um desenho completo como dicionário chave -> item
+
+    Cada item é uma tupla (tipo, coordenadas, opções, camada), em que tipo é o sufixo do
+    método create_* do canvas ("line", "oval", "rectangle", "polygon", "text").
+
+    Atributos:
+        items: Dicionário chave -> (tipo, coordenadas, opções, camada)
+        origin: Deslocamento (x, y) aplicado a todas as coordenadas da cena
+    """
+
+    def __init__(self, origin=(0, 0)):
+        """Inicializa uma cena vazia com a origem informada"""
+        self.items = {}
+        self.origin = origin
+
+    def __len__(self):
+        """Retorna o número de itens da cena"""
+        return len(self.items)
+
+    def screen(self, x, y):
+        """Converte um ponto de tela para coordenadas da cena (itens fixos na tela)"""
+        return (x - self.origin[0], y - self.origin[1])
+
+    def ordered(self):
+        """
+        Retorna os itens (chave, item) na ordem de desenho: por camada e, dentro de cada
+        camada, na ordem em que foram adicionados (a mesma ordem que o canvas exibe)
+        """
+        return sorted(self.items.items(), key=lambda entry: entry[1][3])
+
+    def add(self, key, kind, coords, options, layer=None):
+        """
+        Adiciona (ou substitui) um item na cena
+
+        Parâmetros:
+            key: Chave estável do item (qualquer objeto hashable)
+            kind: Tipo do item ("line", "oval", "rectangle", "polygon", "text")
+            coords: Sequência de coordenadas x0, y0, x1, y1, ...
+            options: Dicionário de opções do item (fill, text, font...)
+            layer: Camada de sobreposição (padrão: conforme o tipo)
+        """
+        if layer is None:
+            layer = DEFAULT_LAYERS[kind]
+        self.items[key] = (kind, tuple(coords), options, layer)
+
+    def line(self, key, *coords, layer=None, **options):
+        """Adiciona uma linha (aresta, seta)"""
+        self.add(key, "line", coords, options, layer)
+
+    def oval(self, key, *coords, layer=None, **options):
+        """Adiciona uma elipse (nó)"""
+        self.add(key, "oval", coords, options, layer)
+
+    def rectangle(self, key, *coords, layer=None, **options):
+        """Adiciona um retângulo (elemento, bucket, slot)"""
+        self.add(key, "rectangle", coords, options, layer)
+
+    def polygon(self, key, *coords, layer=None, **options):
+        """Adiciona um polígono"""
+        self.add(key, "polygon", coords, options, layer)
+
+    def text(self, key, *coords, layer=None, **options):
+        """Adiciona um texto"""
+        self.add(key, "text", coords, options, layer)
+
+class RetainedCanvas:
+    """
+    Mantém os itens de um canvas sincronizados com a última cena desenhada
+
+    Atributos:
+        canvas: Canvas (Tkinter ou compatível) onde os itens são desenhados
+        ids: Dicionário chave -> id do item no canvas
+        drawn: Dicionário chave -> (tipo, coordenadas, opções, camada) desenhado
+        origin: Origem atualmente aplicada aos itens do canvas
+        last_changes: Quantidade de chamadas ao canvas feitas no último render
+    """
+
+    def __init__(self, canvas):
+        """
+        Inicializa o renderizador sobre um canvas
+
+        Parâmetros:
+            canvas: Canvas onde os itens serão desenhados
+        """
+        self.canvas = canvas
+        self.ids = {}
+        self.drawn = {}
+        self.origin = (0, 0)
+        self.last_changes = 0
+
+    def render(self, scene):
+        """
+        Atualiza o canvas para refletir a cena, tocando apenas nos itens que mudaram
+
+        Parâmetros:
+            scene: Scene com o desenho desejado
+
+        Retorna:
+            Quantidade de chamadas feitas ao canvas
+        """
+        canvas, ids, drawn = self.canvas, self.ids, self.drawn
+        changes = 0
+
+        # Desloca todos os itens de uma vez se a origem da cena mudou
+        ox, oy = scene.origin
+        if (ox, oy) != self.origin:
+            if ids:
+                canvas.move(SCENE_TAG, ox - self.origin[0], oy - self.origin[1])
+                changes += 1
+            self.origin = (ox, oy)
+
+        # Apaga os itens que não fazem mais parte da cena
+        removed = [key for key in drawn if key not in scene.items]
+        if removed:
+            canvas.delete(*[ids.pop(key) for key in removed])
+            for key in removed:
+                del drawn[key]
+            changes += 1
+
+        created_layers = set()
+        for key, item in scene.items.items():
+            previous = drawn.get(key)
+            if previous == item:
+                continue
+            kind, coords, options, layer = item
+            if (previous is None or previous[0] != kind or previous[3] != layer
+                    or previous[2].keys() != options.keys()):
+                # Item novo (ou de outro tipo/camada/conjunto de opções): recria
+                if previous is not None:
+                    canvas.delete(ids[key])
+                    changes += 1
+                ids[key] = getattr(canvas, "create_" + kind)(
+                    *self.translate(coords), tags=(SCENE_TAG, LAYER_TAGS[layer]), **options)
+                created_layers.add(layer)
+                changes += 1
+            else:
+                if previous[1] != coords:
+                    canvas.coords(ids[key], *self.translate(coords))
+                    changes += 1
+                if previous[2] != options:
+                    changed = {name: value for name, value in options.items()
+                               if previous[2][name] != value}
+                    canvas.itemconfig(ids[key], **changed)
+                    changes += 1
+            drawn[key] = item
+
+        # Itens novos nascem no topo: restaura a ordem das camadas acima deles
+        if created_layers:
+            for layer in range(min(created_layers) + 1, len(LAYER_TAGS)):
+                canvas.tag_raise(LAYER_TAGS[layer])
+                changes += 1
+
+        self.last_changes = changes
+        return changes
+
+    def translate(self, coords):
+        """Converte coordenadas da cena para coordenadas do canvas"""
+        ox, oy = self.origin
+        if not ox and not oy:
+            return coords
+        return tuple(value + (oy if index % 2 else ox) for index, value in enumerate(coords))
+
+    def reset(self):
+        """Apaga todos os itens desenhados e esquece a cena anterior"""
+        if self.ids:
+            self.canvas.delete(*self.ids.values())
+        self.ids = {}
+        self.drawn = {}
+        self.origin = (0, 0)
@@ -0,0 +1,646 @@
+"""
+Cenas das Estruturas (desenho independente do backend)
+
+Descrição:
+Funções puras que descrevem o desenho de uma estrutura do pacote engine como uma Scene,
+sem tocar em nenhum canvas. A mesma cena pode ser aplicada ao canvas do Tkinter
+(RetainedCanvas, nas abas da interface) ou gravada sem display nenhum (render.svg e
+render.export), o que permite exportar milhares de estados em processos paralelos.
+
+Funções Disponíveis:
+- binarytree_scene: Árvore binária completa (engine.BinaryTree)
+- avltree_scene: Árvore AVL (engine.AVLTree) em layout organizado
+- hashtable_scene: Tabela hash com encadeamento ou endereçamento aberto
+- structure_scene: Escolhe a função conforme o tipo da estrutura
+
+Observação:
+As coordenadas passam pela Viewport (rolagem e zoom) quando uma é informada; sem ela, a
+cena corresponde à vista inicial da aba.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+import math
+
+import engine
+from .retained import Scene, LAYER_EDGES, LAYER_INNER
+from .viewport import Viewport, MIN_ITEM_PIXELS, format_count
+from .layout import TidyLayout, NODE_SPACING
+
+MIN_BUCKET_WIDTH = 60  # Largura mínima dos buckets (além dela, a tabela rola na horizontal)
+
+def empty_scene(width, height, message):
+    """Cena com uma mensagem centralizada (estrutura vazia)"""
+    scene = Scene()
+    scene.text(
+        "empty",
+        width / 2,
+        height / 2,
+        text=message,
+        font=("Arial", 24),
+        fill="gray"
+    )
+    return scene
+
+# ================================================================
+# ÁRVORE BINÁRIA COMPLETA
+# ================================================================
+
+def binarytree_scene(tree, width, height, viewport=None, selected=-1):
+    """
+    Descreve a árvore binária completa como cena
+
+    Somente os nós dentro da área visível são desenhados. Quando os nós de um nível
+    ficam sobrepostos (zoom reduzido ou árvore muito larga), as subárvores abaixo do
+    último nível legível viram triângulos, com o total de nós escondidos no canto.
+
+    Parâmetros:
+        tree: engine.BinaryTree
+        width, height: Dimensões da área de desenho
+        viewport: Rolagem e zoom (padrão: vista inicial)
+        selected: Índice do nó destacado (-1 para nenhum)
+    """
+    if tree.is_empty():
+        return empty_scene(width, height, "Árvore Vazia")
+    viewport = viewport or Viewport()
+
+    # Calcula dimensões (a árvore completa tem altura log2(n) + 1)
+    values = tree.values
+    count = len(values)
+    tree_height = count.bit_length()
+    vertical_spacing = (height - 100) / tree_height
+
+    # Layout por intervalos: no nível L cada nó ocupa uma fatia de largura W / 2^L,
+    # centralizada sob a fatia do pai. Assim a faixa visível de cada nível é obtida
+    # por conta, sem visitar os nós fora da tela. Numa árvore completa este é o
+    # próprio layout organizado (Reingold-Tilford) quando o último nível recebe
+    # NODE_SPACING por nó; W é o maior entre essa largura e a do canvas, centralizado.
+    tree_width = max(width, (1 << (tree_height - 1)) * NODE_SPACING)
+    offset = (width - tree_width) / 2
+    z = viewport.zoom
+    scene = Scene(origin=viewport.to_screen(offset, 0))
+    x0, y0, x1, y1 = viewport.visible_rect(width, height, margin=20 * z)
+    x0, x1 = x0 - offset, x1 - offset  # Coordenadas relativas ao início da árvore
+
+    visible = range(0)  # Posições visíveis do nível anterior
+    for level in range(tree_height):
+        first = (1 << level) - 1                  # Primeiro índice do nível
+        present = min(1 << level, count - first)  # Nós presentes no nível
+        slot = tree_width / (1 << level)          # Largura da fatia de cada nó
+        y = 50 + level * vertical_spacing
+
+        if slot * z < MIN_ITEM_PIXELS:
+            # Nós sobrepostos: recolhe as subárvores abaixo do nível anterior
+            # (ou a árvore inteira, se nem a raiz cabe)
+            bottom = 50 + (tree_height - 1) * vertical_spacing
+            if level == 0:
+                hidden = draw_collapsed(scene, tree, z, 0, slot, range(1), y, bottom,
+                                        include_root=True)
+            else:
+                hidden = draw_collapsed(scene, tree, z, (first - 1) // 2, slot * 2, visible,
+                                        y - vertical_spacing, bottom)
+            # Total de nós escondidos nos triângulos visíveis (fixo no canto da tela)
+            if hidden:
+                scene.text(
+                    "collapsed_count",
+                    *scene.screen(10, height - 12),
+                    text=f"… {format_count(hidden)} nós recolhidos",
+                    anchor="w", font=("Arial", 9), fill="gray30"
+                )
+            break
+        if y > y1:
+            break  # Este nível e os seguintes estão abaixo da tela
+
+        visible = range(max(0, math.floor(x0 / slot - 0.5)),
+                        min(present, math.ceil(x1 / slot - 0.5) + 1))
+        if y < y0:
+            continue  # Nível acima da tela
+
+        radius = min(20, 0.45 * slot) * z
+        for position in visible:
+            index = first + position
+            x = (position + 0.5) * slot
+
+            # Aresta até o pai (identificada pelo índice do filho)
+            if index > 0:
+                parent_x = (position // 2 + 0.5) * slot * 2
+                scene.line(
+                    ("edge", index),
+                    parent_x * z, (y - vertical_spacing) * z,
+                    x * z, y * z,
+                    fill="blue", width=2
+                )
+
+            # Desenha o nó (círculo)
+            fill_color = "lightgreen" if index == selected else "lightblue"
+            scene.oval(
+                ("node", index),
+                x * z - radius, y * z - radius,
+                x * z + radius, y * z + radius,
+                fill=fill_color, outline="black"
+            )
+            # Valor do nó (omitido quando o círculo fica pequeno demais)
+            if radius >= 8:
+                scene.text(
+                    ("value", index),
+                    x * z, y * z,
+                    text=str(values[index]),
+                    font=("Arial", max(1, round(12 * z)), "bold")
+                )
+    return scene
+
+def draw_collapsed(scene, tree, z, first, slot, positions, y, bottom, include_root=False):
+    """
+    Desenha triângulos de subárvore recolhida sob os nós visíveis de um nível
+
+    Parâmetros:
+        scene: Cena em construção
+        tree: engine.BinaryTree desenhada
+        z: Zoom da viewport
+        first: Primeiro índice do nível
+        slot: Largura (mundo) da fatia de cada nó do nível
+        positions: Posições (no nível) dos nós visíveis
+        y: Coordenada y (mundo) do nível
+        bottom: Coordenada y (mundo) do último nível da árvore
+        include_root: Conta o próprio nó (quando ele também não é desenhado)
+
+    Retorna:
+        Total de nós escondidos nos triângulos desenhados
+    """
+    base_y = max(bottom, y + 20)
+    total = 0
+    for position in positions:
+        index = first + position
+        hidden = tree.subtree_size(index) - (0 if include_root else 1)
+        if hidden <= 0:
+            continue
+        total += hidden
+        x = (position + 0.5) * slot
+        scene.polygon(
+            ("collapsed", index),
+            x * z, y * z,
+            (x - 0.45 * slot) * z, base_y * z,
+            (x + 0.45 * slot) * z, base_y * z,
+            fill="lightgray", outline="gray", layer=LAYER_EDGES
+        )
+    return total
+
+# ================================================================
+# ÁRVORE AVL
+# ================================================================
+
+def avltree_scene(tree, width, height, layout=None, viewport=None, selected=None):
+    """
+    Descreve a árvore AVL como cena
+
+    As posições vêm do layout organizado (render.TidyLayout). A descida a partir da raiz
+    acumula os deslocamentos dos filhos e pula as subárvores cuja extensão está fora da
+    tela; as estreitas demais para nós legíveis viram triângulos que descem até a altura
+    delas.
+
+    Parâmetros:
+        tree: engine.AVLTree
+        width, height: Dimensões da área de desenho
+        layout: TidyLayout já atualizado (padrão: calculado do zero)
+        viewport: Rolagem e zoom (padrão: vista inicial)
+        selected: Nó destacado (ou None)
+    """
+    if not tree.root:
+        return empty_scene(width, height, "Árvore Vazia")
+    if layout is None:
+        layout = TidyLayout()
+        layout.rebuild(tree.root)
+    viewport = viewport or Viewport()
+    node_radius = 20
+    vertical_spacing = 80
+
+    # Centraliza a árvore se ela couber na área; senão, centraliza a raiz
+    extent = layout[tree.root]
+    if extent.max_x - extent.min_x <= width - 2 * node_radius:
+        root_x = width / 2 - (extent.min_x + extent.max_x) / 2
+    else:
+        root_x = width / 2
+
+    z = viewport.zoom
+    scene = Scene(origin=viewport.to_screen())
+    x0, y0, x1, y1 = viewport.visible_rect(width, height, margin=node_radius * z)
+    value_font = ("Arial", max(1, round(12 * z)), "bold")
+    height_font = ("Arial", max(1, round(8 * z)))
+    radius = node_radius * z
+
+    # Percorre com pilha explícita: (nó, nível, x)
+    stack = [(tree.root, 0, root_x)]
+    hidden = 0
+    while stack:
+        node, level, x = stack.pop()
+        extent = layout[node]
+        y = 50 + level * vertical_spacing
+        bottom = y + (node.height - 1) * vertical_spacing
+
+        if (x + extent.max_x < x0 or x + extent.min_x > x1
+                or y - node_radius > y1 or bottom + node_radius < y0):
+            continue  # Subárvore inteira fora da tela
+
+        if (extent.max_x - extent.min_x) * z < MIN_ITEM_PIXELS and (node.left or node.right):
+            # Subárvore densa demais: triângulo recolhido com a profundidade da subárvore
+            scene.polygon(
+                ("collapsed", node),
+                x * z, y * z,
+                (x + extent.min_x) * z, bottom * z,
+                (x + extent.max_x) * z, bottom * z,
+                fill="lightgray", outline="gray", layer=LAYER_EDGES
+            )
+            hidden += node.size  # Tamanho da subárvore guardado no nó (com as cópias)
+            continue
+
+        # Arestas até os filhos (identificadas pelo nó filho)
+        for child, offset in ((node.left, extent.left_offset), (node.right, extent.right_offset)):
+            if child:
+                scene.line(
+                    ("edge", child),
+                    x * z, y * z,
+                    (x + offset) * z, (y + vertical_spacing) * z,
+                    fill="blue", width=2
+                )
+                stack.append((child, level + 1, x + offset))
+
+        if y < y0 or x < x0 or x > x1:
+            continue  # O nó está fora da tela, mas a subárvore pode aparecer
+
+        # Círculo do nó (destacado se selecionado pela busca)
+        fill_color = "lightgreen" if node is selected else "lightblue"
+        scene.oval(
+            ("node", node),
+            x * z - radius, y * z - radius,
+            x * z + radius, y * z + radius,
+            fill=fill_color, outline="black", width=2
+        )
+
+        # Valor e altura do nó (omitidos quando o círculo fica pequeno demais)
+        if radius >= 8:
+            scene.text(
+                ("value", node),
+                x * z, y * z,
+                text=str(node.value),
+                font=value_font,
+                fill="black"
+            )
+        if radius >= 14:
+            scene.text(
+                ("height", node),
+                x * z, y * z + radius + 10,
+                # Contagem do nó no modo multiconjunto (valor repetido)
+                text=f"h={node.height}" if node.count == 1 else f"h={node.height} ×{node.count}",
+                font=height_font,
+                fill="darkgreen"
+            )
+
+    # Total de nós escondidos nos triângulos visíveis (fixo no canto da tela)
+    if hidden:
+        scene.text(
+            "collapsed_count",
+            *scene.screen(10, height - 12),
+            # No modo multiconjunto, size conta as cópias de cada valor, não os nós
+            text=f"… {format_count(hidden)} "
+                 f"{'valores' if tree.multiset else 'nós'} recolhidos",
+            anchor="w", font=("Arial", 9), fill="gray30"
+        )
+    return scene
+
+# ================================================================
+# TABELA HASH
+# ================================================================
+
+def hashtable_scene(table, width, height, selected_bucket=None, selected_item=None, viewport=None):
+    """
+    Descreve a tabela hash (buckets ou slots) e o rodapé com as estatísticas como cena
+
+    Somente os buckets (ou slots) que cruzam a área visível são desenhados; os demais são
+    resumidos num glifo "… N buckets / M itens". Com zoom muito reduzido a tabela inteira
+    vira um único bloco com as contagens.
+
+    Parâmetros:
+        table: engine.HashTable ou engine.OpenHashTable
+        width, height: Dimensões da área de desenho
+        selected_bucket: Bucket (ou slot) destacado
+        selected_item: Índice do item destacado dentro do bucket
+        viewport: Rolagem e zoom (padrão: vista inicial)
+    """
+    viewport = viewport or Viewport()
+
+    # A tabela só é lida: um rehash incremental pendente continua pendente
+    if isinstance(table, engine.OpenHashTable):
+        scene = draw_slots(table, width, height, viewport, selected_bucket)
+    else:
+        scene = draw_buckets(table, width, height, viewport, selected_bucket, selected_item)
+
+    # Rodapé com informações da tabela (fixo na tela)
+    stats = table.stats()
+    footer = (f"Capacidade: {stats['capacity']} | Itens: {stats['size']} | "
+              f"Carga: {stats['load_factor']:.2f} | Redimensionamentos: {stats['resizes']}")
+    if stats["rehashing"]:
+        footer += " | Rehash em andamento"
+    scene.text(
+        "footer",
+        *scene.screen(width/2, height - 20),
+        text=footer,
+        font=("Arial", 10)
+    )
+    return scene
+
+def draw_hidden(scene, width, kind, hidden_cells, hidden_items):
+    """Desenha o glifo (fixo no topo da tela) com o que ficou fora da área visível"""
+    if hidden_cells or hidden_items:
+        scene.text(
+            "hidden",
+            *scene.screen(width - 8, 12),
+            text=f"… {format_count(hidden_cells)} {kind} / {format_count(hidden_items)} itens",
+            anchor="e", font=("Arial", 9), fill="gray30"
+        )
+
+def pending_entries(table, first=0, last=None):
+    """
+    Agrupa pelo bucket de destino os itens ainda na tabela antiga de um rehash incremental
+
+    Só lê os buckets antigos (como HashTable.items), sem migrar nada. Como a capacidade
+    dobra ou cai pela metade, cada bucket atual recebe itens de poucos buckets antigos
+    conhecidos; assim apenas os que abastecem o intervalo [first, last) são lidos.
+
+    Retorna:
+        Dicionário índice do bucket atual -> lista de (hash, chave, valor)
+    """
+    pending = {}
+    if not table.is_rehashing():
+        return pending
+    capacity, old_capacity = table.capacity, table.old_capacity
+    last = capacity if last is None else last
+    if capacity % old_capacity == 0:
+        sources = {i % old_capacity for i in range(first, last)}
+    elif old_capacity % capacity == 0:
+        sources = {j for i in range(first, last) for j in range(i, old_capacity, capacity)}
+    else:
+        sources = range(old_capacity)
+    for index in sorted(sources):
+        if index >= table.rehash_index:
+            for entry in table.old_table[index]:
+                target = entry[0] % capacity
+                if first <= target < last:
+                    pending.setdefault(target, []).append(entry)
+    return pending
+
+def draw_buckets(table, width, height, viewport, selected_bucket=None, selected_item=None):
+    """
+    Descreve os buckets da tabela com encadeamento e os itens de cada um
+
+    Os buckets têm largura mínima (MIN_BUCKET_WIDTH): numa tabela larga demais para o
+    canvas, a fileira começa na borda esquerda e o restante é alcançado pela rolagem.
+    """
+    # Configurações de desenho (em coordenadas de mundo, sem zoom)
+    capacity = table.capacity
+    bucket_width = max(MIN_BUCKET_WIDTH, min(100, width // (capacity + 1)))
+    bucket_height = 80
+    step = bucket_width + 10
+    total_width = capacity * step - 10
+    start_x = max(10, (width - capacity * step) / 2)
+    start_y = 50
+    item_step = 25
+    z = viewport.zoom
+    scene = Scene(origin=viewport.to_screen(start_x, 0))
+    visible_left, visible_top, visible_right, visible_bottom = viewport.visible_rect(width, height)
+
+    if bucket_width * z < MIN_ITEM_PIXELS:
+        # Nível de detalhe reduzido: um bloco único no lugar dos buckets
+        block_left = max(visible_left - start_x, 0)
+        block_right = min(visible_right - start_x, total_width)
+        if block_left < block_right:
+            scene.rectangle(
+                "aggregate",
+                block_left * z, start_y * z,
+                block_right * z, (start_y + bucket_height) * z,
+                fill="lightgray", outline="black", width=1
+            )
+        scene.text(
+            "aggregate_label",
+            *scene.screen(width/2, (start_y + bucket_height) * z - viewport.scroll_y + 15),
+            text=f"{format_count(capacity)} buckets / {format_count(len(table))} itens",
+            font=("Arial", 10, "bold")
+        )
+        return scene
+
+    # Intervalo [first, last) de buckets e [first_item, last_item) de itens que cruzam a tela
+    first = min(capacity, max(0, math.ceil((visible_left - start_x - bucket_width) / step)))
+    last = min(capacity, max(first, math.floor((visible_right - start_x) / step) + 1))
+    item_top = start_y + 10
+    first_item = max(0, math.ceil((visible_top - item_top - 20) / item_step))
+    last_item = max(first_item, math.floor((visible_bottom - item_top) / item_step) + 1)
+    show_text = bucket_width * z >= 16
+    label_font = ("Arial", max(1, round(10 * z)))
+    item_font = ("Arial", max(1, round(min(9, bucket_width//12) * z)))  # Tamanho adaptativo
+    empty_font = ("Arial", max(1, round(24 * z)))
+    pending = pending_entries(table, first, last)  # Itens que o rehash ainda vai trazer
+    drawn_items = 0
+
+    # A fileira de buckets (com os rótulos acima) pode ter saído da tela pela rolagem vertical
+    row_visible = visible_top <= start_y + bucket_height and visible_bottom >= start_y - 25
+    drawn_buckets = last - first if row_visible else 0
+
+    # Desenha cada bucket visível
+    for i in range(first, last):
+        x = i * step * z  # Posição horizontal
+        y = start_y * z
+
+        if row_visible:
+            # Cor do bucket: destaque se selecionado
+            bucket_color = "lightgreen" if i == selected_bucket else "lightgray"
+            scene.rectangle(
+                ("bucket", i),
+                x, y,
+                x + bucket_width * z, y + bucket_height * z,
+                fill=bucket_color, outline="black", width=2
+            )
+
+            # Rótulo do bucket
+            if show_text:
+                scene.text(
+                    ("bucket_label", i),
+                    x + bucket_width/2 * z, y - 15 * z,
+                    text=f"Bucket {i}", font=label_font
+                )
+
+        # Desenha os itens visíveis do bucket (os ainda não migrados vêm depois, em outra cor)
+        entries = table.table[i] + pending.get(i, [])
+        migrated = len(table.table[i])
+        for j in range(first_item, min(last_item, len(entries))):
+            _, key, value = entries[j]
+            item_y = (item_top + j * item_step) * z
+
+            # Cor do item: destaque se selecionado
+            if i == selected_bucket and j == selected_item:
+                item_color = "gold"
+            else:
+                item_color = "lightblue" if j < migrated else "lightyellow"
+
+            # Retângulo do item
+            scene.rectangle(
+                ("item", i, j),
+                x + 5 * z, item_y,
+                x + (bucket_width - 5) * z, item_y + 20 * z,
+                fill=item_color, outline="black", width=1, layer=LAYER_INNER
+            )
+
+            # Texto do item (chave:valor)
+            if show_text:
+                scene.text(
+                    ("item_text", i, j),
+                    x + bucket_width/2 * z, item_y + 10 * z,
+                    text=f"{key}:{value}",
+                    font=item_font
+                )
+            drawn_items += 1
+
+        # Símbolo para bucket vazio
+        if not entries and show_text and row_visible:
+            scene.text(
+                ("bucket_empty", i),
+                x + bucket_width/2 * z, y + bucket_height/2 * z,
+                text="∅",  # Símbolo de conjunto vazio
+                font=empty_font,
+                fill="gray"
+            )
+
+    # Buckets e itens fora da tela resumidos num único glifo
+    draw_hidden(scene, width, "buckets", capacity - drawn_buckets, len(table) - drawn_items)
+    return scene
+
+def draw_slots(table, width, height, viewport, selected_slot=None):
+    """
+    Descreve a ocupação dos slots da tabela com endereçamento aberto
+
+    A grade quebra as linhas conforme a largura do canvas; as linhas abaixo da tela são
+    alcançadas pela rolagem e só as células visíveis são desenhadas.
+    """
+    # Configurações de desenho (grade de células, em coordenadas de mundo)
+    capacity = table.capacity
+    cell_width = 90
+    cell_height = 40
+    spacing = 6
+    step_x = cell_width + spacing
+    step_y = cell_height + spacing
+    columns = max(1, (width - 20) // step_x)
+    rows = -(-capacity // columns)
+    start_x = (width - columns * step_x + spacing) / 2
+    start_y = 30
+    z = viewport.zoom
+    scene = Scene(origin=viewport.to_screen(start_x, start_y))
+    visible_left, visible_top, visible_right, visible_bottom = viewport.visible_rect(width, height)
+
+    if cell_width * z < MIN_ITEM_PIXELS:
+        # Nível de detalhe reduzido: um bloco único no lugar da grade
+        block_left = max(visible_left - start_x, 0)
+        block_right = min(visible_right - start_x, columns * step_x - spacing)
+        block_top = max(visible_top - start_y, 0)
+        block_bottom = min(visible_bottom - start_y, rows * step_y - spacing)
+        if block_left < block_right and block_top < block_bottom:
+            scene.rectangle(
+                "aggregate",
+                block_left * z, block_top * z,
+                block_right * z, block_bottom * z,
+                fill="lightgray", outline="black", width=1
+            )
+        scene.text(
+            "aggregate_label",
+            *scene.screen(width/2, 12),
+            text=f"{format_count(capacity)} slots / {format_count(len(table))} itens",
+            font=("Arial", 10, "bold")
+        )
+        return scene
+
+    # Faixas [first_row, last_row) e [first_column, last_column) que cruzam a tela
+    first_row = min(rows, max(0, math.ceil((visible_top - start_y - cell_height) / step_y)))
+    last_row = min(rows, max(first_row, math.floor((visible_bottom - start_y) / step_y) + 1))
+    first_column = min(columns, max(0, math.ceil((visible_left - start_x - cell_width) / step_x)))
+    last_column = min(columns, max(first_column, math.floor((visible_right - start_x) / step_x) + 1))
+    show_text = cell_width * z >= 30
+    index_font = ("Arial", max(1, round(7 * z)))
+    item_font = ("Arial", max(1, round(8 * z)))
+    empty_font = ("Arial", max(1, round(14 * z)))
+    drawn_slots = 0
+    drawn_items = 0
+
+    for row in range(first_row, last_row):
+        for column in range(first_column, last_column):
+            slot = row * columns + column
+            if slot >= capacity:
+                break
+            x = column * step_x * z
+            y = row * step_y * z
+            occupied = table.hashes[slot] != 0
+            drawn_slots += 1
+            drawn_items += occupied
+
+            # Cor do slot: vazio, ocupado ou selecionado (busca)
+            if slot == selected_slot:
+                slot_color = "gold"
+            else:
+                slot_color = "lightblue" if occupied else "lightgray"
+            scene.rectangle(
+                ("slot", slot),
+                x, y,
+                x + cell_width * z, y + cell_height * z,
+                fill=slot_color, outline="black", width=1
+            )
+            if not show_text:
+                continue
+
+            # Índice do slot
+            scene.text(
+                ("slot_index", slot),
+                x + 4 * z, y + 2 * z, anchor="nw",
+                text=str(slot), font=index_font, fill="gray30"
+            )
+
+            if occupied:
+                # Item (chave:valor) e distância até o slot ideal
+                scene.text(
+                    ("slot_item", slot),
+                    x + cell_width/2 * z, y + cell_height/2 * z,
+                    text=f"{table.keys[slot]}:{table.values[slot]}",
+                    font=item_font
+                )
+                scene.text(
+                    ("slot_distance", slot),
+                    x + (cell_width - 4) * z, y + (cell_height - 2) * z, anchor="se",
+                    text=f"d={table.probe_distance(slot)}",
+                    font=index_font, fill="darkgreen"
+                )
+            else:
+                scene.text(
+                    ("slot_empty", slot),
+                    x + cell_width/2 * z, y + cell_height/2 * z,
+                    text="∅", font=empty_font, fill="gray"
+                )
+
+    # Slots e itens fora da tela resumidos num único glifo
+    draw_hidden(scene, width, "slots", capacity - drawn_slots, len(table) - drawn_items)
+    return scene
+
+# ================================================================
+# ESCOLHA PELO TIPO
+# ================================================================
+
+def structure_scene(structure, width, height):
+    """
+    Descreve qualquer estrutura suportada como cena (vista inicial, sem seleção)
+
+    Parâmetros:
+        structure: engine.AVLTree, engine.BinaryTree, engine.HashTable ou engine.OpenHashTable
+        width, height: Dimensões da área de desenho
+    """
+    if isinstance(structure, engine.AVLTree):
+        return avltree_scene(structure, width, height)
+    if isinstance(structure, engine.BinaryTree):
+        return binarytree_scene(structure, width, height)
+    if isinstance(structure, (engine.HashTable, engine.OpenHashTable)):
+        return hashtable_scene(structure, width, height)
+    raise TypeError(f"Estrutura sem desenho disponível: {type(structure).__name__}")
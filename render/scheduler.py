@@ -0,0 +1,87 @@
+"""
+Agendamento de Redesenhos
+
+Descrição:
+Redimensionar a janela dispara dezenas de eventos <Configure> por segundo, e cada operação
+da interface também pede um redesenho. Em vez de redesenhar a cada pedido, as abas chamam
+RedrawScheduler.request(): pedidos feitos antes do próximo quadro são agrupados e o desenho
+acontece uma única vez, quando o Tkinter fica ocioso (after_idle), respeitando um intervalo
+mínimo entre quadros (after).
+
+Abas escondidas do ttk.Notebook não redesenham: o pedido fica marcado como pendente e é
+atendido quando a aba volta a ser exibida (evento <Map> do frame da aba).
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+import time
+
+FRAME_MS = 16  # Intervalo mínimo entre dois redesenhos (~60 quadros por segundo)
+
+class RedrawScheduler:
+    """
+    Agrupa pedidos de redesenho de uma aba em no máximo um desenho por quadro
+
+    Atributos:
+        widget: Widget usado para agendar (after/after_idle), normalmente o canvas
+        draw: Função que desenha a aba (sem argumentos)
+        page: Widget cuja visibilidade decide se vale a pena desenhar (o frame da aba)
+        pending: Id do agendamento em andamento (None se não houver)
+        dirty: Indica que há um pedido de redesenho ainda não atendido
+        last_draw: Instante (time.perf_counter) do último desenho
+    """
+
+    def __init__(self, widget, draw, page=None):
+        """
+        Inicializa o agendador
+
+        Parâmetros:
+            widget: Widget usado para agendar os desenhos
+            draw: Função que desenha a aba
+            page: Frame da aba no notebook (padrão: o próprio widget)
+        """
+        self.widget = widget
+        self.draw = draw
+        self.page = page if page is not None else widget
+        self.pending = None
+        self.dirty = False
+        self.last_draw = 0.0
+        # Atende o pedido guardado quando a aba volta a aparecer
+        self.page.bind("<Map>", self.on_map, add="+")
+
+    def request(self, event=None):
+        """Pede um redesenho (vários pedidos no mesmo quadro viram um só desenho)"""
+        self.dirty = True
+        if self.pending is not None:
+            return
+        delay = FRAME_MS - (time.perf_counter() - self.last_draw) * 1000
+        if delay > 0:
+            self.pending = self.widget.after(int(delay) + 1, self.flush)
+        else:
+            self.pending = self.widget.after_idle(self.flush)
+
+    def flush(self):
+        """Executa o redesenho pedido (se a aba estiver visível)"""
+        self.pending = None
+        if not self.dirty or not self.is_visible():
+            return  # Aba escondida: o pedido fica guardado para o <Map>
+        self.dirty = False
+        self.last_draw = time.perf_counter()
+        self.draw()
+
+    def is_visible(self):
+        """Verifica se a aba está sendo exibida (ela e todos os seus ancestrais mapeados)"""
+        return bool(self.page.winfo_viewable())
+
+    def on_map(self, event):
+        """Redesenha a aba exibida se ela recebeu pedidos enquanto estava escondida"""
+        if self.dirty:
+            self.request()
+
+    def cancel(self):
+        """Cancela o redesenho agendado"""
+        if self.pending is not None:
+            self.widget.after_cancel(self.pending)
+            self.pending = None
+        self.dirty = False
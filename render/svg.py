@@ -0,0 +1,187 @@
+"""
+Gravação de Cenas em SVG (sem Tkinter e sem display)
+
+Descrição:
+Converte uma Scene (render.retained) em um documento SVG equivalente ao que o canvas do
+Tkinter exibiria. Os tipos de item e as opções usadas pelas visualizações são traduzidos
+para os atributos SVG correspondentes:
+
+- line: fill (cor da linha), width, dash, arrow ("first", "last" ou "both")
+- oval, rectangle: fill, outline, width, dash
+- polygon: fill (padrão preto, como no Tk), outline, width
+- text: text, fill, font (família, tamanho em pontos e estilo), anchor
+
+Os itens são gravados na ordem de desenho (Scene.ordered), respeitando as camadas.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+# Âncoras de texto do Tk -> (text-anchor, dominant-baseline) do SVG
+TEXT_ANCHORS = {
+    "center": ("middle", "central"),
+    "n": ("middle", "hanging"),
+    "s": ("middle", "text-after-edge"),
+    "e": ("end", "central"),
+    "w": ("start", "central"),
+    "ne": ("end", "hanging"),
+    "nw": ("start", "hanging"),
+    "se": ("end", "text-after-edge"),
+    "sw": ("start", "text-after-edge"),
+}
+
+# Opções padrão do Tk para cada tipo de item
+DEFAULT_OPTIONS = {
+    "line": {"fill": "black", "width": 1},
+    "oval": {"fill": "", "outline": "black", "width": 1},
+    "rectangle": {"fill": "", "outline": "black", "width": 1},
+    "polygon": {"fill": "black", "outline": "", "width": 1},
+    "text": {"fill": "black", "anchor": "center", "font": ("TkDefaultFont", 10)},
+}
+
+GRAY_PATTERN = re.compile(r"gr[ae]y(\d{1,3})")
+
+def svg_color(color):
+    """
+    Converte uma cor do Tk para SVG ("" vira "none")
+
+    Os nomes de cor do Tk coincidem com os do CSS, exceto os tons numerados de cinza
+    (gray0 a gray100), convertidos para #rrggbb.
+    """
+    if not color:
+        return "none"
+    match = GRAY_PATTERN.fullmatch(color)
+    if match:
+        level = round(min(100, int(match.group(1))) * 255 / 100)
+        return f"#{level:02x}{level:02x}{level:02x}"
+    return color
+
+def font_attributes(font):
+    """Converte uma fonte do Tk (família, tamanho, estilos...) em atributos SVG"""
+    if isinstance(font, str):
+        font = font.split()
+    family = font[0] if font else "TkDefaultFont"
+    size = int(font[1]) if len(font) > 1 else 10
+    styles = font[2:]
+    attributes = {
+        "font-family": "sans-serif" if family.startswith("Tk") else f"{family}, sans-serif",
+        # Tamanhos positivos do Tk são pontos; negativos, pixels
+        "font-size": f"{size}pt" if size >= 0 else f"{-size}px",
+    }
+    if "bold" in styles:
+        attributes["font-weight"] = "bold"
+    if "italic" in styles:
+        attributes["font-style"] = "italic"
+    return attributes
+
+def format_attributes(attributes):
+    """Formata um dicionário de atributos (None é omitido)"""
+    return " ".join(f"{name}={quoteattr(str(value))}" for name, value in attributes.items()
+                    if value is not None)
+
+def format_number(value):
+    """Formata uma coordenada com no máximo duas casas decimais"""
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+def stroke_attributes(options, color_option):
+    """Atributos de contorno (cor, espessura, tracejado)"""
+    color = svg_color(options[color_option])
+    dash = options.get("dash")
+    return {
+        "stroke": color,
+        "stroke-width": format_number(options["width"]) if color != "none" else None,
+        "stroke-dasharray": " ".join(str(part) for part in dash) if dash else None,
+    }
+
+def scene_to_svg(scene, width, height, background="white"):
+    """
+    Converte uma cena em um documento SVG
+
+    Parâmetros:
+        scene: Scene a converter
+        width, height: Dimensões da imagem (o equivalente ao tamanho do canvas)
+        background: Cor de fundo (None para transparente)
+
+    Retorna:
+        Texto do documento SVG
+    """
+    ox, oy = scene.origin
+    body = []
+    markers = {}
+
+    if background:
+        body.append(f'<rect width="100%" height="100%" fill={quoteattr(svg_color(background))}/>')
+
+    for _, (kind, coords, options, _) in scene.ordered():
+        options = {**DEFAULT_OPTIONS[kind], **options}
+        xs = [format_number(value + ox) for value in coords[0::2]]
+        ys = [format_number(value + oy) for value in coords[1::2]]
+        points = " ".join(f"{x},{y}" for x, y in zip(xs, ys))
+
+        if kind == "line":
+            attributes = {"points": points, "fill": "none", **stroke_attributes(options, "fill")}
+            arrow = options.get("arrow")
+            if arrow in ("first", "last", "both"):
+                marker = markers.setdefault(attributes["stroke"], f"arrow{len(markers)}")
+                if arrow in ("last", "both"):
+                    attributes["marker-end"] = f"url(#{marker})"
+                if arrow in ("first", "both"):
+                    attributes["marker-start"] = f"url(#{marker})"
+            body.append(f"<polyline {format_attributes(attributes)}/>")
+        elif kind == "oval":
+            x0, y0, x1, y1 = (coords[0] + ox, coords[1] + oy, coords[2] + ox, coords[3] + oy)
+            attributes = {
+                "cx": format_number((x0 + x1) / 2), "cy": format_number((y0 + y1) / 2),
+                "rx": format_number(abs(x1 - x0) / 2), "ry": format_number(abs(y1 - y0) / 2),
+                "fill": svg_color(options["fill"]), **stroke_attributes(options, "outline"),
+            }
+            body.append(f"<ellipse {format_attributes(attributes)}/>")
+        elif kind == "rectangle":
+            x0, x1 = sorted((coords[0] + ox, coords[2] + ox))
+            y0, y1 = sorted((coords[1] + oy, coords[3] + oy))
+            attributes = {
+                "x": format_number(x0), "y": format_number(y0),
+                "width": format_number(x1 - x0), "height": format_number(y1 - y0),
+                "fill": svg_color(options["fill"]), **stroke_attributes(options, "outline"),
+            }
+            body.append(f"<rect {format_attributes(attributes)}/>")
+        elif kind == "polygon":
+            attributes = {"points": points, "fill": svg_color(options["fill"]),
+                          **stroke_attributes(options, "outline")}
+            body.append(f"<polygon {format_attributes(attributes)}/>")
+        elif kind == "text":
+            text_anchor, baseline = TEXT_ANCHORS.get(options["anchor"], TEXT_ANCHORS["center"])
+            attributes = {
+                "x": xs[0], "y": ys[0], "fill": svg_color(options["fill"]),
+                "text-anchor": text_anchor, "dominant-baseline": baseline,
+                **font_attributes(options["font"]),
+            }
+            body.append(f"<text {format_attributes(attributes)}>"
+                        f"{escape(str(options.get('text', '')))}</text>")
+
+    # Pontas de seta (uma por cor de linha usada)
+    defs = [
+        f'<marker id="{marker}" viewBox="0 0 10 10" refX="9" refY="5" markerWidth="6" '
+        f'markerHeight="6" orient="auto-start-reverse">'
+        f'<path d="M0,0 L10,5 L0,10 z" fill={quoteattr(color)}/></marker>'
+        for color, marker in markers.items()
+    ]
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">',
+    ]
+    if defs:
+        lines.append("<defs>" + "".join(defs) + "</defs>")
+    lines.extend(body)
+    lines.append("</svg>")
+    return "\n".join(lines) + "\n"
+
+def write_svg(scene, path, width, height, background="white"):
+    """Grava a cena como arquivo SVG (veja scene_to_svg)"""
+    with open(path, "w", encoding="utf-8") as output:
+        output.write(scene_to_svg(scene, width, height, background))
@@ -0,0 +1,142 @@
+"""
+Janela de Visualização (Viewport) com Rolagem e Zoom
+
+Descrição:
+As visualizações calculam o desenho em coordenadas de "mundo" (as mesmas do layout sem
+zoom) e a Viewport converte para a tela: tela = mundo * zoom - rolagem. Com isso cada aba
+consegue descobrir, antes de desenhar, qual parte da estrutura está visível e gerar apenas
+os itens que cruzam a tela, resumindo o restante em glifos agregados ("… 48.211 mais",
+triângulos de subárvore recolhida). O custo de redesenho passa a acompanhar o que aparece
+na tela, e não o tamanho total da estrutura.
+
+Controles (ligados por attach):
+- Roda do mouse: rolagem vertical (Shift + roda: horizontal)
+- Ctrl + roda: zoom centrado no cursor
+- Arrastar com o botão esquerdo: move a visualização
+- Duplo clique: volta à posição e ao zoom iniciais
+
+Observação:
+A rolagem é aplicada como origem da cena (render.Scene), portanto rolar sem mudar o zoom
+custa um único canvas.move mais a criação dos itens que entraram na tela.
+
+Autor: Agostinho Ferreira (little_agosto)
+Data da última atualização: 16/10/2026
+"""
+
+MIN_ZOOM = 0.05
+MAX_ZOOM = 4.0
+ZOOM_STEP = 1.2       # Fator de zoom por passo da roda do mouse
+SCROLL_STEP = 60      # Pixels rolados por passo da roda do mouse
+MIN_ITEM_PIXELS = 6   # Abaixo deste tamanho na tela os itens são agregados em glifos
+
+def format_count(count):
+    """Formata uma contagem com separador de milhar (ex.: 48.211)"""
+    return f"{count:,}".replace(",", ".")
+
+class Viewport:
+    """
+    Estado de rolagem e zoom de um canvas
+
+    Atributos:
+        scroll_x, scroll_y: Rolagem em pixels de tela
+        zoom: Fator de escala entre mundo e tela
+        drag_start: Último ponto do arraste em andamento (None fora de um arraste)
+    """
+
+    def __init__(self):
+        """Inicializa a viewport sem rolagem e sem zoom"""
+        self.scroll_x = 0.0
+        self.scroll_y = 0.0
+        self.zoom = 1.0
+        self.drag_start = None
+
+    def to_screen(self, x=0.0, y=0.0):
+        """
+        Converte um ponto de mundo para a tela
+
+        Usado também como origem da cena: com a origem em to_screen(ref), os itens usam
+        coordenadas (mundo - ref) * zoom, e rolar a vista só desloca a origem.
+        """
+        return (x * self.zoom - self.scroll_x, y * self.zoom - self.scroll_y)
+
+    def visible_rect(self, width, height, margin=0.0):
+        """
+        Retorna o retângulo de mundo (x0, y0, x1, y1) visível num canvas width x height
+
+        Parâmetros:
+            margin: Folga em pixels de tela acrescentada em cada lado
+        """
+        zoom = self.zoom
+        return ((self.scroll_x - margin) / zoom, (self.scroll_y - margin) / zoom,
+                (self.scroll_x + width + margin) / zoom, (self.scroll_y + height + margin) / zoom)
+
+    def scroll(self, dx, dy):
+        """Rola a visualização (em pixels de tela)"""
+        self.scroll_x += dx
+        self.scroll_y += dy
+
+    def zoom_at(self, factor, x, y):
+        """Aplica um fator de zoom mantendo fixo o ponto de tela (x, y)"""
+        new_zoom = min(MAX_ZOOM, max(MIN_ZOOM, self.zoom * factor))
+        # Ponto de mundo sob o cursor permanece sob o cursor
+        world_x = (x + self.scroll_x) / self.zoom
+        world_y = (y + self.scroll_y) / self.zoom
+        self.zoom = new_zoom
+        self.scroll_x = world_x * new_zoom - x
+        self.scroll_y = world_y * new_zoom - y
+
+    def reset(self):
+        """Volta à posição e ao zoom iniciais"""
+        self.scroll_x = 0.0
+        self.scroll_y = 0.0
+        self.zoom = 1.0
+
+    # ================================================================
+    # EVENTOS DO CANVAS
+    # ================================================================
+
+    def attach(self, canvas, on_change):
+        """
+        Liga os eventos de rolagem, zoom e arraste do canvas à viewport
+
+        Parâmetros:
+            canvas: Canvas cujos eventos serão tratados
+            on_change: Função chamada (sem argumentos) após cada mudança de vista
+        """
+        def wheel(event, horizontal=False, zoom=False):
+            # Windows/macOS informam delta; X11 usa os botões 4 (cima) e 5 (baixo)
+            direction = 1 if (getattr(event, "delta", 0) > 0 or getattr(event, "num", 0) == 4) else -1
+            if zoom:
+                self.zoom_at(ZOOM_STEP if direction > 0 else 1 / ZOOM_STEP, event.x, event.y)
+            elif horizontal:
+                self.scroll(-direction * SCROLL_STEP, 0)
+            else:
+                self.scroll(0, -direction * SCROLL_STEP)
+            on_change()
+
+        def press(event):
+            self.drag_start = (event.x, event.y)
+
+        def drag(event):
+            if self.drag_start is None:
+                return
+            self.scroll(self.drag_start[0] - event.x, self.drag_start[1] - event.y)
+            self.drag_start = (event.x, event.y)
+            on_change()
+
+        def reset(event):
+            self.reset()
+            on_change()
+
+        canvas.bind("<MouseWheel>", wheel)
+        canvas.bind("<Shift-MouseWheel>", lambda event: wheel(event, horizontal=True))
+        canvas.bind("<Control-MouseWheel>", lambda event: wheel(event, zoom=True))
+        canvas.bind("<Button-4>", wheel)
+        canvas.bind("<Button-5>", wheel)
+        canvas.bind("<Shift-Button-4>", lambda event: wheel(event, horizontal=True))
+        canvas.bind("<Shift-Button-5>", lambda event: wheel(event, horizontal=True))
+        canvas.bind("<Control-Button-4>", lambda event: wheel(event, zoom=True))
+        canvas.bind("<Control-Button-5>", lambda event: wheel(event, zoom=True))
+        canvas.bind("<ButtonPress-1>", press)
+        canvas.bind("<B1-Motion>", drag)
+        canvas.bind("<Double-Button-1>", reset)
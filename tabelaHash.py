@@ -2,16 +2,20 @@
 Implementação de Tabela Hash com Visualização Gráfica
 
 Descrição:
-Esta classe implementa uma tabela hash com tratamento de colisões por encadeamento,
-com interface gráfica usando Tkinter. Permite inserir, buscar e remover itens, além de
+Esta classe implementa uma tabela hash com tratamento de colisões por encadeamento
+(ou, opcionalmente, por endereçamento aberto), com interface gráfica usando Tkinter. Permite inserir, buscar e remover itens, além de
 visualizar a estrutura completa da tabela hash.
 
 Componentes Principais:
-1. Estrutura de dados: Lista de listas para armazenar os buckets
-2. Função hash: Utiliza SHA-256 para distribuição uniforme
+1. Estrutura de dados: engine.HashTable (núcleo sem interface gráfica)
+2. Função hash: Estratégia plugável do núcleo (hash nativo por padrão)
 3. Interface gráfica com visualização dos buckets e itens
 4. Destaque visual para operações de busca
-5. Informações de capacidade e carga
+5. Informações de capacidade, fator de carga e redimensionamentos
+6. Alternância para o núcleo com endereçamento aberto (engine.OpenHashTable), exibindo a
+   ocupação de cada slot e a distância de sondagem dos itens
+7. Desenho incremental (render.RetainedCanvas): cada operação só toca os itens afetados
+8. Rolagem e zoom, desenhando apenas os buckets visíveis (glifo para os demais)
 
 Autor: Agostinho Ferreira (little_agosto)
 Data da última atualização: 02/08/2025
@@ -19,7 +23,10 @@ Data da última atualização: 02/08/2025
 
 import tkinter as tk
 from tkinter import messagebox
-import hashlib
+import engine
+from lote import BatchDialog
+from render import RetainedCanvas, RedrawScheduler, Viewport, format_count
+from render.scenes import hashtable_scene
 
 class HashTable:
     """
@@ -27,26 +34,31 @@ class HashTable:
     
     Atributos:
         parent_frame: Frame do Tkinter onde será renderizada a tabela
-        capacity: Capacidade inicial da tabela (número de buckets)
-        table: Estrutura de dados para armazenar os itens (lista de listas)
+        table: Núcleo da tabela hash (engine.HashTable ou engine.OpenHashTable)
+        open_addressing: Variável do Tkinter que indica o núcleo com endereçamento aberto
         selected_bucket: Bucket selecionado para destaque visual
         selected_item: Índice do item selecionado para destaque visual
         canvas: Área de desenho para visualização da tabela
+        renderer: Renderizador em modo retido sobre o canvas
+        redraw: Agendador que agrupa os pedidos de redesenho
+        viewport: Rolagem e zoom do canvas
         control_frame: Área para controles (entrada e botões)
         status: Barra de status para mensagens
     """
     
-    def __init__(self, parent_frame, capacity=10):
+    def __init__(self, parent_frame, capacity=10, open_addressing=False):
         """
         Inicializa a tabela hash e a interface gráfica
         
         Parâmetros:
             parent_frame: Frame do Tkinter para conter a visualização
             capacity: Capacidade inicial da tabela hash (padrão=10)
+            open_addressing: Usa o núcleo com endereçamento aberto (padrão=False)
         """
         self.parent_frame = parent_frame
         self.capacity = capacity
-        self.table = [[] for _ in range(capacity)]  # Tabela vazia
+        self.open_addressing = tk.BooleanVar(value=open_addressing)
+        self.table = self.new_table()  # Tabela vazia
         self.selected_bucket = None   # Nenhum bucket selecionado inicialmente
         self.selected_item = None     # Nenhum item selecionado inicialmente
         
@@ -54,6 +66,11 @@ class HashTable:
         self.canvas = tk.Canvas(self.parent_frame, bg='white')
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.canvas.bind("<Configure>", self.on_resize)  # Redesenha ao redimensionar
+        self.renderer = RetainedCanvas(self.canvas)  # Mantém os itens entre desenhos
+        # Agrupa os redesenhos: no máximo um por quadro e nenhum com a aba escondida
+        self.redraw = RedrawScheduler(self.canvas, self.visualize_table, self.parent_frame)
+        self.viewport = Viewport()  # Rolagem e zoom (roda do mouse, Ctrl+roda, arraste)
+        self.viewport.attach(self.canvas, self.redraw.request)
         
         # Área de controles
         self.control_frame = tk.Frame(self.parent_frame)
@@ -68,6 +85,9 @@ class HashTable:
         tk.Button(self.control_frame, text="Buscar", command=self.search_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Remover", command=self.remove_gui).pack(side=tk.LEFT, padx=5)
         tk.Button(self.control_frame, text="Limpar", command=self.clear_table).pack(side=tk.LEFT, padx=5)
+        tk.Button(self.control_frame, text="Lote...", command=self.batch_gui).pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(self.control_frame, text="Endereçamento aberto", variable=self.open_addressing,
+                       command=self.toggle_addressing).pack(side=tk.LEFT, padx=5)
         
         # Barra de status
         self.status = tk.Label(self.parent_frame, text="Tabela Hash Vazia", 
@@ -75,27 +95,18 @@ class HashTable:
         self.status.pack(fill=tk.X)
         
         # Desenha a tabela inicial
-        self.visualize_table()
+        self.redraw.request()
 
     def on_resize(self, event):
         """Redesenha a tabela ao redimensionar o canvas"""
-        self.visualize_table()
-    
-    def hash_function(self, key):
-        """
-        Calcula o índice do bucket para uma chave usando SHA-256
-        
-        Parâmetros:
-            key: Chave a ser hasheada (string ou inteiro)
-            
-        Retorna:
-            Índice do bucket (0 a capacidade-1)
-        """
-        if isinstance(key, int):
-            key = str(key)
-        # Converte a chave para hash SHA-256 e aplica módulo pela capacidade
-        return int(hashlib.sha256(key.encode()).hexdigest(), 16) % self.capacity
+        self.redraw.request()
 
+    def new_table(self):
+        """Cria o núcleo conforme o modo selecionado (encadeamento ou endereçamento aberto)"""
+        if self.open_addressing.get():
+            return engine.OpenHashTable(self.capacity)
+        return engine.HashTable(self.capacity)
+    
     # ================================================================
     # INTERFACE GRÁFICA PARA OPERAÇÕES
     # ================================================================
@@ -107,8 +118,8 @@ class HashTable:
             if key:
                 # Valor arbitrário associado à chave
                 value = f"Valor({key})"  
-                self.insert(key, value)
-                self.visualize_table()
+                self.table.insert(key, value)
+                self.redraw.request()
                 self.status.config(text=f"Inserido: {key} → {value}")
                 self.entry.delete(0, tk.END)  # Limpa a entrada
             else:
@@ -121,18 +132,18 @@ class HashTable:
         try:
             key = self.entry.get()
             if key:
-                value, bucket_idx, item_idx = self.search(key)
+                value, bucket_idx, item_idx = self.table.search(key)
                 if value is not None:
                     # Atualiza seleção e redesenha
                     self.selected_bucket = bucket_idx
                     self.selected_item = item_idx
-                    self.visualize_table()
+                    self.redraw.request()
                     self.status.config(text=f"Encontrado: {key} → {value} (Bucket {bucket_idx})")
                 else:
                     # Remove seleção se não encontrado
                     self.selected_bucket = None
                     self.selected_item = None
-                    self.visualize_table()
+                    self.redraw.request()
                     self.status.config(text=f"Chave {key} não encontrada")
                 self.entry.delete(0, tk.END)
             else:
@@ -145,8 +156,8 @@ class HashTable:
         try:
             key = self.entry.get()
             if key:
-                if self.remove(key):
-                    self.visualize_table()
+                if self.table.remove(key):
+                    self.redraw.request()
                     self.status.config(text=f"Removido: {key}")
                 else:
                     self.status.config(text=f"Chave {key} não encontrada")
@@ -156,81 +167,63 @@ class HashTable:
         except Exception as e:
             messagebox.showerror("Erro", str(e))
     
+    def toggle_addressing(self):
+        """Troca o núcleo da tabela, preservando os itens já inseridos"""
+        old_table = self.table
+        self.table = self.new_table()
+        for key, value in old_table.items():
+            self.table.insert(key, value)
+        self.selected_bucket = None
+        self.selected_item = None
+        self.redraw.request()
+        mode = "endereçamento aberto" if self.open_addressing.get() else "encadeamento"
+        self.status.config(text=f"Modo: {mode}")
+
     def clear_table(self):
         """Limpa completamente a tabela hash"""
-        self.table = [[] for _ in range(self.capacity)]
+        self.table.clear()
         self.selected_bucket = None
         self.selected_item = None
-        self.visualize_table()
+        self.redraw.request()
         self.status.config(text="Tabela Hash limpa")
 
-    # ================================================================
-    # OPERAÇÕES DA TABELA HASH
-    # ================================================================
+    def batch_gui(self):
+        """Abre a janela de operações em lote (valores digitados, colados ou de arquivo)"""
+        BatchDialog(self.parent_frame, "Tabela Hash - Lote", ["Inserir", "Remover"], self.apply_batch)
     
-    def insert(self, key, value):
+    def apply_batch(self, operation, values):
         """
-        Insere um par chave-valor na tabela
-        
-        Parâmetros:
-            key: Chave do item
-            value: Valor associado à chave
-            
-        Observação:
-            Se a chave já existe, atualiza o valor
-        """
-        index = self.hash_function(key)
-        # Verifica se chave já existe no bucket
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                # Atualiza valor existente
-                self.table[index][i] = (key, value)
-                return
-        # Adiciona novo item no final do bucket
-        self.table[index].append((key, value))
-    
-    def search(self, key):
-        """
-        Busca uma chave na tabela
-        
-        Parâmetros:
-            key: Chave a ser buscada
-            
-        Retorna:
-            (valor, índice_bucket, índice_item) se encontrado
-            (None, -1, -1) se não encontrado
-        """
-        index = self.hash_function(key)
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                return v, index, i
-        return None, -1, -1
-    
-    def remove(self, key):
-        """
-        Remove uma chave da tabela
-        
+        Aplica um lote de chaves com um único redesenho
+
         Parâmetros:
-            key: Chave a ser removida
-            
-        Retorna:
-            True se a chave foi removida, False se não foi encontrada
+            operation: "Inserir" ou "Remover"
+            values: Chaves do lote
         """
-        index = self.hash_function(key)
-        for i, (k, v) in enumerate(self.table[index]):
-            if k == key:
-                del self.table[index][i]  # Remove o item
-                return True
-        return False
+        if operation == "Remover":
+            removed = sum(1 for key in values if self.table.remove(key))
+            message = f"Lote: {format_count(removed)} de {format_count(len(values))} removidos"
+        else:
+            for key in values:
+                self.table.insert(key, f"Valor({key})")
+            message = f"Lote: {format_count(len(values))} inseridos"
+        # Posições mudam com os redimensionamentos: descarta o destaque
+        self.selected_bucket = None
+        self.selected_item = None
+        self.redraw.request()
+        self.status.config(text=message)
 
     # ================================================================
     # VISUALIZAÇÃO GRÁFICA
     # ================================================================
     
     def visualize_table(self):
-        """Renderiza a tabela hash no canvas"""
-        self.canvas.delete("all")  # Limpa o canvas
+        """
+        Renderiza a tabela hash no canvas (apenas os itens que mudaram)
         
+        A cena é descrita por render.scenes.hashtable_scene, a mesma usada na exportação.
+        Somente os buckets (ou slots) visíveis são desenhados; os demais viram um glifo
+        "… N buckets / M itens".
+        """
         # Obtém dimensões atuais do canvas
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
@@ -240,67 +233,6 @@ class HashTable:
             canvas_width = 800
             canvas_height = 500
         
-        # Configurações de desenho
-        bucket_width = min(100, canvas_width // (self.capacity + 1))
-        bucket_height = 80
-        vertical_spacing = 20
-        start_x = (canvas_width - (self.capacity * (bucket_width + 10))) / 2
-        start_y = 50
-        
-        # Desenha cada bucket
-        for i in range(self.capacity):
-            x = start_x + i * (bucket_width + 10)  # Posição horizontal
-            y = start_y
-            
-            # Cor do bucket: destaque se selecionado
-            bucket_color = "lightgreen" if i == self.selected_bucket else "lightgray"
-            self.canvas.create_rectangle(
-                x, y,
-                x + bucket_width, y + bucket_height,
-                fill=bucket_color, outline="black", width=2
-            )
-            
-            # Rótulo do bucket
-            self.canvas.create_text(
-                x + bucket_width/2, y - 15,
-                text=f"Bucket {i}", font=("Arial", 10)
-            )
-            
-            # Desenha os itens dentro do bucket
-            item_y = y + 10
-            for j, (key, value) in enumerate(self.table[i]):
-                # Cor do item: destaque se selecionado
-                item_color = "gold" if (i == self.selected_bucket and j == self.selected_item) else "lightblue"
-                
-                # Retângulo do item
-                self.canvas.create_rectangle(
-                    x + 5, item_y,
-                    x + bucket_width - 5, item_y + 20,
-                    fill=item_color, outline="black", width=1
-                )
-                
-                # Texto do item (chave:valor)
-                self.canvas.create_text(
-                    x + bucket_width/2, item_y + 10,
-                    text=f"{key}:{value}", 
-                    font=("Arial", min(9, bucket_width//12))  # Tamanho adaptativo
-                )
-                
-                item_y += 25  # Espaçamento vertical entre itens
-            
-            # Símbolo para bucket vazio
-            if not self.table[i]:
-                self.canvas.create_text(
-                    x + bucket_width/2, y + bucket_height/2,
-                    text="∅",  # Símbolo de conjunto vazio
-                    font=("Arial", 24), 
-                    fill="gray"
-                )
-        
-        # Rodapé com informações da tabela
-        total_items = sum(len(b) for b in self.table)
-        self.canvas.create_text(
-            canvas_width/2, canvas_height - 20,
-            text=f"Capacidade: {self.capacity} | Itens: {total_items}",
-            font=("Arial", 10)
-        )
\ No newline at end of file
+        scene = hashtable_scene(self.table, canvas_width, canvas_height,
+                                self.selected_bucket, self.selected_item, self.viewport)
+        self.renderer.render(scene)
\ No newline at end of file